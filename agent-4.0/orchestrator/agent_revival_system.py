@@ -29,12 +29,20 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from multi_agent_system import MultiAgentSystem, AgentStatus, SkillLevel, Agent
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'core-systems'))
+from metrics_exporter import counter, gauge, histogram, start_metrics_server
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger('AgentRevival')
 
+TASKS_FINISHED = counter('agent_tasks_finished_total', 'Tasks finished by outcome', ['category', 'outcome'])
+TASK_SECONDS = histogram('agent_task_duration_seconds', 'Task execution time', ['category'])
+AGENT_QUEUE_DEPTH = gauge('agent_task_queue_depth', 'Tasks waiting for an agent')
+AGENT_UTILIZATION = gauge('agent_utilization_ratio', 'Share of agents currently working')
+
 
 @dataclass
 class Task:
@@ -181,6 +189,7 @@ class AgentRevivalSystem:
         
         For now, simulates execution
         """
+        started = time.perf_counter()
         try:
             logger.info(f"🔄 {agent.name} executing: {task.description}")
             
@@ -201,6 +210,8 @@ class AgentRevivalSystem:
             if task.id in self.active_tasks:
                 del self.active_tasks[task.id]
             
+            TASK_SECONDS.observe(time.perf_counter() - started, (task.category,))
+            TASKS_FINISHED.inc(1, (task.category, 'completed'))
             logger.info(f"✅ {agent.name} completed task: {task.description}")
             
             # Save state
@@ -210,6 +221,7 @@ class AgentRevivalSystem:
             
         except Exception as e:
             logger.error(f"❌ Task execution failed: {e}")
+            TASK_SECONDS.observe(time.perf_counter() - started, (task.category,))
             
             # Handle error
             task.error = str(e)
@@ -221,10 +233,12 @@ class AgentRevivalSystem:
             # Retry if possible
             if task.retry_count < task.max_retries:
                 task.status = "retry"
+                TASKS_FINISHED.inc(1, (task.category, 'retried'))
                 logger.info(f"🔄 Retrying task (attempt {task.retry_count}/{task.max_retries})")
                 self.task_queue.put(task)
             else:
                 task.status = "failed"
+                TASKS_FINISHED.inc(1, (task.category, 'failed'))
                 self.failed_tasks.append(task)
                 logger.error(f"❌ Task failed after {task.max_retries} attempts")
             
@@ -278,8 +292,14 @@ class AgentRevivalSystem:
         
         logger.info("🔧 Worker thread stopped")
 
-    def start(self, num_workers: int = 5):
-        """Start the agent revival system with worker threads"""
+    def utilization(self) -> float:
+        """Fraction of agents in the WORKING state"""
+        agents = list(self.multi_agent_system.agents.values())
+        working = sum(1 for agent in agents if agent.status == AgentStatus.WORKING)
+        return working / len(agents) if agents else 0.0
+
+    def start(self, num_workers: int = 5, metrics_port: Optional[int] = None):
+        """Start the agent revival system with worker threads (and /metrics if metrics_port is set)"""
         if self.is_running:
             logger.warning("⚠️  System already running")
             return
@@ -291,6 +311,11 @@ class AgentRevivalSystem:
         logger.info(f"   Agents: {len(self.multi_agent_system.agents)}")
         
         self.is_running = True
+
+        AGENT_QUEUE_DEPTH.set_function(self.task_queue.qsize)
+        AGENT_UTILIZATION.set_function(self.utilization)
+        if metrics_port:
+            start_metrics_server(metrics_port)
         
         # Start worker threads
         for i in range(num_workers):
@@ -462,7 +487,7 @@ def main():
     revival.add_tasks_batch(demo_tasks)
     
     # Start system
-    revival.start(num_workers=5)
+    revival.start(num_workers=5, metrics_port=int(os.getenv('AGENT_METRICS_PORT', '0')) or None)
     
     # Monitor for a bit
     try:
@@ -10,6 +10,7 @@ import asyncio
 import logging
 import os
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
@@ -17,6 +18,10 @@ import json
 
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from metrics_exporter import HTTP_REQUEST_SECONDS, counter, gauge, histogram, start_metrics_server
+from llm_response_cache import LLMResponseCache, shared_cache
 
 try:
     from anthropic import Anthropic, AsyncAnthropic
@@ -39,6 +44,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger('ClaudeAPI24x7')
 
+API_HOST = 'api.anthropic.com'
+TASKS_ROUTED = counter('claude_tasks_routed_total', 'Tasks routed to Claude', ['outcome'])
+ROUTE_SECONDS = histogram('claude_task_route_duration_seconds', 'End-to-end task routing latency')
+ROUTER_QUEUE_DEPTH = gauge('claude_task_queue_depth', 'Tasks waiting in the router queue')
+
 
 class ClaudeAPI247:
     """
@@ -46,8 +56,8 @@ class ClaudeAPI247:
     REAL implementation using Anthropic API
     """
 
-    def __init__(self):
-        """Initialize Claude API connection"""
+    def __init__(self, cache: Optional[LLMResponseCache] = None):
+        """Initialize Claude API connection (cache: response cache, default the shared one)"""
         self.api_key = os.getenv('ANTHROPIC_API_KEY', '')
 
         if not self.api_key or self.api_key.startswith('your_'):
@@ -73,18 +83,32 @@ class ClaudeAPI247:
         self.model = "claude-3-5-sonnet-20241022"  # Latest production model
         self.max_tokens = 4096
         self.conversation_history: List[Dict] = []
+        self.cache = cache if cache is not None else shared_cache()
+
+    async def create_message(self, **kwargs):
+        """messages.create with the call latency recorded per host and outcome"""
+        started = time.perf_counter()
+        outcome = 'error'
+        try:
+            response = await self.async_client.messages.create(**kwargs)
+            outcome = 'ok'
+            return response
+        finally:
+            HTTP_REQUEST_SECONDS.observe(time.perf_counter() - started, (API_HOST, outcome))
 
     def is_available(self) -> bool:
         """Check if Claude API is available"""
         return self.client is not None and self.async_client is not None
 
-    async def analyze_task(self, task_description: str, context: Dict = None) -> Dict[str, Any]:
+    async def analyze_task(self, task_description: str, context: Dict = None,
+                           call_type: str = 'analyze_task') -> Dict[str, Any]:
         """
         Analyze a task using Claude API
 
         Args:
             task_description: Description of the task
             context: Optional context information
+            call_type: Response cache category (selects the TTL)
 
         Returns:
             Analysis results from Claude
@@ -112,41 +136,50 @@ Provide:
 
 Format as JSON."""
 
-            logger.info(f"📤 Sending task to Claude API...")
+            if self.cache is None:
+                return await self._analyze_prompt(prompt)
+            return await self.cache.acall(call_type, prompt, self.model, {"max_tokens": self.max_tokens},
+                                          lambda: self._analyze_prompt(prompt))
 
-            response = await self.async_client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
-            )
+        except Exception as e:
+            logger.error(f"❌ Error calling Claude API: {e}")
+            return {"error": str(e)}
 
-            content = response.content[0].text
-            logger.info(f"📥 Received response from Claude API ({len(content)} chars)")
+    async def _analyze_prompt(self, prompt: str) -> Dict[str, Any]:
+        logger.info(f"📤 Sending task to Claude API...")
 
-            # Try to parse as JSON, fallback to text
-            try:
-                result = json.loads(content)
-            except json.JSONDecodeError:
-                result = {"analysis": content}
+        response = await self.create_message(
+            model=self.model,
+            max_tokens=self.max_tokens,
+            messages=[{
+                "role": "user",
+                "content": prompt
+            }]
+        )
 
-            result["timestamp"] = datetime.now().isoformat()
-            result["model_used"] = self.model
-            result["tokens_used"] = response.usage.input_tokens + response.usage.output_tokens
+        content = response.content[0].text
+        logger.info(f"📥 Received response from Claude API ({len(content)} chars)")
 
-            return result
+        # Try to parse as JSON, fallback to text
+        try:
+            result = json.loads(content)
+        except json.JSONDecodeError:
+            result = {"analysis": content}
+        if not isinstance(result, dict):
+            result = {"analysis": result}
 
-        except Exception as e:
-            logger.error(f"❌ Error calling Claude API: {e}")
-            return {"error": str(e)}
+        result["timestamp"] = datetime.now().isoformat()
+        result["model_used"] = self.model
+        result["tokens_used"] = response.usage.input_tokens + response.usage.output_tokens
+
+        return result
 
     async def agent_conversation(
         self,
         message: str,
         agent_id: int = None,
-        maintain_context: bool = True
+        maintain_context: bool = True,
+        call_type: str = 'conversation'
     ) -> str:
         """
         Have a conversation with Claude API as an agent
@@ -155,6 +188,8 @@ Format as JSON."""
             message: Message to send
             agent_id: Optional agent ID for context
             maintain_context: Whether to maintain conversation history
+            call_type: Response cache category; only stateless
+                (maintain_context=False) calls are cached
 
         Returns:
             Claude's response
@@ -182,14 +217,20 @@ Keep responses concise and actionable."""
 
             logger.info(f"💬 Agent conversation (Agent #{agent_id or 'Master'})...")
 
-            response = await self.async_client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                system=system_prompt,
-                messages=messages
-            )
+            async def converse() -> str:
+                response = await self.create_message(
+                    model=self.model,
+                    max_tokens=self.max_tokens,
+                    system=system_prompt,
+                    messages=messages
+                )
+                return response.content[0].text
 
-            reply = response.content[0].text
+            if self.cache is None or maintain_context:
+                reply = await converse()
+            else:
+                reply = await self.cache.acall(call_type, message, self.model,
+                                               {"max_tokens": self.max_tokens, "system": system_prompt}, converse)
 
             # Update conversation history
             if maintain_context:
@@ -267,7 +308,8 @@ Keep responses concise and actionable."""
                 status_check = await self.agent_conversation(
                     "Quick system health check: Any issues with Agent X5.0?",
                     agent_id=1,  # Master CFO
-                    maintain_context=False
+                    maintain_context=False,
+                    call_type='health_check'
                 )
 
                 logger.info(f"Status: {status_check[:200]}...")
@@ -288,11 +330,15 @@ Keep responses concise and actionable."""
 class ClaudeTaskRouter:
     """Routes tasks to appropriate Claude API instances"""
 
-    def __init__(self):
+    def __init__(self, metrics_port: Optional[int] = None):
         self.claude = ClaudeAPI247()
         self.task_queue: List[Dict] = []
         self.results: Dict[str, Any] = {}
 
+        ROUTER_QUEUE_DEPTH.set_function(lambda: len(self.task_queue))
+        if metrics_port:
+            start_metrics_server(metrics_port)
+
     async def route_task(self, task: Dict) -> Dict:
         """
         Route a task to Claude API for analysis
@@ -310,7 +356,9 @@ class ClaudeTaskRouter:
         logger.info(f"🎯 Routing task: {task_id}")
 
         # Analyze with Claude
-        analysis = await self.claude.analyze_task(description, context)
+        with ROUTE_SECONDS.time():
+            analysis = await self.claude.analyze_task(description, context, call_type='route_task')
+        TASKS_ROUTED.inc(1, ('error' if 'error' in analysis else 'ok',))
 
         result = {
             "task_id": task_id,
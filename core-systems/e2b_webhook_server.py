@@ -11,16 +11,20 @@ import json
 import logging
 import os
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, g, request, jsonify
 from flask_cors import CORS
 from dotenv import load_dotenv
 
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from metrics_exporter import CONTENT_TYPE, counter, gauge, histogram, render
 
 # Load environment
 load_dotenv(Path(__file__).parent.parent / 'config' / '.env')
@@ -47,6 +51,27 @@ PORT = int(os.getenv('E2B_WEBHOOK_PORT', '5000'))
 webhook_events: List[Dict] = []
 MAX_EVENTS = 1000  # Keep last 1000 events
 
+# Metrics (scraped from GET /metrics)
+REQUEST_SECONDS = histogram('webhook_request_duration_seconds', 'Webhook request latency',
+                            ['endpoint', 'status'])
+EVENTS_RECEIVED = counter('webhook_events_received_total', 'Webhook events received', ['type'])
+gauge('webhook_events_stored', 'Events held in memory').set_function(lambda: len(webhook_events))
+
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+
+@app.after_request
+def record_request_metrics(response):
+    started = g.pop('request_started', None)
+    if started is not None:
+        REQUEST_SECONDS.observe(time.perf_counter() - started,
+                                (request.url_rule.rule if request.url_rule else 'unmatched',
+                                 str(response.status_code)))
+    return response
+
 
 # ============================================================================
 # WEBHOOK HANDLERS
@@ -64,6 +89,12 @@ def health_check():
     }), 200
 
 
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus metrics endpoint"""
+    return Response(render(), content_type=CONTENT_TYPE)
+
+
 @app.route('/webhook/e2b', methods=['POST'])
 def e2b_webhook():
     """
@@ -105,6 +136,7 @@ def e2b_webhook():
 
         # Route to appropriate handler
         event_type = event['type']
+        EVENTS_RECEIVED.inc(1, (event_type,))
         result = route_webhook_event(event)
 
         # Save to file
@@ -415,6 +447,7 @@ def main():
     print("\n" + "="*70)
     print("ENDPOINTS:")
     print(f"  GET  /health                    - Health check")
+    print(f"  GET  /metrics                   - Prometheus metrics")
     print(f"  POST /webhook/e2b               - E2B events")
     print(f"  POST /webhook/e2b/sandbox_started")
     print(f"  POST /webhook/e2b/sandbox_stopped")
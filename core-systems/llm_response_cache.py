@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+LLM RESPONSE CACHE - Agent X5.0
+===============================
+Reuses LLM answers to repeated prompts (health checks, task analyses,
+market-data prompts for an unchanged snapshot)
+
+Keys are a hash of the call type, the model, the call parameters and the
+whitespace-normalized prompt. Each call type has its own TTL.
+
+Tiers:
+- Memory: an LRU (OrderedDict) of JSON-encoded answers. A hit costs a dict
+  lookup and a json.loads.
+- Disk: entries evicted from memory spill to a SQLite file, and close()
+  spills everything, so a restart starts warm. A disk hit is promoted back
+  to memory.
+
+Quantize mode rounds every number in the prompt to N significant digits,
+for the key only. Near-identical snapshots (price 195.50 vs 195.52) then
+share one entry.
+
+Only successful answers are cached; errors are always retried. Concurrent
+async misses on one key share a single call.
+
+Usage:
+    from llm_response_cache import shared_cache
+
+    cache = shared_cache()
+    result = await cache.acall('analyze_task', prompt, model, {'max_tokens': 4096},
+                               lambda: call_claude(prompt))
+"""
+
+import asyncio
+import atexit
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+from metrics_exporter import counter
+
+logger = logging.getLogger('LLMResponseCache')
+
+DEFAULT_TTLS = {
+    'analyze_task': 3600.0,
+    'route_task': 3600.0,
+    'health_check': 900.0,
+    'conversation': 300.0,
+    'market_analysis': 60.0,
+}
+DEFAULT_PATH = Path(__file__).parent.parent / 'logs' / 'llm_response_cache.db'
+NUMBER_PATTERN = re.compile(r'-?\d+(?:\.\d+)?')
+
+CACHE_LOOKUPS = counter('llm_cache_lookups_total', 'LLM response cache lookups', ['call_type', 'result'])
+
+
+def _is_success(value: Any) -> bool:
+    if isinstance(value, dict):
+        return 'error' not in value
+    if isinstance(value, str):
+        return bool(value) and not value.startswith('ERROR')
+    return value is not None
+
+
+def normalize_prompt(prompt: str, quantize: Optional[int] = None) -> str:
+    """Collapse whitespace; with ``quantize``, round numbers to that many significant digits"""
+    text = ' '.join(str(prompt).split())
+    if quantize:
+        text = NUMBER_PATTERN.sub(lambda match: f'{float(match.group()):.{quantize}g}', text)
+    return text
+
+
+def cache_key(call_type: str, prompt: str, model: str, params: Optional[Dict] = None,
+              quantize: Optional[int] = None) -> str:
+    material = json.dumps([call_type, model, params or {}, normalize_prompt(prompt, quantize)],
+                          sort_keys=True, default=str)
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+class LLMResponseCache:
+    """Two-tier (memory LRU + SQLite) cache of LLM answers with per-call-type TTLs"""
+
+    def __init__(self, max_entries: int = 512, ttls: Optional[Dict[str, float]] = None,
+                 default_ttl: float = 300.0, path: Optional[Path] = DEFAULT_PATH,
+                 disk_max_entries: int = 20000, quantize: Union[int, Dict[str, int], None] = None):
+        self.max_entries = max_entries
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.disk_max_entries = disk_max_entries
+        self.quantize = quantize
+
+        # key -> (expires_at, call_type, JSON answer), least recently used first
+        self.memory: 'OrderedDict[str, tuple]' = OrderedDict()
+        self.stats = {'hits': 0, 'disk_hits': 0, 'misses': 0, 'stores': 0, 'spilled': 0, 'saved_tokens': 0}
+
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._db = None
+        if path is not None:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(path), check_same_thread=False)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('CREATE TABLE IF NOT EXISTS responses ('
+                             'key TEXT PRIMARY KEY, call_type TEXT, value TEXT, expires_at REAL)')
+            self._db.execute('DELETE FROM responses WHERE expires_at <= ?', (time.time(),))
+            self._db.commit()
+            atexit.register(self.close)
+
+    def _quantize_for(self, call_type: str) -> Optional[int]:
+        if isinstance(self.quantize, dict):
+            return self.quantize.get(call_type)
+        return self.quantize
+
+    def key(self, call_type: str, prompt: str, model: str, params: Optional[Dict] = None) -> str:
+        return cache_key(call_type, prompt, model, params, self._quantize_for(call_type))
+
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+
+    def get(self, call_type: str, prompt: str, model: str, params: Optional[Dict] = None) -> Optional[Any]:
+        """Cached answer (a fresh copy, dicts marked ``cached``) or None"""
+        return self._get(self.key(call_type, prompt, model, params), call_type)
+
+    def put(self, call_type: str, prompt: str, model: str, params: Optional[Dict], value: Any):
+        self._put(self.key(call_type, prompt, model, params), call_type, value)
+
+    def _get(self, key: str, call_type: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            entry = self.memory.get(key)
+            result = 'memory'
+            if entry is not None and entry[0] <= now:
+                del self.memory[key]
+                entry = None
+            if entry is None and self._db is not None:
+                row = self._db.execute('SELECT expires_at, call_type, value FROM responses WHERE key = ?',
+                                       (key,)).fetchone()
+                if row is not None:
+                    with self._db:
+                        self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+                    if row[0] > now:
+                        entry = tuple(row)
+                        self._store_locked(key, entry)
+                        result = 'disk'
+            if entry is None:
+                self.stats['misses'] += 1
+                CACHE_LOOKUPS.inc(1, (call_type, 'miss'))
+                return None
+            self.memory.move_to_end(key)
+            self.stats['hits'] += 1
+            if result == 'disk':
+                self.stats['disk_hits'] += 1
+
+        CACHE_LOOKUPS.inc(1, (call_type, result))
+        value = json.loads(entry[2])
+        if isinstance(value, dict):
+            self.stats['saved_tokens'] += value.get('tokens_used', 0) or 0
+            value['cached'] = True
+        return value
+
+    def _put(self, key: str, call_type: str, value: Any):
+        entry = (time.time() + self.ttls.get(call_type, self.default_ttl), call_type, json.dumps(value, default=str))
+        with self._lock:
+            self._store_locked(key, entry)
+            self.stats['stores'] += 1
+
+    def _store_locked(self, key: str, entry: tuple):
+        self.memory[key] = entry
+        self.memory.move_to_end(key)
+        spill = []
+        while len(self.memory) > self.max_entries:
+            spill.append(self.memory.popitem(last=False))
+        if spill and self._db is not None:
+            self._spill_locked(spill)
+
+    def _spill_locked(self, items):
+        now = time.time()
+        rows = [(key, call_type, value, expires_at) for key, (expires_at, call_type, value) in items
+                if expires_at > now]
+        with self._db:
+            self._db.executemany('INSERT OR REPLACE INTO responses (key, call_type, value, expires_at) '
+                                 'VALUES (?, ?, ?, ?)', rows)
+            self.stats['spilled'] += len(rows)
+            if self.stats['spilled'] % 500 < len(rows):
+                # Occasional pruning keeps the disk tier bounded
+                self._db.execute('DELETE FROM responses WHERE expires_at <= ?', (now,))
+                self._db.execute('DELETE FROM responses WHERE key IN (SELECT key FROM responses '
+                                 'ORDER BY expires_at DESC LIMIT -1 OFFSET ?)', (self.disk_max_entries,))
+
+    # ------------------------------------------------------------------
+    # Read-through helpers
+    # ------------------------------------------------------------------
+
+    def call(self, call_type: str, prompt: str, model: str, params: Optional[Dict],
+             create: Callable[[], Any], cacheable: Callable[[Any], bool] = _is_success) -> Any:
+        """Cached answer, or ``create()`` stored when ``cacheable`` accepts it"""
+        key = self.key(call_type, prompt, model, params)
+        value = self._get(key, call_type)
+        if value is not None:
+            return value
+        value = create()
+        if cacheable(value):
+            self._put(key, call_type, value)
+        return value
+
+    async def acall(self, call_type: str, prompt: str, model: str, params: Optional[Dict],
+                    create: Callable[[], Awaitable[Any]], cacheable: Callable[[Any], bool] = _is_success) -> Any:
+        """Async ``call``; concurrent misses on one key await a single ``create()``"""
+        key = self.key(call_type, prompt, model, params)
+        value = self._get(key, call_type)
+        if value is not None:
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            value = await asyncio.shield(inflight)
+            return json.loads(json.dumps(value, default=str))  # each waiter gets its own copy
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await create()
+            if cacheable(value):
+                self._put(key, call_type, value)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # retrieved here so an unawaited future does not warn
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def clear(self, call_type: Optional[str] = None):
+        """Drop every entry (or only those of one call type) from both tiers"""
+        with self._lock:
+            if call_type is None:
+                self.memory.clear()
+            else:
+                for key in [key for key, entry in self.memory.items() if entry[1] == call_type]:
+                    del self.memory[key]
+            if self._db is not None:
+                with self._db:
+                    if call_type is None:
+                        self._db.execute('DELETE FROM responses')
+                    else:
+                        self._db.execute('DELETE FROM responses WHERE call_type = ?', (call_type,))
+
+    def close(self):
+        """Spill the memory tier to disk so the next process starts warm"""
+        with self._lock:
+            if self._db is None:
+                return
+            self._spill_locked(list(self.memory.items()))
+            self._db.close()
+            self._db = None
+
+
+_shared: Optional[LLMResponseCache] = None
+_shared_lock = threading.Lock()
+
+
+def shared_cache() -> Optional[LLMResponseCache]:
+    """
+    Process-wide cache shared by the LLM callers; None when LLM_CACHE=0
+
+    LLM_CACHE_QUANTIZE=<digits> turns on quantize mode for all call types.
+    """
+    global _shared
+    if os.getenv('LLM_CACHE', '1').lower() in ('0', 'false', 'off', 'no'):
+        return None
+    with _shared_lock:
+        if _shared is None:
+            quantize = os.getenv('LLM_CACHE_QUANTIZE')
+            _shared = LLMResponseCache(quantize=int(quantize) if quantize else None)
+        return _shared
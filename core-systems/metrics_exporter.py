@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+METRICS EXPORTER - Agent X5.0
+=============================
+Counters, gauges and histograms exposed in the Prometheus text format
+
+Counters and histograms accumulate into a per-thread shard: recording is a
+dict update on the calling thread's own shard, with no lock and no shared
+write. Scrapes sum the shards. When a thread ends its shard is folded into
+a shared total, so short-lived threads do not leave shards behind. Gauges are either set directly or computed
+at scrape time from a callback (queue depths, utilization).
+
+Usage:
+    from metrics_exporter import counter, histogram, start_metrics_server
+
+    CANDLES = counter('trading_candles_processed_total', 'Candles analyzed', ['pair'])
+    CANDLES.inc(5, ('BTC/USD',))
+    start_metrics_server(8082)   # GET /metrics
+"""
+
+import bisect
+import logging
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger('MetricsExporter')
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+class _ThreadToken:
+    """Weak-referenceable marker held by one thread's thread-local"""
+
+
+class _Metric:
+    """Base class: name, help text, label names and per-thread shards"""
+
+    kind = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._shards: List[Dict] = []
+        self._retired: Dict = {}  # shards of finished threads, folded together
+        self._shards_lock = threading.Lock()  # taken once per thread, at its end and on scrapes
+
+    def _shard(self) -> Dict:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            # The token lives only in the thread-local, so it is collected when the thread ends
+            token = self._local.token = _ThreadToken()
+            weakref.finalize(token, self._retire, shard)
+            with self._shards_lock:
+                self._shards.append(shard)
+            return shard
+
+    def _retire(self, shard: Dict):
+        with self._shards_lock:
+            self._shards.remove(shard)
+            self._merge(self._retired, shard)
+
+    def _snapshot(self) -> List[Dict]:
+        """Live shards plus a copy of the retired total, consistent with each other"""
+        with self._shards_lock:
+            shards = list(self._shards)
+            retired = self._merge({}, self._retired)
+        return shards + [retired]
+
+    def _merge(self, into: Dict, shard: Dict) -> Dict:
+        raise NotImplementedError
+
+    def _check_labels(self, labels: Tuple) -> Tuple:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {labels}")
+        return labels
+
+    def collect(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonic counter"""
+
+    kind = 'counter'
+
+    def inc(self, amount: float = 1.0, labels: Tuple = ()):
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0.0) + amount
+
+    def value(self, labels: Tuple = ()) -> float:
+        return sum(shard.get(labels, 0.0) for shard in self._snapshot())
+
+    def _merge(self, into: Dict, shard: Dict) -> Dict:
+        for labels, value in list(shard.items()):
+            into[labels] = into.get(labels, 0.0) + value
+        return into
+
+    def collect(self) -> List[str]:
+        totals: Dict[Tuple, float] = {}
+        for shard in self._snapshot():
+            self._merge(totals, shard)
+        return [f'{self.name}{_format_labels(self.labelnames, labels)} {value:g}'
+                for labels, value in sorted(totals.items())]
+
+
+class Histogram(_Metric):
+    """Bucketed distribution (e.g. latency in seconds)"""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, labels: Tuple = ()):
+        shard = self._shard()
+        state = shard.get(labels)
+        if state is None:
+            # [per-bucket counts (+Inf last), sum, count]
+            state = shard[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        state[0][bisect.bisect_left(self.buckets, value)] += 1
+        state[1] += value
+        state[2] += 1
+
+    @contextmanager
+    def time(self, labels: Tuple = ()):
+        """Observe the duration of a with-block"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, labels)
+
+    def _merge(self, into: Dict, shard: Dict) -> Dict:
+        for labels, (counts, total, count) in list(shard.items()):
+            entry = into.setdefault(labels, [[0] * (len(self.buckets) + 1), 0.0, 0])
+            entry[0] = [a + b for a, b in zip(entry[0], counts)]
+            entry[1] += total
+            entry[2] += count
+        return into
+
+    def collect(self) -> List[str]:
+        merged: Dict[Tuple, list] = {}
+        for shard in self._snapshot():
+            self._merge(merged, shard)
+
+        lines = []
+        for labels, (counts, total, count) in sorted(merged.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = 'le="+Inf"' if bound == float('inf') else f'le="{bound:g}"'
+                lines.append(f'{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}')
+            lines.append(f'{self.name}_sum{_format_labels(self.labelnames, labels)} {total:g}')
+            lines.append(f'{self.name}_count{_format_labels(self.labelnames, labels)} {count}')
+        return lines
+
+
+class Gauge(_Metric):
+    """Point-in-time value, set directly or read from a callback at scrape time"""
+
+    kind = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self.values: Dict[Tuple, float] = {}
+        self.functions: Dict[Tuple, Callable[[], float]] = {}
+
+    def set(self, value: float, labels: Tuple = ()):
+        self.values[labels] = value
+
+    def set_function(self, function: Callable[[], float], labels: Tuple = ()):
+        self.functions[self._check_labels(labels)] = function
+
+    def collect(self) -> List[str]:
+        values = dict(self.values)
+        for labels, function in list(self.functions.items()):
+            try:
+                values[labels] = float(function())
+            except Exception as e:
+                logger.debug(f"Gauge {self.name}{labels} callback failed: {e}")
+        return [f'{self.name}{_format_labels(self.labelnames, labels)} {value:g}'
+                for labels, value in sorted(values.items())]
+
+
+class MetricsRegistry:
+    """Named metrics; get-or-create so modules can share a metric by name"""
+
+    def __init__(self):
+        self.metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs):
+        with self._lock:
+            metric = self.metrics.get(name)
+            if metric is None:
+                metric = self.metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} already registered as a different type or labels")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        lines = []
+        for name, metric in sorted(self.metrics.items()):
+            lines.append(f'# HELP {name} {_escape(metric.documentation)}')
+            lines.append(f'# TYPE {name} {metric.kind}')
+            lines.extend(metric.collect())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+counter = REGISTRY.counter
+histogram = REGISTRY.histogram
+gauge = REGISTRY.gauge
+render = REGISTRY.render
+
+HTTP_REQUEST_SECONDS = histogram('http_client_request_duration_seconds',
+                                 'Outbound HTTP call latency', ['host', 'outcome'])
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?')[0] != '/metrics':
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = self.server.registry.render().encode()
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # scrapes every 15s would flood the logs
+
+
+def start_metrics_server(port: int, host: str = '0.0.0.0',
+                         registry: Optional[MetricsRegistry] = None) -> Optional[ThreadingHTTPServer]:
+    """Serve GET /metrics from a daemon thread; returns None if the port is taken"""
+    try:
+        server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    except OSError as e:
+        logger.warning(f"⚠️  Metrics endpoint not started on port {port}: {e}")
+        return None
+    server.daemon_threads = True
+    server.registry = registry or REGISTRY
+    threading.Thread(target=server.serve_forever, name=f'Metrics-{port}', daemon=True).start()
+    logger.info(f"📊 Metrics available at http://{host}:{port}/metrics")
+    return server
@@ -1,15 +1,33 @@
 """
 Agent 3.0 - Central Trading Orchestrator
 Executive-grade automation orchestrator for multi-pillar trading operations
+
+Trading signals arrive on an asyncio queue, fed in-process through
+submit_signal() (thread-safe) and by a watcher that picks up every new
+entry appended to the pattern engine's signals.json. Decisions are made
+as soon as a signal is queued; Zapier and SharePoint calls run on worker
+threads so they never block the event loop. The watcher reads the file on
+its own single-thread executor, so a backlog of slow webhook calls cannot
+hold up intake, and local trade-log appends are serialized by a lock.
+
+The back-office pillars (legal, federal, grants) each run as their own
+task with an interval, start deadline and timeout (pillar_schedule in
+agent_3_config.json). Their monitors run on a dedicated thread pool, so
+a slow pillar cannot delay trading decisions or the other pillars.
 """
 
 import asyncio
 import json
 import os
+import sys
+import threading
 import time
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import requests
 from enum import Enum
 
@@ -24,6 +42,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger('Agent3.0')
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'core-systems'))
+from metrics_exporter import counter, histogram
+
+PILLAR_LAG = histogram('agent3_pillar_lag_seconds', 'Delay between scheduled and actual pillar run start',
+                       ['pillar'])
+PILLAR_RUNS = histogram('agent3_pillar_run_seconds', 'Pillar monitor run time', ['pillar', 'outcome'])
+PILLAR_SKIPS = counter('agent3_pillar_skipped_total', 'Pillar runs skipped (deadline missed or still running)',
+                       ['pillar'])
+
+# interval: seconds between runs; deadline: max start lag before a run is
+# skipped; timeout: max time to wait for a run
+DEFAULT_PILLAR_SCHEDULE = {
+    'legal': {'interval': 60, 'deadline': 10, 'timeout': 30},
+    'federal': {'interval': 60, 'deadline': 10, 'timeout': 30},
+    'grants': {'interval': 60, 'deadline': 10, 'timeout': 30},
+}
+
 
 class SignalType(Enum):
     """Trading signal types"""
@@ -48,9 +83,37 @@ class Agent3Orchestrator:
     def __init__(self):
         self.config = self.load_config()
         self.running = False
-        self.signal_queue = []
+        self.signal_queue: Optional[asyncio.Queue] = None  # created by orchestrate()
         self.decision_log = []
 
+        # Signal intake (submit_signal before orchestrate() starts is buffered here)
+        self.signal_file = 'pillar-a-trading/bots/pattern-recognition/signals.json'
+        self.signal_poll_interval = float(os.getenv('SIGNAL_POLL_INTERVAL', '0.25'))
+        self.max_inflight_dispatches = 8
+        self._pending_signals = deque()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._signal_file_key = None
+        self._signal_offset = 0
+        self._signal_high_water = ''
+        self._dispatches = set()
+        self.intake_executor: Optional[ThreadPoolExecutor] = None
+        self._trade_log_lock = threading.Lock()  # up to max_inflight_dispatches writers
+        self.intake_stats = {'received': 0, 'decisions': 0, 'dispatch_errors': 0, 'last_latency_ms': 0.0}
+
+        # Back-office pillar scheduling
+        self.pillar_monitors = {
+            'legal': self.monitor_legal_operations,
+            'federal': self.monitor_federal_contracting,
+            'grants': self.monitor_grant_intelligence,
+        }
+        self.pillar_schedule = {
+            name: {**spec, **self.config.get('pillar_schedule', {}).get(name, {})}
+            for name, spec in DEFAULT_PILLAR_SCHEDULE.items()
+        }
+        self.pillar_stats: Dict[str, Dict[str, Any]] = {}
+        self.pillar_executor: Optional[ThreadPoolExecutor] = None
+        self._stopped: Optional[asyncio.Event] = None
+
         # API Endpoints
         self.sharepoint_api = os.getenv('SHAREPOINT_API', self.config.get('sharepoint_api'))
         self.zapier_webhook = os.getenv('ZAPIER_WEBHOOK_URL', self.config.get('zapier_webhook'))
@@ -78,7 +141,7 @@ class Agent3Orchestrator:
         """
         try:
             # Check for signals from pattern recognition bot
-            signal_file = 'pillar-a-trading/bots/pattern-recognition/signals.json'
+            signal_file = self.signal_file
             if os.path.exists(signal_file):
                 with open(signal_file, 'r') as f:
                     signals = json.load(f)
@@ -89,6 +152,96 @@ class Agent3Orchestrator:
 
         return None
 
+    def submit_signal(self, signal: Dict[str, Any]) -> None:
+        """Queue a signal for a decision (safe to call from any thread)"""
+        item = (time.perf_counter(), signal)
+        if self._loop is None or self.signal_queue is None:
+            self._pending_signals.append(item)
+        else:
+            self._loop.call_soon_threadsafe(self.signal_queue.put_nowait, item)
+
+    def read_new_signals(self) -> List[Dict[str, Any]]:
+        """
+        Signals appended to signals.json since the last read
+
+        The file is re-parsed only when its size or mtime changes. Entries
+        past the last consumed offset are new; if the file was rewritten
+        shorter, entries newer than the last consumed timestamp are taken.
+        """
+        try:
+            stat = os.stat(self.signal_file)
+        except FileNotFoundError:
+            return []
+        key = (stat.st_mtime_ns, stat.st_size)
+        if key == self._signal_file_key:
+            return []
+
+        with open(self.signal_file, 'r') as f:
+            signals = json.load(f)
+        self._signal_file_key = key
+        if not isinstance(signals, list):
+            return []
+
+        if len(signals) >= self._signal_offset:
+            new = signals[self._signal_offset:]
+        else:
+            new = [s for s in signals if s.get('timestamp', '') > self._signal_high_water]
+        self._signal_offset = len(signals)
+
+        for signal in new:
+            self._signal_high_water = max(self._signal_high_water, signal.get('timestamp', ''))
+        return new
+
+    async def watch_signal_file(self) -> None:
+        """Feed entries appended to signals.json into the signal queue"""
+        loop = asyncio.get_running_loop()
+
+        # Start at the end of the file: signals already there were handled before a restart
+        try:
+            await loop.run_in_executor(self.intake_executor, self.read_new_signals)
+        except Exception as e:
+            logger.error(f"Error reading signal file: {e}")
+
+        while self.running:
+            await asyncio.sleep(self.signal_poll_interval)
+            try:
+                for signal in await loop.run_in_executor(self.intake_executor, self.read_new_signals):
+                    self.signal_queue.put_nowait((time.perf_counter(), signal))
+            except Exception as e:
+                logger.error(f"Error monitoring pattern engine: {e}")
+
+    async def process_signals(self) -> None:
+        """Decide on each queued signal as it arrives and dispatch the outbound calls"""
+        dispatch_slots = asyncio.Semaphore(self.max_inflight_dispatches)
+
+        while True:
+            received_at, signal = await self.signal_queue.get()
+            try:
+                self.intake_stats['received'] += 1
+                decision = self.make_decision(signal)
+                self.intake_stats['decisions'] += 1
+                self.intake_stats['last_latency_ms'] = (time.perf_counter() - received_at) * 1000
+
+                # Slow webhooks queue up behind the semaphore without delaying decisions
+                task = asyncio.create_task(self.dispatch_decision(decision, dispatch_slots))
+                self._dispatches.add(task)
+                task.add_done_callback(self._dispatches.discard)
+            except Exception as e:
+                logger.error(f"Error processing signal: {e}")
+            finally:
+                self.signal_queue.task_done()
+
+    async def dispatch_decision(self, decision: Dict[str, Any], slots: asyncio.Semaphore) -> None:
+        """Send a decision to Zapier and SharePoint concurrently on worker threads"""
+        async with slots:
+            results = await asyncio.gather(
+                asyncio.to_thread(self.send_to_zapier, decision),
+                asyncio.to_thread(self.log_to_sharepoint, decision),
+                return_exceptions=True
+            )
+        if any(result is not True for result in results):
+            self.intake_stats['dispatch_errors'] += 1
+
     def make_decision(self, signal: Dict[str, Any]) -> Dict[str, Any]:
         """
         Apply risk management rules and make trading decision
@@ -178,9 +331,9 @@ class Agent3Orchestrator:
             # Log locally as fallback
             log_file = f"logs/trade_log_{datetime.now().strftime('%Y%m%d')}.json"
             try:
-                with open(log_file, 'a') as f:
-                    json.dump(decision, f)
-                    f.write('\n')
+                line = json.dumps(decision) + '\n'
+                with self._trade_log_lock, open(log_file, 'a') as f:
+                    f.write(line)
                 return True
             except Exception as e:
                 logger.error(f"Error logging locally: {e}")
@@ -237,39 +390,112 @@ class Agent3Orchestrator:
         self.running = True
         logger.info("Agent 3.0 orchestration started")
 
-        iteration = 0
-        while self.running:
-            try:
-                iteration += 1
-                logger.info(f"=== Orchestration Cycle {iteration} ===")
-
-                # Pillar A: Trading Operations
-                signal = self.monitor_pattern_engine()
-                if signal:
-                    decision = self.make_decision(signal)
-                    self.send_to_zapier(decision)
-                    self.log_to_sharepoint(decision)
-
-                # Pillar B: Legal Operations
-                self.monitor_legal_operations()
-
-                # Pillar C: Federal Contracting
-                self.monitor_federal_contracting()
+        # Pillar A: Trading Operations (event-driven signal intake)
+        self._loop = asyncio.get_running_loop()
+        self.signal_queue = asyncio.Queue()
+        self.intake_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='SignalIntake')
+        while self._pending_signals:
+            self.signal_queue.put_nowait(self._pending_signals.popleft())
+        watcher = asyncio.create_task(self.watch_signal_file(), name='SignalFileWatcher')
+        processor = asyncio.create_task(self.process_signals(), name='SignalProcessor')
+
+        # Pillars B-D: Legal, Federal Contracting, Grant Intelligence (one task each)
+        self._stopped = asyncio.Event()
+        self.pillar_executor = ThreadPoolExecutor(max_workers=len(self.pillar_monitors),
+                                                  thread_name_prefix='Pillar')
+        pillar_tasks = [
+            asyncio.create_task(self.run_pillar(name, monitor, **self.pillar_schedule[name]), name=f'Pillar-{name}')
+            for name, monitor in self.pillar_monitors.items()
+        ]
 
-                # Pillar D: Grant Intelligence
-                self.monitor_grant_intelligence()
+        try:
+            await self._stopped.wait()
+        finally:
+            for task in pillar_tasks:
+                task.cancel()
+            await asyncio.gather(*pillar_tasks, return_exceptions=True)
+            self.pillar_executor.shutdown(wait=False)
+            await self.shutdown_intake(watcher, processor)
+
+    async def run_pillar(self, name: str, monitor, interval: float, deadline: float, timeout: float) -> None:
+        """
+        Run one pillar monitor on its own schedule
 
-                # Wait before next cycle (60 seconds)
-                await asyncio.sleep(60)
+        A run that cannot start within ``deadline`` of its slot, or whose
+        previous run is still going, is skipped rather than queued; runs
+        longer than ``timeout`` are abandoned (their thread finishes alone).
+        """
+        loop = asyncio.get_running_loop()
+        stats = self.pillar_stats[name] = {
+            'interval': interval, 'runs': 0, 'failures': 0, 'timeouts': 0, 'skipped': 0,
+            'last_lag_ms': 0.0, 'max_lag_ms': 0.0, 'last_duration_ms': 0.0, 'last_run': None
+        }
+        labels = (name,)
+        inflight = None
+        next_run = loop.time()
 
+        while self.running:
+            delay = next_run - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            lag = loop.time() - next_run
+            next_run += interval
+            if next_run <= loop.time():
+                next_run = loop.time() + interval  # fell a whole interval behind: drop missed slots
+
+            if lag > deadline or (inflight is not None and not inflight.done()):
+                stats['skipped'] += 1
+                PILLAR_SKIPS.inc(1, labels)
+                logger.warning(f"Pillar {name} run skipped (lag {lag:.1f}s, "
+                               f"{'still running' if inflight is not None and not inflight.done() else 'deadline missed'})")
+                continue
+
+            stats['last_lag_ms'] = lag * 1000
+            stats['max_lag_ms'] = max(stats['max_lag_ms'], lag * 1000)
+            PILLAR_LAG.observe(lag, labels)
+
+            started = loop.time()
+            inflight = loop.run_in_executor(self.pillar_executor, monitor)
+            try:
+                await asyncio.wait_for(asyncio.shield(inflight), timeout)
+                outcome = 'ok'
+            except asyncio.TimeoutError:
+                stats['timeouts'] += 1
+                outcome = 'timeout'
+                logger.warning(f"Pillar {name} run exceeded {timeout}s timeout")
             except Exception as e:
-                logger.error(f"Error in orchestration loop: {e}")
-                await asyncio.sleep(5)  # Brief pause before retry
+                stats['failures'] += 1
+                outcome = 'error'
+                logger.error(f"Error in pillar {name}: {e}")
+
+            duration = loop.time() - started
+            stats['runs'] += 1
+            stats['last_duration_ms'] = duration * 1000
+            stats['last_run'] = datetime.now().isoformat()
+            PILLAR_RUNS.observe(duration, (name, outcome))
+
+    async def shutdown_intake(self, watcher: asyncio.Task, processor: asyncio.Task) -> None:
+        """Stop reading signals, decide on everything already queued, finish dispatches"""
+        watcher.cancel()
+        await asyncio.gather(watcher, return_exceptions=True)
+        self.intake_executor.shutdown(wait=False)
+        try:
+            await asyncio.wait_for(self.signal_queue.join(), timeout=10)
+        except asyncio.TimeoutError:
+            logger.warning(f"{self.signal_queue.qsize()} queued signals left undecided at shutdown")
+        processor.cancel()
+        await asyncio.gather(processor, return_exceptions=True)
+        if self._dispatches:
+            await asyncio.gather(*list(self._dispatches), return_exceptions=True)
+        self._loop = None
 
     def stop(self) -> None:
         """Stop the orchestrator"""
         logger.info("Stopping Agent 3.0 orchestrator")
         self.running = False
+        if self._loop is not None and self._stopped is not None:
+            self._loop.call_soon_threadsafe(self._stopped.set)
 
     def get_status(self) -> Dict[str, Any]:
         """Get current status of all systems"""
@@ -277,6 +503,9 @@ class Agent3Orchestrator:
             "timestamp": datetime.now().isoformat(),
             "running": self.running,
             "total_decisions": len(self.decision_log),
+            "signal_intake": dict(self.intake_stats,
+                                  queued=self.signal_queue.qsize() if self.signal_queue else len(self._pending_signals)),
+            "pillars": {name: dict(stats) for name, stats in self.pillar_stats.items()},
             "recent_decisions": self.decision_log[-5:] if self.decision_log else [],
             "config": {
                 "confidence_threshold": self.confidence_threshold,
@@ -16,6 +16,7 @@ Features:
 import numpy as np
 import json
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any, Tuple, Optional
 from dataclasses import dataclass
@@ -46,9 +47,10 @@ class QuantumDecisionEngine:
     Uses superposition to evaluate multiple outcomes simultaneously
     """
 
-    def __init__(self, num_qubits: int = 8):
+    def __init__(self, num_qubits: int = 8, seed: Optional[int] = None):
         self.num_qubits = num_qubits
         self.state_space_size = 2 ** num_qubits
+        self.rng = np.random.default_rng(seed)
         logger.info(f"✅ Quantum Decision Engine initialized ({num_qubits} qubits, {self.state_space_size} states)")
 
     def create_superposition(self, decisions: List[Dict]) -> QuantumState:
@@ -59,23 +61,36 @@ class QuantumDecisionEngine:
         In quantum computing, we evaluate ALL decisions simultaneously
         through superposition.
         """
-        n = len(decisions)
+        confidences = np.array([decision.get('confidence', 0.5) for decision in decisions])
+        state = self.create_superposition_batch(confidences.reshape(1, -1))
 
-        # Create equal superposition (Hadamard transform)
-        amplitudes = np.ones(n, dtype=complex) / np.sqrt(n)
+        return QuantumState(
+            amplitudes=state.amplitudes[0],
+            probabilities=state.probabilities[0],
+            coherence=float(state.coherence[0])
+        )
+
+    def create_superposition_batch(self, confidences: np.ndarray) -> QuantumState:
+        """
+        Create superpositions for many decision sets at once
+
+        confidences: (n_symbols, n_decisions) array of decision confidences.
+        Returns a QuantumState whose amplitudes/probabilities are
+        (n_symbols, n_decisions) and whose coherence is (n_symbols,).
+        """
+        confidences = np.atleast_2d(np.asarray(confidences, dtype=float))
+        n = confidences.shape[1]
 
-        # Add phase based on decision confidence
-        for i, decision in enumerate(decisions):
-            confidence = decision.get('confidence', 0.5)
-            # Higher confidence = more positive phase
-            amplitudes[i] *= np.exp(1j * confidence * np.pi)
+        # Create equal superposition (Hadamard transform)
+        # Higher confidence = more positive phase
+        amplitudes = np.exp(1j * confidences * np.pi) / np.sqrt(n)
 
         # Calculate probabilities (Born rule)
         probabilities = np.abs(amplitudes) ** 2
-        probabilities /= probabilities.sum()  # Normalize
+        probabilities /= probabilities.sum(axis=1, keepdims=True)  # Normalize
 
         # Calculate coherence (how "quantum" the state is)
-        coherence = np.abs(np.sum(amplitudes * np.conj(amplitudes))) / n
+        coherence = np.abs(np.sum(amplitudes * np.conj(amplitudes), axis=1)) / n
 
         return QuantumState(
             amplitudes=amplitudes,
@@ -93,7 +108,29 @@ class QuantumDecisionEngine:
         # Extract market indicators
         volatility = market_data.get('volatility', 0.2)
         momentum = market_data.get('momentum', 0.0)
-        volume = market_data.get('volume_ratio', 1.0)
+
+        batch = QuantumState(
+            amplitudes=state.amplitudes.reshape(1, -1),
+            probabilities=state.probabilities.reshape(1, -1),
+            coherence=np.array([state.coherence])
+        )
+        batch = self.quantum_interference_batch(batch, np.array([volatility]), np.array([momentum]))
+
+        return QuantumState(
+            amplitudes=batch.amplitudes[0],
+            probabilities=batch.probabilities[0],
+            coherence=float(batch.coherence[0])
+        )
+
+    def quantum_interference_batch(self, state: QuantumState, volatility: np.ndarray,
+                                   momentum: np.ndarray) -> QuantumState:
+        """
+        Apply per-symbol quantum interference to a batched state
+
+        volatility, momentum: (n_symbols,) market vectors
+        """
+        volatility = np.asarray(volatility, dtype=float).reshape(-1, 1)
+        momentum = np.asarray(momentum, dtype=float).reshape(-1, 1)
 
         # Create interference pattern
         interference = np.exp(1j * (momentum * volatility * np.pi))
@@ -102,13 +139,13 @@ class QuantumDecisionEngine:
         new_amplitudes = state.amplitudes * interference
 
         # Renormalize
-        new_amplitudes /= np.sqrt(np.sum(np.abs(new_amplitudes) ** 2))
+        new_amplitudes /= np.sqrt(np.sum(np.abs(new_amplitudes) ** 2, axis=1, keepdims=True))
 
         # Recalculate probabilities
         new_probabilities = np.abs(new_amplitudes) ** 2
-        new_probabilities /= new_probabilities.sum()
+        new_probabilities /= new_probabilities.sum(axis=1, keepdims=True)
 
-        coherence = np.abs(np.sum(new_amplitudes * np.conj(new_amplitudes))) / len(new_amplitudes)
+        coherence = np.abs(np.sum(new_amplitudes * np.conj(new_amplitudes), axis=1)) / new_amplitudes.shape[1]
 
         return QuantumState(
             amplitudes=new_amplitudes,
@@ -122,7 +159,23 @@ class QuantumDecisionEngine:
 
         Returns index of chosen decision based on quantum probabilities
         """
-        return np.random.choice(len(state.probabilities), p=state.probabilities)
+        return int(self.measure_batch(QuantumState(
+            amplitudes=state.amplitudes.reshape(1, -1),
+            probabilities=state.probabilities.reshape(1, -1),
+            coherence=np.array([state.coherence])
+        ))[0])
+
+    def measure_batch(self, state: QuantumState) -> np.ndarray:
+        """
+        Collapse every row of a batched state with one vectorized draw
+
+        Inverse-CDF sampling: one uniform per symbol from the engine's
+        seeded Generator. Returns (n_symbols,) chosen decision indices.
+        """
+        cumulative = np.cumsum(state.probabilities, axis=1)
+        draws = self.rng.random(len(cumulative)) * cumulative[:, -1]
+        chosen = (cumulative <= draws[:, None]).sum(axis=1)
+        return np.minimum(chosen, cumulative.shape[1] - 1)
 
     def decide(self, decisions: List[Dict], market_data: Dict) -> Dict:
         """
@@ -153,6 +206,42 @@ class QuantumDecisionEngine:
 
         return chosen_decision
 
+    def decide_batch(self, decisions: List[Dict], market_vectors: Dict[str, np.ndarray],
+                     confidences: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Make quantum decisions for many symbols at once
+
+        decisions: candidate decision templates shared by every symbol
+        market_vectors: per-symbol arrays for 'volatility' and 'momentum'
+        confidences: optional (n_symbols, n_decisions) candidate confidences;
+                     defaults to each template's confidence for every symbol
+
+        Returns columnar results: chosen indices, actions, probabilities
+        and coherence, one entry per symbol.
+        """
+        n_symbols = len(next(iter(market_vectors.values()))) if market_vectors else 0
+        if confidences is None:
+            template = np.array([decision.get('confidence', 0.5) for decision in decisions])
+            confidences = np.broadcast_to(template, (n_symbols, len(template)))
+        confidences = np.atleast_2d(np.asarray(confidences, dtype=float))
+        n_symbols = len(confidences)
+
+        volatility = market_vectors.get('volatility', np.full(n_symbols, 0.2))
+        momentum = market_vectors.get('momentum', np.zeros(n_symbols))
+
+        state = self.create_superposition_batch(confidences)
+        state = self.quantum_interference_batch(state, volatility, momentum)
+        chosen = self.measure_batch(state)
+
+        actions = np.array([decision.get('action', 'UNKNOWN') for decision in decisions], dtype=object)
+
+        return {
+            'chosen_index': chosen,
+            'action': actions[chosen],
+            'quantum_probability': state.probabilities[np.arange(n_symbols), chosen],
+            'quantum_coherence': state.coherence
+        }
+
 
 class QuantumMachineLearning:
     """
@@ -160,35 +249,61 @@ class QuantumMachineLearning:
     Uses quantum entanglement for feature selection and pattern learning
     """
 
-    def __init__(self):
+    def __init__(self, entanglement_threshold: float = 0.5):
         self.entangled_features = []
         self.learned_patterns = {}
+        self.entanglement_threshold = entanglement_threshold
+        self.entanglement_operator: Optional[np.ndarray] = None
         logger.info("✅ Quantum Machine Learning initialized")
 
-    def quantum_feature_entanglement(self, features: np.ndarray) -> np.ndarray:
+    def build_entanglement_operator(self, features: np.ndarray) -> np.ndarray:
         """
-        Create entangled feature representations
+        Learn the entanglement operator from a feature matrix
 
-        Entanglement means features are correlated in quantum way:
-        measuring one feature gives information about others
+        Every entangling step is a linear mix of two columns, so the whole
+        pairwise sweep collapses into one (n_features x n_features) matrix.
+        The sweep is replayed on the identity, in the same (i, j) order, so
+        ``features @ operator`` matches mixing the columns in place.
         """
         n_features = features.shape[1]
+        operator = np.eye(n_features)
+
+        if len(features) < 2:
+            return operator
+
+        # Create quantum correlation matrix (constant columns have no correlation)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            correlation_matrix = np.atleast_2d(np.corrcoef(features, rowvar=False))
+        correlation_matrix = np.nan_to_num(correlation_matrix)
+
+        # Strongly correlated pairs, upper triangle in row-major (i, j) order
+        strength = np.abs(correlation_matrix)
+        pairs = np.argwhere(np.triu(strength > self.entanglement_threshold, k=1))
+
+        for i, j in pairs:
+            entanglement_strength = strength[i, j]
+            operator[:, i] = (operator[:, i] + entanglement_strength * operator[:, j]) / 2
+            operator[:, j] = (operator[:, j] + entanglement_strength * operator[:, i]) / 2
+
+        return operator
 
-        # Create quantum correlation matrix
-        correlation_matrix = np.corrcoef(features.T)
+    def quantum_feature_entanglement(self, features: np.ndarray,
+                                     operator: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Create entangled feature representations
 
-        # Apply quantum entanglement operator (tensor product)
-        entangled = features.copy()
+        Entanglement means features are correlated in quantum way:
+        measuring one feature gives information about others
 
-        for i in range(n_features):
-            for j in range(i + 1, n_features):
-                if abs(correlation_matrix[i, j]) > 0.5:
-                    # Strong correlation = entangle these features
-                    entanglement_strength = abs(correlation_matrix[i, j])
-                    entangled[:, i] = (entangled[:, i] + entanglement_strength * entangled[:, j]) / 2
-                    entangled[:, j] = (entangled[:, j] + entanglement_strength * entangled[:, i]) / 2
+        Applies ``operator`` (or one learned from ``features`` if not given)
+        to the whole batch with a single matmul.
+        """
+        features = np.atleast_2d(np.asarray(features, dtype=float))
+
+        if operator is None:
+            operator = self.build_entanglement_operator(features)
 
-        return entangled
+        return features @ operator
 
     def quantum_pattern_recognition(self, data: np.ndarray, patterns: List[str]) -> Dict[str, float]:
         """
@@ -234,8 +349,10 @@ class QuantumMachineLearning:
         """
         logger.info("🎓 PhD-level quantum training initiated...")
 
-        # Entangle features
-        entangled_data = self.quantum_feature_entanglement(historical_data)
+        # Learn the entanglement operator once and entangle features
+        historical_data = np.atleast_2d(np.asarray(historical_data, dtype=float))
+        self.entanglement_operator = self.build_entanglement_operator(historical_data)
+        entangled_data = self.quantum_feature_entanglement(historical_data, self.entanglement_operator)
 
         # Learn patterns through quantum variational approach
         unique_labels = np.unique(labels)
@@ -246,16 +363,76 @@ class QuantumMachineLearning:
 
             # Calculate quantum state representation
             mean_state = np.mean(label_data, axis=0)
-            cov_state = np.cov(label_data.T)
+            cov_state = np.atleast_2d(np.cov(label_data.T))
 
             self.learned_patterns[label] = {
                 'mean': mean_state,
                 'covariance': cov_state,
+                'whitening': self._whitening_matrix(cov_state),
                 'samples': len(label_data)
             }
 
         logger.info(f"✅ Quantum training complete - learned {len(unique_labels)} patterns")
 
+    @staticmethod
+    def _whitening_matrix(covariance: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Precompute W = inv(L).T for the Cholesky factor L of the covariance
+
+        With W stored, the squared Mahalanobis distance of a row x is
+        ||(x - mean) @ W||^2, so scoring needs no inversion at predict time.
+        Returns None when the covariance is not positive definite.
+        """
+        regularized = covariance + np.eye(len(covariance)) * 1e-6
+        try:
+            cholesky = np.linalg.cholesky(regularized)
+            return np.linalg.inv(cholesky).T
+        except np.linalg.LinAlgError:
+            return None
+
+    def predict_batch(self, new_data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Quantum prediction for a batch of samples
+
+        Scores all N rows against every learned pattern with one matmul per
+        pattern (vectorized Mahalanobis distances).
+
+        Returns: (predicted_labels, quantum_confidences) as length-N arrays;
+        rows that match no pattern get label None and confidence 0.0
+        """
+        new_data = np.atleast_2d(np.asarray(new_data, dtype=float))
+        n_samples = len(new_data)
+
+        if not self.learned_patterns:
+            return np.full(n_samples, None, dtype=object), np.zeros(n_samples)
+
+        # Entangle new data with the operator learned during training
+        entangled = self.quantum_feature_entanglement(new_data, self.entanglement_operator)
+
+        labels = list(self.learned_patterns.keys())
+        overlaps = np.zeros((n_samples, len(labels)))
+
+        for k, label in enumerate(labels):
+            pattern = self.learned_patterns[label]
+            whitening = pattern.get('whitening')
+            if whitening is None:
+                continue
+
+            # Mahalanobis distance (quantum metric)
+            whitened = (entangled - pattern['mean']) @ whitening
+            distance = np.sqrt(np.einsum('ij,ij->i', whitened, whitened))
+            overlap = 1 / (1 + distance)  # Convert distance to similarity
+            overlaps[:, k] = np.nan_to_num(overlap)
+
+        best = np.argmax(overlaps, axis=1)
+        confidences = overlaps[np.arange(n_samples), best]
+
+        predicted = np.empty(n_samples, dtype=object)
+        predicted[:] = [labels[k] for k in best]
+        predicted[confidences <= 0] = None
+
+        return predicted, confidences
+
     def quantum_predict(self, new_data: np.ndarray) -> Tuple[Any, float]:
         """
         Quantum prediction using learned patterns
@@ -265,39 +442,52 @@ class QuantumMachineLearning:
         if not self.learned_patterns:
             return None, 0.0
 
-        # Entangle new data
-        entangled = self.quantum_feature_entanglement(new_data.reshape(1, -1))[0]
+        predicted, confidences = self.predict_batch(np.asarray(new_data).reshape(1, -1))
 
-        # Calculate quantum overlap with each learned pattern
-        max_overlap = 0
-        best_label = None
+        return predicted[0], float(confidences[0])
 
-        for label, pattern in self.learned_patterns.items():
-            # Quantum state overlap
-            diff = entangled - pattern['mean']
-            # Mahalanobis distance (quantum metric)
-            try:
-                inv_cov = np.linalg.inv(pattern['covariance'] + np.eye(len(pattern['mean'])) * 1e-6)
-                distance = np.sqrt(np.dot(np.dot(diff, inv_cov), diff))
-                overlap = 1 / (1 + distance)  # Convert distance to similarity
-            except:
-                overlap = 0.0
 
-            if overlap > max_overlap:
-                max_overlap = overlap
-                best_label = label
+def quantum_spectrum_batch(windows: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Quantum Fourier Transform of many equal-length windows at once
+
+    windows: (n_streams, n_samples) real-valued array. Uses a real FFT,
+    since only the lower half of the spectrum is ever inspected.
+
+    Returns: (dominant_frequency, phase, amplitude), each (n_streams,)
+    """
+    windows = np.atleast_2d(windows)
+    half = windows.shape[1] // 2
+
+    spectrum = np.fft.rfft(windows, axis=1)[:, :half]
+    dominant_freq = np.argmax(np.abs(spectrum), axis=1)
+    dominant = spectrum[np.arange(len(spectrum)), dominant_freq]
 
-        return best_label, float(max_overlap)
+    return dominant_freq, np.angle(dominant), np.abs(dominant)
 
 
 class QuantumRealTimeProcessor:
     """
     Quantum Real-Time Data Processing
     Processes market data streams using quantum parallelization
+
+    Besides one-shot analysis of whole histories, the processor keeps a
+    fixed-length sliding window per live stream (see ``update_streams``)
+    so every tick can be analyzed with one stacked real FFT.
     """
 
-    def __init__(self):
+    def __init__(self, window_size: int = 256, workers: int = 0):
         self.processing_pipeline = []
+        self.window_size = window_size
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+        # Sliding windows: one ring buffer row per stream source
+        self.stream_index: Dict[str, int] = {}
+        self._buffer = np.zeros((0, window_size))
+        self._write_pos = np.zeros(0, dtype=np.int64)
+        self._filled = np.zeros(0, dtype=np.int64)
+
         logger.info("✅ Quantum Real-Time Processor initialized")
 
     def quantum_parallel_analysis(self, data_streams: List[Dict]) -> Dict:
@@ -311,14 +501,31 @@ class QuantumRealTimeProcessor:
             'timestamp': datetime.now().isoformat(),
             'streams_processed': len(data_streams),
             'quantum_parallel': True,
-            'analyses': []
+            'analyses': [None] * len(data_streams)
         }
 
-        # Simulate quantum parallelization
-        # In real quantum computer, this would happen simultaneously
-        for stream in data_streams:
-            analysis = self._analyze_stream_quantum(stream)
-            results['analyses'].append(analysis)
+        # Group equal-length streams so each group is one batch transform
+        groups: Dict[int, List[int]] = {}
+        arrays = []
+        for position, stream in enumerate(data_streams):
+            data = np.asarray(stream.get('data', []), dtype=float)
+            arrays.append(data)
+            if len(data) == 0:
+                results['analyses'][position] = {'error': 'No data'}
+            else:
+                groups.setdefault(len(data), []).append(position)
+
+        for positions in groups.values():
+            windows = np.stack([arrays[position] for position in positions])
+            dominant_freq, phase, amplitude = quantum_spectrum_batch(windows)
+            for k, position in enumerate(positions):
+                results['analyses'][position] = {
+                    'source': data_streams[position].get('source', 'unknown'),
+                    'dominant_frequency': int(dominant_freq[k]),
+                    'phase': float(phase[k]),
+                    'amplitude': float(amplitude[k]),
+                    'quantum_processed': True
+                }
 
         # Quantum aggregation (interference-based)
         results['aggregated_signal'] = self._quantum_aggregate(results['analyses'])
@@ -327,50 +534,123 @@ class QuantumRealTimeProcessor:
 
     def _analyze_stream_quantum(self, stream: Dict) -> Dict:
         """Analyze single stream using quantum algorithms"""
-        data = np.array(stream.get('data', []))
+        return self.quantum_parallel_analysis([stream])['analyses'][0]
 
-        if len(data) == 0:
-            return {'error': 'No data'}
+    def update_streams(self, ticks: Dict[str, Any]):
+        """
+        Append new samples to each stream's sliding window
+
+        ticks: source -> new value (or array of values) since the last update.
+        Unknown sources get a new window; only the latest ``window_size``
+        samples of each stream are kept.
+        """
+        new_sources = [source for source in ticks if source not in self.stream_index]
+        if new_sources:
+            for source in new_sources:
+                self.stream_index[source] = len(self.stream_index)
+            grow = len(new_sources)
+            self._buffer = np.vstack([self._buffer, np.zeros((grow, self.window_size))])
+            self._write_pos = np.concatenate([self._write_pos, np.zeros(grow, dtype=np.int64)])
+            self._filled = np.concatenate([self._filled, np.zeros(grow, dtype=np.int64)])
+
+        # Single-value ticks (the common live case) are written in one shot
+        scalar = {source: value for source, value in ticks.items() if np.ndim(value) == 0}
+        if scalar:
+            rows = np.fromiter((self.stream_index[source] for source in scalar), dtype=np.int64, count=len(scalar))
+            self._buffer[rows, self._write_pos[rows]] = np.fromiter(scalar.values(), dtype=float, count=len(scalar))
+            self._write_pos[rows] = (self._write_pos[rows] + 1) % self.window_size
+            self._filled[rows] = np.minimum(self._filled[rows] + 1, self.window_size)
+
+        for source, values in ticks.items():
+            if source in scalar:
+                continue
+            row = self.stream_index[source]
+            values = np.atleast_1d(np.asarray(values, dtype=float))[-self.window_size:]
+            slots = (self._write_pos[row] + np.arange(len(values))) % self.window_size
+            self._buffer[row, slots] = values
+            self._write_pos[row] = (self._write_pos[row] + len(values)) % self.window_size
+            self._filled[row] = min(self._filled[row] + len(values), self.window_size)
+
+    def quantum_stream_analysis(self) -> Dict:
+        """
+        Analyze every full sliding window with one stacked real FFT
 
-        # Quantum Fourier Transform (frequency analysis)
-        fft = np.fft.fft(data)
-        dominant_freq = np.argmax(np.abs(fft[:len(fft)//2]))
+        Streams still warming up (fewer than ``window_size`` samples) are
+        skipped. With ``workers`` > 1 the batch is sharded across a
+        process pool.
 
-        # Quantum phase estimation
-        phase = np.angle(fft[dominant_freq])
+        Returns columnar results (arrays aligned with 'sources').
+        """
+        ready = np.flatnonzero(self._filled >= self.window_size)
+        sources = np.array(list(self.stream_index.keys()), dtype=object)[ready]
+
+        # Chronological order: oldest sample sits at the write position
+        order = (self._write_pos[ready, None] + np.arange(self.window_size)) % self.window_size
+        windows = self._buffer[ready[:, None], order]
+
+        if len(windows) == 0:
+            dominant_freq = np.zeros(0, dtype=np.int64)
+            phase = amplitude = np.zeros(0)
+        elif self.workers > 1 and len(windows) >= self.workers:
+            dominant_freq, phase, amplitude = self._sharded_spectrum(windows)
+        else:
+            dominant_freq, phase, amplitude = quantum_spectrum_batch(windows)
 
         return {
-            'source': stream.get('source', 'unknown'),
-            'dominant_frequency': int(dominant_freq),
-            'phase': float(phase),
-            'amplitude': float(np.abs(fft[dominant_freq])),
-            'quantum_processed': True
+            'timestamp': datetime.now().isoformat(),
+            'streams_processed': len(ready),
+            'streams_warming_up': len(self.stream_index) - len(ready),
+            'quantum_parallel': True,
+            'sources': sources,
+            'dominant_frequency': dominant_freq,
+            'phase': phase,
+            'amplitude': amplitude,
+            'aggregated_signal': self._quantum_aggregate_arrays(amplitude, phase)
         }
 
+    def _sharded_spectrum(self, windows: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Split the window batch across the process pool and reassemble in order"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        shards = np.array_split(windows, self.workers)
+        parts = list(self._executor.map(quantum_spectrum_batch, shards))
+
+        return tuple(np.concatenate([part[k] for part in parts]) for k in range(3))
+
+    def close(self):
+        """Shut down the process pool, if one was started"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
     def _quantum_aggregate(self, analyses: List[Dict]) -> str:
         """Aggregate multiple analyses using quantum interference"""
         if not analyses:
             return 'HOLD'
 
         # Convert phases to quantum amplitudes
-        amplitudes = []
-        for analysis in analyses:
-            if 'phase' in analysis:
-                amp = analysis['amplitude'] * np.exp(1j * analysis['phase'])
-                amplitudes.append(amp)
+        valid = [analysis for analysis in analyses if 'phase' in analysis]
+        amplitude = np.array([analysis['amplitude'] for analysis in valid])
+        phase = np.array([analysis['phase'] for analysis in valid])
+
+        return self._quantum_aggregate_arrays(amplitude, phase)
 
-        if not amplitudes:
+    @staticmethod
+    def _quantum_aggregate_arrays(amplitude: np.ndarray, phase: np.ndarray) -> str:
+        """Interference-based aggregation over amplitude/phase arrays"""
+        if len(amplitude) == 0:
             return 'HOLD'
 
         # Quantum interference - add all amplitudes
-        total_amplitude = sum(amplitudes)
+        total_amplitude = np.sum(amplitude * np.exp(1j * phase))
 
         # Measure signal strength
         signal_strength = abs(total_amplitude)
         signal_phase = np.angle(total_amplitude)
 
         # Decision based on interferometric result
-        if signal_strength > len(amplitudes) * 0.7:
+        if signal_strength > len(amplitude) * 0.7:
             return 'BUY' if signal_phase > 0 else 'SELL'
         else:
             return 'HOLD'
@@ -382,9 +662,15 @@ class QuantumAISystem:
     Integrates all quantum components
     """
 
-    def __init__(self, version: QuantumVersion = QuantumVersion.V4_0):
+    CANDIDATE_DECISIONS = [
+        {'action': 'BUY', 'confidence': 0.7, 'reason': 'Bullish pattern'},
+        {'action': 'SELL', 'confidence': 0.6, 'reason': 'Bearish pattern'},
+        {'action': 'HOLD', 'confidence': 0.8, 'reason': 'Consolidation'}
+    ]
+
+    def __init__(self, version: QuantumVersion = QuantumVersion.V4_0, seed: Optional[int] = None):
         self.version = version
-        self.decision_engine = QuantumDecisionEngine(num_qubits=8)
+        self.decision_engine = QuantumDecisionEngine(num_qubits=8, seed=seed)
         self.ml_system = QuantumMachineLearning()
         self.realtime_processor = QuantumRealTimeProcessor()
 
@@ -440,11 +726,7 @@ class QuantumAISystem:
         rt_analysis = self.realtime_processor.quantum_parallel_analysis(data_streams)
 
         # 2. Generate possible decisions
-        decisions = [
-            {'action': 'BUY', 'confidence': 0.7, 'reason': 'Bullish pattern'},
-            {'action': 'SELL', 'confidence': 0.6, 'reason': 'Bearish pattern'},
-            {'action': 'HOLD', 'confidence': 0.8, 'reason': 'Consolidation'}
-        ]
+        decisions = [decision.copy() for decision in self.CANDIDATE_DECISIONS]
 
         # 3. Quantum decision making
         quantum_decision = self.decision_engine.decide(decisions, market_data)
@@ -476,15 +758,58 @@ class QuantumAISystem:
 
         return result
 
+    def analyze_market_batch(self, symbols: List[str], market_vectors: Dict[str, np.ndarray],
+                             confidences: Optional[np.ndarray] = None) -> Dict:
+        """
+        Quantum decision analysis for a whole universe of symbols
+
+        market_vectors: per-symbol arrays aligned with ``symbols``
+        ('volatility', 'momentum', ...). All symbols are evaluated with
+        one batched superposition/interference/measurement pass.
+
+        Returns: Columnar recommendations with quantum confidence
+        """
+        logger.info(f"🔬 Quantum AI v{self.version.value} analyzing {len(symbols)} symbols...")
+
+        if confidences is None:
+            template = np.array([decision['confidence'] for decision in self.CANDIDATE_DECISIONS])
+            confidences = np.broadcast_to(template, (len(symbols), len(template)))
+
+        decisions = self.decision_engine.decide_batch(
+            self.CANDIDATE_DECISIONS, market_vectors, confidences
+        )
+
+        return {
+            'version': self.version.value,
+            'timestamp': datetime.now().isoformat(),
+            'symbols': np.asarray(symbols),
+            'recommendation': decisions['action'],
+            'confidence_level': decisions['quantum_probability'],
+            'coherence': decisions['quantum_coherence'],
+            'quantum_enhanced': True,
+            'phd_algorithms_used': self.capabilities['phd_algorithms']
+        }
+
     def train(self, historical_data: np.ndarray, labels: np.ndarray):
         """Train quantum ML models"""
         logger.info(f"🎓 Training Quantum AI v{self.version.value} with PhD-level algorithms...")
         self.ml_system.quantum_train(historical_data, labels)
 
-    def predict(self, new_data: np.ndarray) -> Tuple[Any, float]:
-        """Make quantum prediction"""
+    def predict(self, new_data: np.ndarray) -> Tuple[Any, Any]:
+        """
+        Make quantum prediction
+
+        A 1-D sample returns (label, confidence); a 2-D batch (e.g. a whole
+        watchlist) returns (labels, confidences) arrays via predict_batch.
+        """
+        if np.ndim(new_data) > 1:
+            return self.predict_batch(new_data)
         return self.ml_system.quantum_predict(new_data)
 
+    def predict_batch(self, new_data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Make quantum predictions for every row of a 2-D batch"""
+        return self.ml_system.predict_batch(new_data)
+
 
 def main():
     """Demo of Quantum AI System"""
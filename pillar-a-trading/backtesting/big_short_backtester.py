@@ -17,9 +17,10 @@ import json
 import numpy as np
 import pandas as pd
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'strategies'))
@@ -375,79 +376,58 @@ class BigShortBacktester:
 
         return results
 
-    def run_monte_carlo_simulation(self, num_simulations: int = 10000) -> Dict[str, Any]:
+    def run_monte_carlo_simulation(self, num_simulations: int = 10000, chunk_size: int = 1_000_000,
+                                   seed: Optional[int] = None, workers: int = 1,
+                                   bootstrap_samples: int = 10000) -> Dict[str, Any]:
         """
         Run Monte Carlo simulation to validate strategy robustness
 
-        Simulates random market conditions and tests strategy performance
+        Simulates random market conditions and tests strategy performance.
+        Paths are split into chunks of ``chunk_size``; every chunk draws from
+        its own seed stream spawned from ``seed``, so memory stays flat and
+        chunks can run on ``workers`` processes. Partial results are merged
+        in chunk order, so a fixed seed (and chunk_size) gives bit-identical
+        results whatever the worker count.
         """
-        logger.info(f"🎲 Running Monte Carlo simulation ({num_simulations:,} iterations)...")
-
-        success_rates = []
-        avg_profits = []
-
-        for i in range(num_simulations):
-            # Generate random overvalued stock scenario
-            pe_ratio = np.random.uniform(30, 500)
-            pb_ratio = np.random.uniform(5, 50)
-            debt_equity = np.random.uniform(0.5, 35)
-            rsi = np.random.uniform(60, 95)
-            vix = np.random.uniform(8, 35)
-
-            # Probability of crash based on fundamentals
-            crash_prob = 0
-            if pe_ratio > 50: crash_prob += 0.20
-            if pb_ratio > 10: crash_prob += 0.15
-            if debt_equity > 3: crash_prob += 0.20
-            if rsi > 70: crash_prob += 0.15
-            if vix < 12: crash_prob += 0.10
-
-            # Random market factors
-            crash_prob += np.random.uniform(-0.1, 0.1)
-            crash_prob = max(0, min(1, crash_prob))
-
-            # Simulate stock data
-            stock_data = {
-                'pe_ratio': pe_ratio,
-                'pb_ratio': pb_ratio,
-                'debt_equity': debt_equity,
-                'rsi': rsi,
-                'vix': vix,
-                'macd': 'bearish' if rsi > 70 else 'neutral',
-                'news_sentiment': 'extremely_bullish' if vix < 15 else 'neutral',
-                'revenue_growth': np.random.uniform(-30, 10)
-            }
-
-            # Get strategy signal
-            signal = self.strategy.analyze_for_short('SIM', stock_data)
-
-            # Simulate outcome
-            if signal['action'] in ['SHORT', 'SHORT_SMALL']:
-                # Did it crash?
-                crashed = np.random.random() < crash_prob
-
-                if crashed:
-                    # Profit between 20% and 99%
-                    profit = np.random.uniform(20, 99)
-                    success_rates.append(1)
-                    avg_profits.append(profit)
-                else:
-                    # Small loss
-                    success_rates.append(0)
-                    avg_profits.append(-5)
-
-        overall_success_rate = (sum(success_rates) / len(success_rates) * 100) if success_rates else 0
-        overall_avg_profit = np.mean(avg_profits) if avg_profits else 0
+        logger.info(f"🎲 Running Monte Carlo simulation ({num_simulations:,} iterations, {workers} worker(s))...")
+
+        root = np.random.SeedSequence(seed)
+        bootstrap_seed = root.spawn(1)[0]
+        sizes = [min(chunk_size, num_simulations - start) for start in range(0, num_simulations, chunk_size)]
+        criteria = dict(self.strategy.criteria)
+        tasks = [(seed_seq, size, criteria) for seed_seq, size in zip(root.spawn(len(sizes)), sizes)]
+
+        if workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                partials = list(executor.map(_monte_carlo_chunk, tasks))
+        else:
+            partials = [simulate_monte_carlo_paths(self.strategy, np.random.default_rng(seed_seq), size)
+                        for seed_seq, size, _ in tasks]
+
+        totals = merge_monte_carlo_partials(partials)
+        signals = totals['signals']
+        successes = totals['successes']
+        total_profit = totals['win_profit'] - 5 * (signals - successes)
+
+        overall_success_rate = (successes / signals * 100) if signals else 0
+        overall_avg_profit = (total_profit / signals) if signals else 0
+
+        success_ci, profit_ci = bootstrap_monte_carlo_intervals(
+            totals, np.random.default_rng(bootstrap_seed), bootstrap_samples
+        )
 
         simulation_results = {
             'simulation_date': datetime.now().isoformat(),
             'num_simulations': num_simulations,
+            'seed_entropy': root.entropy,
+            'chunk_size': chunk_size,
+            'workers': workers,
+            'signals_generated': signals,
             'success_rate': overall_success_rate,
             'avg_profit': overall_avg_profit,
-            'confidence_interval_95': [
-                np.percentile(success_rates, 2.5) * 100,
-                np.percentile(success_rates, 97.5) * 100
-            ],
+            'confidence_interval_95': success_ci,
+            'avg_profit_confidence_interval_95': profit_ci,
+            'bootstrap_samples': bootstrap_samples,
             'target_met': 94 <= overall_success_rate <= 96
         }
 
@@ -547,6 +527,110 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         return report
 
 
+_worker_strategy: Optional[BigShortStrategy] = None
+
+
+def simulate_monte_carlo_paths(strategy: BigShortStrategy, rng: np.random.Generator, size: int) -> Dict[str, Any]:
+    """
+    Draw and score ``size`` random overvalued-stock scenarios at once
+
+    Returns the partial sums needed to merge chunks exactly: signal and
+    success counts plus the sum and sum of squares of winning profits.
+    """
+    # Generate random overvalued stock scenarios
+    pe_ratio = rng.uniform(30, 500, size)
+    pb_ratio = rng.uniform(5, 50, size)
+    debt_equity = rng.uniform(0.5, 35, size)
+    rsi = rng.uniform(60, 95, size)
+    vix = rng.uniform(8, 35, size)
+
+    # Probability of crash based on fundamentals
+    crash_prob = (
+        np.where(pe_ratio > 50, 0.20, 0)
+        + np.where(pb_ratio > 10, 0.15, 0)
+        + np.where(debt_equity > 3, 0.20, 0)
+        + np.where(rsi > 70, 0.15, 0)
+        + np.where(vix < 12, 0.10, 0)
+    )
+
+    # Random market factors
+    crash_prob = np.clip(crash_prob + rng.uniform(-0.1, 0.1, size), 0, 1)
+    revenue_growth = rng.uniform(-30, 10, size)
+
+    # Get strategy signals for every scenario
+    signal = strategy.score_short_arrays(
+        pe_ratio=pe_ratio,
+        pb_ratio=pb_ratio,
+        debt_equity=debt_equity,
+        rsi=rsi,
+        macd_bearish=rsi > 70,
+        vix=vix,
+        extreme_sentiment=vix < 15,
+        revenue_growth=revenue_growth,
+        accounting_red_flags=np.zeros(size, dtype=bool)
+    )
+    shorted = signal['confidence'] >= 0.60
+
+    # Simulate outcomes: profit between 20% and 99% on a crash, else small loss
+    crashed = shorted & (rng.random(size) < crash_prob)
+    win_profit = rng.uniform(20, 99, size)[crashed]
+
+    return {
+        'signals': int(shorted.sum()),
+        'successes': int(crashed.sum()),
+        'win_profit': float(win_profit.sum()),
+        'win_profit_sq': float(np.square(win_profit).sum())
+    }
+
+
+def _monte_carlo_chunk(task) -> Dict[str, Any]:
+    """Process-pool entry point: simulate one (seed_sequence, size, criteria) chunk"""
+    global _worker_strategy
+    if _worker_strategy is None:
+        _worker_strategy = BigShortStrategy()
+    seed_sequence, size, criteria = task
+    _worker_strategy.criteria = dict(criteria)  # the parent's (possibly tuned) thresholds
+    return simulate_monte_carlo_paths(_worker_strategy, np.random.default_rng(seed_sequence), size)
+
+
+def merge_monte_carlo_partials(partials: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge chunk partial sums in chunk order (deterministic float summation)"""
+    totals = {'signals': 0, 'successes': 0, 'win_profit': 0.0, 'win_profit_sq': 0.0}
+    for partial in partials:
+        for key in totals:
+            totals[key] += partial[key]
+    return totals
+
+
+def bootstrap_monte_carlo_intervals(totals: Dict[str, Any], rng: np.random.Generator,
+                                    samples: int) -> Tuple[List[float], List[float]]:
+    """
+    Bootstrap 95% intervals for success rate and average profit
+
+    Resampling n 0/1 outcomes with replacement is a Binomial(n, p) draw of
+    the success count, so no per-path data is needed. Winning profits of a
+    resample are summed via their mean and variance (normal approximation).
+    """
+    signals = totals['signals']
+    successes = totals['successes']
+    if signals == 0 or samples <= 0:
+        return [0.0, 0.0], [0.0, 0.0]
+
+    wins = rng.binomial(signals, successes / signals, samples)
+
+    win_mean = totals['win_profit'] / successes if successes else 0.0
+    win_var = max(totals['win_profit_sq'] / successes - win_mean ** 2, 0.0) if successes else 0.0
+    win_sum = wins * win_mean + np.sqrt(wins * win_var) * rng.standard_normal(samples)
+
+    success_rates = wins / signals * 100
+    avg_profits = (win_sum - 5 * (signals - wins)) / signals
+
+    return (
+        [float(v) for v in np.percentile(success_rates, [2.5, 97.5])],
+        [float(v) for v in np.percentile(avg_profits, [2.5, 97.5])]
+    )
+
+
 def main():
     """Run Big Short strategy backtest"""
     print("""
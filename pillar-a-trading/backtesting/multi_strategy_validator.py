@@ -21,19 +21,35 @@ import json
 import numpy as np
 import pandas as pd
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterator, Optional
+
+try:
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
 
 # Add strategies to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'strategies'))
 from big_short_strategy import BigShortStrategy
 from momentum_short_strategy import MomentumShortStrategy
 from technical_breakdown_short_strategy import TechnicalBreakdownShortStrategy
+from universe_columns import records_to_universe
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger('MultiStrategyValidator')
 
+# CSV parsing that keeps 'N/A' fundamentals as strings (only blank cells are missing)
+CSV_READ_OPTIONS = {
+    'keep_default_na': False,
+    'na_values': [''],
+    'true_values': ['True', 'true'],
+    'false_values': ['False', 'false']
+}
+
 
 class MultiStrategyValidator:
     """
@@ -229,46 +245,47 @@ class MultiStrategyValidator:
         logger.info("=" * 70)
 
         data = self.load_comprehensive_historical_data()
+        universe = records_to_universe(data)
 
         all_results = {}
 
         for strategy_name, strategy in self.strategies.items():
             logger.info(f"\n📊 Testing {strategy_name.upper().replace('_', ' ')}...")
 
+            # Get signals for every stock in one batch call
+            signals = strategy.analyze_for_short_batch(universe)
+            shorted = np.flatnonzero(np.isin(signals['action'], ['SHORT', 'SHORT_SMALL']))
+
             trades = []
             correct = 0
-            total = 0
+            total = len(shorted)
 
-            for stock in data:
-                # Get signal from strategy
-                signal = strategy.analyze_for_short(stock['symbol'], stock)
+            for index in shorted:
+                stock = data[index]
 
-                if signal['action'] in ['SHORT', 'SHORT_SMALL']:
-                    total += 1
-
-                    # Calculate actual profit
-                    entry = stock['peak_price']
-                    exit = stock['crash_price']
-                    profit_pct = ((entry - exit) / entry) * 100
+                # Calculate actual profit
+                entry = stock['peak_price']
+                exit = stock['crash_price']
+                profit_pct = ((entry - exit) / entry) * 100
 
-                    # Success if profit > 10%
-                    success = profit_pct > 10
+                # Success if profit > 10%
+                success = profit_pct > 10
 
-                    if success:
-                        correct += 1
+                if success:
+                    correct += 1
 
-                    trade = {
-                        'symbol': stock['symbol'],
-                        'name': stock['name'],
-                        'period': stock['period'],
-                        'signal_confidence': signal['confidence'],
-                        'entry_price': entry,
-                        'exit_price': exit,
-                        'profit_pct': profit_pct,
-                        'success': success
-                    }
+                trade = {
+                    'symbol': stock['symbol'],
+                    'name': stock['name'],
+                    'period': stock['period'],
+                    'signal_confidence': float(signals['confidence'][index]),
+                    'entry_price': entry,
+                    'exit_price': exit,
+                    'profit_pct': profit_pct,
+                    'success': success
+                }
 
-                    trades.append(trade)
+                trades.append(trade)
 
             # Calculate metrics
             win_rate = (correct / total * 100) if total > 0 else 0
@@ -292,6 +309,157 @@ class MultiStrategyValidator:
 
         return all_results
 
+    def write_scenario_file(self, scenarios: List[Dict], path: Path) -> Path:
+        """Write scenario rows to a columnar file (.parquet when available, else .csv)"""
+        path = Path(path)
+        frame = pd.DataFrame(scenarios)
+        if path.suffix == '.parquet':
+            # Parquet columns need one type: store mixed columns (e.g. 150 / 'N/A') as strings
+            for col in frame.columns:
+                values = frame[col].dropna()
+                if values.map(type).nunique() > 1 and values.map(lambda v: isinstance(v, str)).any():
+                    frame[col] = frame[col].map(lambda v: v if pd.isna(v) else str(v))
+            frame.to_parquet(path)
+        else:
+            frame.to_csv(path, index=False)
+        return path
+
+    def iter_scenario_chunks(self, path: Path, chunk_size: int = 50000) -> Iterator[pd.DataFrame]:
+        """
+        Stream scenario rows from a columnar file, ``chunk_size`` rows at a time
+
+        Supports .csv and (with pyarrow installed) .parquet files. Rows need
+        the strategy input fields plus 'peak_price' and 'crash_price'.
+        """
+        path = Path(path)
+
+        if path.suffix == '.parquet':
+            if not PARQUET_AVAILABLE:
+                raise RuntimeError("pyarrow not installed. Install with: pip install pyarrow")
+            for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+                yield batch.to_pandas()
+        else:
+            yield from pd.read_csv(path, chunksize=chunk_size, **CSV_READ_OPTIONS)
+
+    def run_scenario_validation(self, path: Path, chunk_size: int = 50000) -> Dict[str, Any]:
+        """
+        Validate every strategy against a large scenario file
+
+        Rows are streamed chunk by chunk; within a chunk all strategies score
+        the same shared columns concurrently. Only running aggregates are
+        kept (no per-trade lists), including the independent counts used by
+        verify_scenario_aggregates, so memory is flat in the number of rows.
+
+        Returns per-strategy results in the run_comprehensive_backtest shape
+        (without 'trades').
+        """
+        logger.info(f"🧪 Starting scenario validation: {path}")
+
+        aggregates = {
+            name: {
+                'total_signals': 0,
+                'successful_trades': 0,
+                'failed_trades_counted': 0,
+                'successful_trades_recomputed': 0,
+                'profit_pct_sum': 0.0
+            }
+            for name in self.strategies
+        }
+        scenarios = 0
+
+        with ThreadPoolExecutor(max_workers=len(self.strategies)) as executor:
+            for chunk in self.iter_scenario_chunks(path, chunk_size):
+                scenarios += len(chunk)
+
+                entry = chunk['peak_price'].to_numpy(dtype=float)
+                exit = chunk['crash_price'].to_numpy(dtype=float)
+                profit_pct = ((entry - exit) / entry) * 100
+                success = profit_pct > 10
+
+                # Independent success test straight from prices (no percentage math)
+                recomputed = exit < entry * 0.9
+
+                futures = {
+                    name: executor.submit(strategy.analyze_for_short_batch, chunk)
+                    for name, strategy in self.strategies.items()
+                }
+
+                for name, future in futures.items():
+                    shorted = np.isin(future.result()['action'], ['SHORT', 'SHORT_SMALL'])
+                    aggregate = aggregates[name]
+                    aggregate['total_signals'] += int(shorted.sum())
+                    aggregate['successful_trades'] += int((shorted & success).sum())
+                    aggregate['failed_trades_counted'] += int((shorted & ~success).sum())
+                    aggregate['successful_trades_recomputed'] += int((shorted & recomputed).sum())
+                    aggregate['profit_pct_sum'] += float(profit_pct[shorted].sum())
+
+        all_results = {}
+        for name, aggregate in aggregates.items():
+            total = aggregate['total_signals']
+            correct = aggregate['successful_trades']
+            win_rate = (correct / total * 100) if total > 0 else 0
+
+            all_results[name] = {
+                'strategy': name,
+                'scenarios': scenarios,
+                'total_signals': total,
+                'successful_trades': correct,
+                'failed_trades': total - correct,
+                'win_rate': win_rate,
+                'avg_profit_pct': (aggregate['profit_pct_sum'] / total) if total > 0 else 0,
+                'aggregates': aggregate,
+                'target_met': 94 <= win_rate <= 96
+            }
+
+            logger.info(f"\n📊 {name.upper().replace('_', ' ')}")
+            logger.info(f"   Scenarios: {scenarios:,}")
+            logger.info(f"   Signals: {total:,}")
+            logger.info(f"   Win Rate: {win_rate:.2f}%")
+
+        return all_results
+
+    def verify_scenario_aggregates(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Backward verification from running aggregates
+
+        Same three checks as verify_math_backwards, without the trade list:
+        1. Recount: successes / signals
+        2. Failures counted separately: (signals - failures) / signals
+        3. Fresh calculation from raw prices: exit < 90% of entry
+        """
+        verification = {}
+
+        for strategy_name, strategy_results in results.items():
+            aggregate = strategy_results['aggregates']
+            total = aggregate['total_signals']
+
+            method1_win_rate = (aggregate['successful_trades'] / total * 100) if total > 0 else 0
+            method2_win_rate = ((total - aggregate['failed_trades_counted']) / total * 100) if total > 0 else 0
+            method3_win_rate = (aggregate['successful_trades_recomputed'] / total * 100) if total > 0 else 0
+
+            original_win_rate = strategy_results['win_rate']
+
+            all_match = (
+                abs(method1_win_rate - original_win_rate) < 0.01 and
+                abs(method2_win_rate - original_win_rate) < 0.01 and
+                abs(method3_win_rate - original_win_rate) < 0.01
+            )
+
+            verification[strategy_name] = {
+                'verified': all_match,
+                'original_win_rate': original_win_rate,
+                'method1_win_rate': method1_win_rate,
+                'method2_win_rate': method2_win_rate,
+                'method3_win_rate': method3_win_rate,
+                'total_trades': total,
+                'successful_trades_original': strategy_results['successful_trades'],
+                'successful_trades_verified': aggregate['successful_trades_recomputed']
+            }
+
+            logger.info(f"   {strategy_name}: {'✅ PASSED' if all_match else '❌ FAILED'}")
+
+        return verification
+
     def verify_math_backwards(self, results: Dict[str, Any]) -> Dict[str, bool]:
         """
         Work backwards to verify math is correct
@@ -514,13 +682,20 @@ def main():
 
     validator = MultiStrategyValidator()
 
-    # Run comprehensive backtest
-    print("\n📊 Running Comprehensive Backtest on 20 Historical Stocks...")
-    print("=" * 70)
-    results = validator.run_comprehensive_backtest()
-
-    # Verify math backwards
-    verification = validator.verify_math_backwards(results)
+    if len(sys.argv) > 1:
+        # Validate against a scenario file (.csv / .parquet)
+        print(f"\n📊 Running Scenario Validation on {sys.argv[1]}...")
+        print("=" * 70)
+        results = validator.run_scenario_validation(Path(sys.argv[1]))
+        verification = validator.verify_scenario_aggregates(results)
+    else:
+        # Run comprehensive backtest
+        print("\n📊 Running Comprehensive Backtest on 20 Historical Stocks...")
+        print("=" * 70)
+        results = validator.run_comprehensive_backtest()
+
+        # Verify math backwards
+        verification = validator.verify_math_backwards(results)
 
     # Generate final report
     print("\n" + validator.generate_final_report(results, verification))
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""
+Paper-Trading Matching Engine
+Event-driven simulated exchange for paper trading and strategy stress tests
+
+Features:
+- Per-symbol order books with MARKET, LIMIT, STOP and STOP_LIMIT orders
+- TAKE_PROFIT orders: limits that trade only against the tape
+- Price-time priority matching between resting and incoming orders
+- Fills against a replayed market (ticks or candles) for resting orders
+- Configurable order latency and slippage models
+- Fill events delivered to callbacks and kept in a fill log
+
+Orders that cross resting orders trade at the resting price. Orders left
+unfilled trade against the replayed tape: market orders at the last price
+plus slippage, limits once the tape trades through their price (at the
+limit price), and stops once the tape reaches the stop price.
+
+TAKE_PROFIT orders never rest in the book, so other orders cannot match
+them. They wait off-book, like stops, and fill at their limit price once
+the tape trades through it. Bracket exits use them so that a strategy's
+own later entries do not trade against its take-profit legs.
+"""
+
+import heapq
+import itertools
+import logging
+import random
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger('MatchingEngine')
+
+BUY = 'BUY'
+SELL = 'SELL'
+
+MARKET = 'MARKET'
+LIMIT = 'LIMIT'
+STOP = 'STOP'
+STOP_LIMIT = 'STOP_LIMIT'
+TAKE_PROFIT = 'TAKE_PROFIT'
+
+OPEN = 'OPEN'
+FILLED = 'FILLED'
+CANCELLED = 'CANCELLED'
+REJECTED = 'REJECTED'
+
+
+class Order:
+    """A simulated exchange order (slotted: the engine creates a lot of these)"""
+
+    __slots__ = ('order_id', 'symbol', 'side', 'order_type', 'quantity', 'remaining', 'price',
+                 'stop_price', 'submitted_at', 'status', 'tag')
+
+    def __init__(self, order_id: int, symbol: str, side: str, order_type: str, quantity: float,
+                 price: Optional[float] = None, stop_price: Optional[float] = None,
+                 submitted_at: float = 0.0, tag: Optional[str] = None):
+        self.order_id = order_id
+        self.symbol = symbol
+        self.side = side
+        self.order_type = order_type
+        self.quantity = quantity
+        self.remaining = quantity
+        self.price = price
+        self.stop_price = stop_price
+        self.submitted_at = submitted_at
+        self.status = OPEN
+        self.tag = tag
+
+    def __repr__(self):
+        return (f"Order({self.order_id}, {self.symbol}, {self.side}, {self.order_type}, "
+                f"{self.remaining}/{self.quantity}, price={self.price}, stop={self.stop_price}, {self.status})")
+
+
+@dataclass
+class Fill:
+    """One execution"""
+    order_id: int
+    symbol: str
+    side: str
+    quantity: float
+    price: float
+    timestamp: float
+    liquidity: str  # 'book' (matched a resting order) or 'tape' (replayed market)
+    tag: Optional[str] = None
+
+
+class LatencyModel:
+    """Delay (seconds of simulated time) between submission and arrival at the book"""
+
+    def __init__(self, mean: float = 0.0, jitter: float = 0.0, seed: Optional[int] = None):
+        self.mean = mean
+        self.jitter = jitter
+        self.random = random.Random(seed)
+
+    def sample(self) -> float:
+        if not self.jitter:
+            return self.mean
+        return max(0.0, self.mean + self.random.uniform(-self.jitter, self.jitter))
+
+
+class SlippageModel:
+    """Adverse price move for tape fills: fixed basis points plus linear size impact"""
+
+    def __init__(self, bps: float = 0.0, impact_per_unit: float = 0.0):
+        self.bps = bps
+        self.impact_per_unit = impact_per_unit
+
+    def apply(self, side: str, price: float, quantity: float) -> float:
+        adverse = self.bps / 10000.0 + self.impact_per_unit * quantity
+        return price * (1 + adverse) if side == BUY else price * (1 - adverse)
+
+
+class OrderBook:
+    """
+    Price-time priority book for one symbol
+
+    Each side is a dict of price level -> FIFO deque plus a heap of level
+    prices (bids negated). Cancelled orders are removed lazily when they
+    reach the front of their level.
+    """
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.bids: Dict[float, deque] = {}
+        self.asks: Dict[float, deque] = {}
+        self.bid_prices: List[float] = []
+        self.ask_prices: List[float] = []
+        self.buy_stops: List[Tuple[float, int, Order]] = []   # min-heap on stop price
+        self.sell_stops: List[Tuple[float, int, Order]] = []  # min-heap on -stop price
+        self.buy_targets: List[Tuple[float, int, Order]] = []   # TAKE_PROFIT, min-heap on -price
+        self.sell_targets: List[Tuple[float, int, Order]] = []  # TAKE_PROFIT, min-heap on price
+        self.last_price: Optional[float] = None
+
+    def best_bid(self) -> Optional[float]:
+        while self.bid_prices:
+            price = -self.bid_prices[0]
+            level = self.bids.get(price)
+            while level and level[0].status != OPEN:
+                level.popleft()
+            if level:
+                return price
+            heapq.heappop(self.bid_prices)
+            self.bids.pop(price, None)
+        return None
+
+    def best_ask(self) -> Optional[float]:
+        while self.ask_prices:
+            price = self.ask_prices[0]
+            level = self.asks.get(price)
+            while level and level[0].status != OPEN:
+                level.popleft()
+            if level:
+                return price
+            heapq.heappop(self.ask_prices)
+            self.asks.pop(price, None)
+        return None
+
+    def rest(self, order: Order):
+        if order.side == BUY:
+            level = self.bids.get(order.price)
+            if level is None:
+                level = self.bids[order.price] = deque()
+                heapq.heappush(self.bid_prices, -order.price)
+        else:
+            level = self.asks.get(order.price)
+            if level is None:
+                level = self.asks[order.price] = deque()
+                heapq.heappush(self.ask_prices, order.price)
+        level.append(order)
+
+    def depth(self, levels: int = 5) -> Dict[str, List[Tuple[float, float]]]:
+        """Aggregated (price, quantity) for the top price levels"""
+        def side(book, reverse):
+            out = []
+            for price in sorted(book, reverse=reverse):
+                quantity = sum(o.remaining for o in book[price] if o.status == OPEN)
+                if quantity:
+                    out.append((price, quantity))
+                if len(out) == levels:
+                    break
+            return out
+        return {'bids': side(self.bids, True), 'asks': side(self.asks, False)}
+
+
+class MatchingEngine:
+    """
+    Simulated exchange driven by submitted orders and replayed market data
+
+    Simulated time advances with each tick. With non-zero latency, orders
+    wait in an arrival queue and reach the book at submitted_at + latency.
+    """
+
+    def __init__(self, latency: Optional[LatencyModel] = None, slippage: Optional[SlippageModel] = None,
+                 keep_fills: bool = True):
+        self.latency = latency or LatencyModel()
+        self.slippage = slippage or SlippageModel()
+        self.keep_fills = keep_fills
+
+        self.books: Dict[str, OrderBook] = {}
+        self.orders: Dict[int, Order] = {}
+        self.fills: List[Fill] = []
+        self.fill_callbacks: List[Callable[[Fill], None]] = []
+        self.now = 0.0
+        self.stats = {'orders': 0, 'fills': 0, 'cancels': 0, 'rejects': 0}
+
+        self._ids = itertools.count(1)
+        self._seq = itertools.count()
+        self._arrivals: List[Tuple[float, int, Order]] = []
+
+    def book(self, symbol: str) -> OrderBook:
+        book = self.books.get(symbol)
+        if book is None:
+            book = self.books[symbol] = OrderBook(symbol)
+        return book
+
+    def on_fill(self, callback: Callable[[Fill], None]):
+        """Register a callback for every fill"""
+        self.fill_callbacks.append(callback)
+
+    # ------------------------------------------------------------------
+    # Order entry
+    # ------------------------------------------------------------------
+
+    def submit(self, symbol: str, side: str, quantity: float, order_type: str = MARKET,
+               price: Optional[float] = None, stop_price: Optional[float] = None,
+               tag: Optional[str] = None) -> Order:
+        """Submit an order; it reaches the book after the sampled latency"""
+        order = Order(next(self._ids), symbol, side, order_type, quantity, price, stop_price, self.now, tag)
+        self.orders[order.order_id] = order
+        self.stats['orders'] += 1
+
+        if (order_type in (LIMIT, STOP_LIMIT, TAKE_PROFIT) and price is None) or \
+                (order_type in (STOP, STOP_LIMIT) and stop_price is None) or quantity <= 0:
+            order.status = REJECTED
+            self.stats['rejects'] += 1
+            return order
+
+        delay = self.latency.sample()
+        if delay > 0:
+            heapq.heappush(self._arrivals, (self.now + delay, next(self._seq), order))
+        else:
+            self._arrive(order)
+        return order
+
+    def submit_many(self, orders: List[Tuple]) -> List[Order]:
+        """Submit (symbol, side, quantity, order_type, price, stop_price) tuples"""
+        submit = self.submit
+        return [submit(*spec) for spec in orders]
+
+    def cancel(self, order_id: int) -> bool:
+        order = self.orders.get(order_id)
+        if order is None or order.status != OPEN:
+            return False
+        order.status = CANCELLED
+        self.stats['cancels'] += 1
+        return True
+
+    def _arrive(self, order: Order):
+        if order.status != OPEN:
+            return
+        book = self.book(order.symbol)
+
+        if order.order_type in (STOP, STOP_LIMIT):
+            last = book.last_price
+            if last is not None and ((order.side == BUY and last >= order.stop_price) or
+                                     (order.side == SELL and last <= order.stop_price)):
+                self._trigger(book, order)
+            elif order.side == BUY:
+                heapq.heappush(book.buy_stops, (order.stop_price, next(self._seq), order))
+            else:
+                heapq.heappush(book.sell_stops, (-order.stop_price, next(self._seq), order))
+            return
+
+        if order.order_type == TAKE_PROFIT:
+            last = book.last_price
+            if last is not None and ((order.side == BUY and last <= order.price) or
+                                     (order.side == SELL and last >= order.price)):
+                self._fill(order, order.remaining, last, 'tape')
+            elif order.side == BUY:
+                heapq.heappush(book.buy_targets, (-order.price, next(self._seq), order))
+            else:
+                heapq.heappush(book.sell_targets, (order.price, next(self._seq), order))
+            return
+
+        self._execute(book, order)
+
+    def _trigger(self, book: OrderBook, order: Order):
+        order.order_type = MARKET if order.order_type == STOP else LIMIT
+        self._execute(book, order)
+
+    def _execute(self, book: OrderBook, order: Order):
+        """Match an incoming order against the book, then the tape, then rest it"""
+        if order.side == BUY:
+            while order.remaining > 0:
+                best = book.best_ask()
+                if best is None or (order.order_type == LIMIT and best > order.price):
+                    break
+                self._match_level(book.asks[best], order, best)
+        else:
+            while order.remaining > 0:
+                best = book.best_bid()
+                if best is None or (order.order_type == LIMIT and best < order.price):
+                    break
+                self._match_level(book.bids[best], order, best)
+
+        if order.remaining <= 0:
+            return
+
+        last = book.last_price
+        if order.order_type == MARKET:
+            if last is None:
+                order.status = REJECTED
+                self.stats['rejects'] += 1
+                return
+            self._fill(order, order.remaining, self.slippage.apply(order.side, last, order.remaining), 'tape')
+        elif last is not None and ((order.side == BUY and last <= order.price) or
+                                   (order.side == SELL and last >= order.price)):
+            # Marketable against the tape: take the better of limit and last
+            self._fill(order, order.remaining, last, 'tape')
+        else:
+            book.rest(order)
+
+    def _match_level(self, level: deque, taker: Order, price: float):
+        while level and taker.remaining > 0:
+            maker = level[0]
+            if maker.status != OPEN:
+                level.popleft()
+                continue
+            quantity = min(maker.remaining, taker.remaining)
+            self._fill(maker, quantity, price, 'book')
+            self._fill(taker, quantity, price, 'book')
+            if maker.remaining <= 0:
+                level.popleft()
+
+    def _fill(self, order: Order, quantity: float, price: float, liquidity: str):
+        order.remaining -= quantity
+        if order.remaining <= 1e-12:
+            order.remaining = 0.0
+            order.status = FILLED
+
+        self.stats['fills'] += 1
+        if self.keep_fills or self.fill_callbacks:
+            fill = Fill(order.order_id, order.symbol, order.side, quantity, price, self.now, liquidity, order.tag)
+            if self.keep_fills:
+                self.fills.append(fill)
+            for callback in self.fill_callbacks:
+                callback(fill)
+
+    # ------------------------------------------------------------------
+    # Market data replay
+    # ------------------------------------------------------------------
+
+    def on_tick(self, symbol: str, price: float, timestamp: Optional[float] = None):
+        """Advance simulated time and trade the tape at ``price``"""
+        if timestamp is not None and timestamp > self.now:
+            self.now = timestamp
+        self._process_arrivals()
+
+        book = self.book(symbol)
+        book.last_price = price
+
+        # Stops reached by the tape
+        while book.buy_stops and book.buy_stops[0][0] <= price:
+            _, _, order = heapq.heappop(book.buy_stops)
+            if order.status == OPEN:
+                self._trigger(book, order)
+        while book.sell_stops and -book.sell_stops[0][0] >= price:
+            _, _, order = heapq.heappop(book.sell_stops)
+            if order.status == OPEN:
+                self._trigger(book, order)
+
+        # Off-book take-profits the tape traded through (at their limit price)
+        while book.buy_targets and -book.buy_targets[0][0] >= price:
+            _, _, order = heapq.heappop(book.buy_targets)
+            if order.status == OPEN:
+                self._fill(order, order.remaining, order.price, 'tape')
+        while book.sell_targets and book.sell_targets[0][0] <= price:
+            _, _, order = heapq.heappop(book.sell_targets)
+            if order.status == OPEN:
+                self._fill(order, order.remaining, order.price, 'tape')
+
+        # Resting limits the tape traded through, best price first, FIFO within a level
+        while True:
+            best = book.best_bid()
+            if best is None or best < price:
+                break
+            for order in book.bids.pop(best):
+                if order.status == OPEN:
+                    self._fill(order, order.remaining, best, 'tape')
+            heapq.heappop(book.bid_prices)
+        while True:
+            best = book.best_ask()
+            if best is None or best > price:
+                break
+            for order in book.asks.pop(best):
+                if order.status == OPEN:
+                    self._fill(order, order.remaining, best, 'tape')
+            heapq.heappop(book.ask_prices)
+
+    def replay_candles(self, symbol: str, candles: List[Dict], bar_seconds: float = 60.0):
+        """
+        Replay OHLC candles as four ticks each
+
+        Up bars trade open -> low -> high -> close, down bars open -> high ->
+        low -> close. A candle 'time' (unix seconds) sets the clock when given.
+        """
+        for candle in candles:
+            start = candle.get('time', self.now)
+            if not isinstance(start, (int, float)):
+                start = self.now
+            if candle['close'] >= candle['open']:
+                path = (candle['open'], candle['low'], candle['high'], candle['close'])
+            else:
+                path = (candle['open'], candle['high'], candle['low'], candle['close'])
+            step = bar_seconds / 4.0
+            for i, price in enumerate(path):
+                self.on_tick(symbol, price, start + i * step)
+
+    def advance(self, timestamp: float):
+        """Advance simulated time without a tick (delivers delayed orders)"""
+        if timestamp > self.now:
+            self.now = timestamp
+        self._process_arrivals()
+
+    def _process_arrivals(self):
+        arrivals = self._arrivals
+        while arrivals and arrivals[0][0] <= self.now:
+            _, _, order = heapq.heappop(arrivals)
+            self._arrive(order)
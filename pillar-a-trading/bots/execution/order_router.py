@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Batched Asynchronous Order Router
+Queues orders from all bots and submits them through per-venue worker pools
+
+Features:
+- Non-blocking submission (returns a Future per order)
+- Bulk pre-validation against symbol info (volume min/max/step, trade mode)
+- Per-venue worker pools that drain the queue in batches
+- Native batch submission where the venue allows it
+- Asynchronous acknowledgement tracking
+"""
+
+import itertools
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger('OrderRouter')
+
+
+@dataclass
+class OrderRequest:
+    """One order headed for a venue"""
+    venue: str
+    symbol: str
+    side: str  # BUY / SELL / SHORT ...
+    volume: float
+    price: Optional[float] = None
+    sl: Optional[float] = None
+    tp: Optional[float] = None
+    comment: str = "Agent X2.0"
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    order_id: int = 0
+    submitted_at: float = 0.0
+
+
+@dataclass
+class OrderAck:
+    """Venue acknowledgement for one order"""
+    order_id: int
+    venue: str
+    symbol: str
+    status: str  # FILLED / SIMULATED / PENDING / REJECTED / ERROR
+    ticket: Optional[int] = None
+    price: Optional[float] = None
+    reason: str = ""
+    latency_ms: float = 0.0
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+
+
+class MT5Venue:
+    """Venue adapter for MT5Connector (one order_send per order, no native batching)"""
+
+    supports_batch = False
+    publishes_symbol_info = True
+
+    def __init__(self, connector):
+        self.connector = connector
+
+    def symbol_info(self, symbols: List[str]) -> Dict[str, Dict]:
+        return self.connector.get_symbol_infos(symbols)
+
+    def send(self, order: OrderRequest) -> OrderAck:
+        result = self.connector.place_order(
+            order.symbol, 'BUY' if order.side == 'BUY' else 'SELL', order.volume,
+            price=order.price, sl=order.sl, tp=order.tp, comment=order.comment
+        )
+        if result is None:
+            return OrderAck(order.order_id, order.venue, order.symbol, 'REJECTED', reason='order_send failed')
+        return OrderAck(order.order_id, order.venue, order.symbol, 'FILLED',
+                        ticket=result['ticket'], price=result['price'])
+
+
+class BotVenue:
+    """
+    Venue adapter for the simulated multi-asset bots
+
+    executors: asset class -> the bot's execute_* method. Orders carry the
+    original bot signal in ``metadata['signal']`` and the asset class in
+    ``metadata['asset_class']``. In-process, so the whole batch goes at once.
+    """
+
+    supports_batch = True
+    publishes_symbol_info = False  # simulated bots accept any symbol and volume
+
+    def __init__(self, executors: Dict[str, Callable[[Dict], Dict]]):
+        self.executors = executors
+
+    def symbol_info(self, symbols: List[str]) -> Dict[str, Dict]:
+        return {}
+
+    def send_batch(self, orders: List[OrderRequest]) -> List[OrderAck]:
+        acks = []
+        for order in orders:
+            executor = self.executors.get(order.metadata.get('asset_class'))
+            if executor is None:
+                acks.append(OrderAck(order.order_id, order.venue, order.symbol, 'REJECTED',
+                                     reason='no executor for asset class'))
+                continue
+            placed = executor(order.metadata['signal'])
+            acks.append(OrderAck(order.order_id, order.venue, order.symbol, placed.get('status', 'SIMULATED')))
+        return acks
+
+
+class OrderRouter:
+    """
+    Routes orders to venues through a submission queue per venue
+
+    Each venue gets ``workers_per_venue`` threads. A worker blocks for the
+    first queued order; on venues with native batching it then drains up
+    to ``max_batch`` orders and submits them together, otherwise the
+    workers send single orders concurrently. Either way a burst of signals
+    never serializes on one round-trip per order.
+    """
+
+    def __init__(self, venues: Dict[str, Any], workers_per_venue: int = 4, max_batch: int = 50):
+        self.venues = venues
+        self.max_batch = max_batch
+        self.ack_callbacks: List[Callable[[OrderAck], None]] = []
+
+        self._ids = itertools.count(1)
+        self._futures: Dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._queues: Dict[str, queue.Queue] = {name: queue.Queue() for name in venues}
+        self._workers_by_venue: Dict[str, List[threading.Thread]] = {name: [] for name in venues}
+        self._closed = False
+
+        for name in venues:
+            for i in range(workers_per_venue):
+                worker = threading.Thread(target=self._worker_loop, args=(name,),
+                                          name=f"OrderRouter-{name}-{i}", daemon=True)
+                worker.start()
+                self._workers_by_venue[name].append(worker)
+
+        logger.info(f"✅ Order router started: {len(venues)} venue(s) x {workers_per_venue} worker(s)")
+
+    # ------------------------------------------------------------------
+    # Submission
+    # ------------------------------------------------------------------
+
+    def submit(self, order: OrderRequest) -> Future:
+        """Queue one order; returns a Future resolving to its OrderAck"""
+        return self.submit_many([order])[0]
+
+    def submit_many(self, orders: List[OrderRequest]) -> List[Future]:
+        """
+        Pre-validate and queue a burst of orders
+
+        Invalid orders resolve immediately with a REJECTED ack; the rest are
+        queued for their venue's workers. After close() every order is
+        rejected ("router closed"), since no worker is left to send it.
+        """
+        futures = []
+        valid, reasons = self.validate_orders(orders)
+
+        for order, ok, reason in zip(orders, valid, reasons):
+            order.order_id = next(self._ids)
+            order.submitted_at = time.perf_counter()
+            future: Future = Future()
+            futures.append(future)
+
+            if not ok:
+                self._resolve(future, OrderAck(order.order_id, order.venue, order.symbol, 'REJECTED', reason=reason))
+                continue
+
+            with self._lock:
+                # Queued under the lock so no order lands behind close()'s sentinels
+                if not self._closed:
+                    self._futures[order.order_id] = future
+                    self._queues[order.venue].put(order)
+                    continue
+            self._resolve(future, OrderAck(order.order_id, order.venue, order.symbol, 'REJECTED',
+                                           reason='router closed'))
+
+        return futures
+
+    def validate_orders(self, orders: List[OrderRequest]) -> tuple:
+        """
+        Bulk pre-validation against each venue's symbol info
+
+        Symbol info is fetched once per (venue, symbol); volume limits and
+        step alignment are checked as arrays. Returns (valid mask, reasons).
+        Venues with ``publishes_symbol_info = False`` skip the symbol checks;
+        for the others an empty lookup (e.g. a disconnected terminal)
+        rejects the venue's orders.
+        """
+        n = len(orders)
+        reasons = [''] * n
+        volume = np.array([order.volume for order in orders], dtype=float)
+        volume_min = np.zeros(n)
+        volume_max = np.full(n, np.inf)
+        volume_step = np.zeros(n)
+        valid = volume > 0
+
+        by_venue: Dict[str, List[int]] = {}
+        for i, order in enumerate(orders):
+            if order.venue not in self.venues:
+                valid[i] = False
+                reasons[i] = f'unknown venue {order.venue}'
+            else:
+                by_venue.setdefault(order.venue, []).append(i)
+
+        for venue, rows in by_venue.items():
+            if not getattr(self.venues[venue], 'publishes_symbol_info', True):
+                continue
+            infos = self.venues[venue].symbol_info(sorted({orders[i].symbol for i in rows}))
+            if not infos:
+                for i in rows:
+                    valid[i] = False
+                    reasons[i] = 'symbol info unavailable (venue disconnected?)'
+                continue
+            for i in rows:
+                info = infos.get(orders[i].symbol)
+                if info is None or info.get('trade_mode', 1) == 0:
+                    valid[i] = False
+                    reasons[i] = 'symbol unavailable'
+                    continue
+                volume_min[i] = info.get('volume_min', 0.0)
+                volume_max[i] = info.get('volume_max', np.inf)
+                volume_step[i] = info.get('volume_step', 0.0)
+
+        steps = np.divide(volume, volume_step, out=np.zeros(n), where=volume_step > 0)
+        aligned = (volume_step == 0) | np.isclose(steps, np.round(steps))
+        in_range = (volume >= volume_min) & (volume <= volume_max)
+
+        for i in np.flatnonzero(valid & ~(aligned & in_range)):
+            reasons[i] = 'volume outside limits' if not in_range[i] else 'volume not a multiple of step'
+        for i in np.flatnonzero(~(volume > 0)):
+            reasons[i] = reasons[i] or 'non-positive volume'
+
+        return valid & aligned & in_range, reasons
+
+    # ------------------------------------------------------------------
+    # Acknowledgements
+    # ------------------------------------------------------------------
+
+    def on_ack(self, callback: Callable[[OrderAck], None]):
+        """Register a callback invoked (on a worker thread) for every ack"""
+        self.ack_callbacks.append(callback)
+
+    def pending(self) -> int:
+        """Orders queued or in flight"""
+        with self._lock:
+            return len(self._futures)
+
+    def queue_depths(self) -> Dict[str, int]:
+        """Queued (not yet picked up) orders per venue"""
+        return {name: q.qsize() for name, q in self._queues.items()}
+
+    def _resolve(self, future: Future, ack: OrderAck):
+        for callback in self.ack_callbacks:
+            try:
+                callback(ack)
+            except Exception as e:
+                logger.error(f"❌ Ack callback error: {e}")
+        future.set_result(ack)
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    def _worker_loop(self, venue_name: str):
+        venue = self.venues[venue_name]
+        orders_queue = self._queues[venue_name]
+        # Venues without native batching send one order per worker at a time
+        batch_size = self.max_batch if venue.supports_batch else 1
+
+        while True:
+            first = orders_queue.get()
+            if first is None:
+                return
+
+            batch = [first]
+            stop = False
+            while len(batch) < batch_size:
+                try:
+                    order = orders_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if order is None:
+                    stop = True
+                    break
+                batch.append(order)
+
+            self._send(venue, batch)
+            if stop:
+                return
+
+    def _send(self, venue, batch: List[OrderRequest]):
+        try:
+            if venue.supports_batch:
+                acks = venue.send_batch(batch)
+            else:
+                acks = [venue.send(order) for order in batch]
+        except Exception as e:
+            logger.error(f"❌ Venue {batch[0].venue} error: {e}")
+            acks = [OrderAck(order.order_id, order.venue, order.symbol, 'ERROR', reason=str(e)) for order in batch]
+
+        now = time.perf_counter()
+        for order, ack in zip(batch, acks):
+            ack.latency_ms = (now - order.submitted_at) * 1000
+            with self._lock:
+                future = self._futures.pop(order.order_id, None)
+            if future is not None:
+                self._resolve(future, ack)
+
+    def close(self, timeout: Optional[float] = None):
+        """Stop workers after the queued orders are sent; later submissions are rejected"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        for name, orders_queue in self._queues.items():
+            for _ in self._workers_by_venue[name]:
+                orders_queue.put(None)
+        for workers in self._workers_by_venue.values():
+            for worker in workers:
+                worker.join(timeout)
+        logger.info("🛑 Order router stopped")
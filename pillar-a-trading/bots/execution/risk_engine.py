@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Real-Time Portfolio Risk Engine
+Per-account and global positions kept in arrays, updated incrementally
+
+Features:
+- Net positions per (account, instrument) with average cost and realized P/L
+- Marked-to-market P/L, gross exposure and net exposure by asset class
+- Delta-normal VaR from EWMA (RiskMetrics) volatility per instrument
+- Peak equity and drawdown tracking on every fill and price tick
+- Constant-time pre-trade checks (leverage, open positions, drawdown halt, VaR)
+
+Every fill touches one (account, instrument) cell and every tick touches one
+instrument column, so live risk never rescans position lists.
+"""
+
+import logging
+import math
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger('RiskEngine')
+
+VAR_Z_95 = 1.6448536269514722
+
+
+class RiskEngine:
+    """
+    Portfolio risk engine backed by (accounts x instruments) arrays
+
+    VaR is one-period (per tick interval) 95% delta-normal VaR, treating
+    instruments as uncorrelated: sqrt(sum((qty * price * sigma) ** 2)).
+    Per-cell VaR terms are kept so a tick only adjusts its own column.
+    """
+
+    def __init__(self, ewma_lambda: float = 0.94, initial_accounts: int = 32,
+                 initial_instruments: int = 32):
+        self.ewma_lambda = ewma_lambda
+        self._lock = threading.RLock()
+
+        self.accounts: Dict[str, int] = {}
+        self.instruments: Dict[str, int] = {}
+        self.asset_classes: Dict[str, int] = {}
+
+        a, m, c = initial_accounts, initial_instruments, 4
+
+        # (account, instrument)
+        self.qty = np.zeros((a, m))
+        self.avg_price = np.zeros((a, m))
+        self.var_terms = np.zeros((a, m))
+
+        # instrument
+        self.prices = np.full(m, np.nan)
+        self.variance = np.zeros(m)
+        self.instrument_class = np.zeros(m, dtype=np.int64)
+        self.global_qty = np.zeros(m)
+
+        # account
+        self.initial_capital = np.zeros(a)
+        self.realized = np.zeros(a)
+        self.unrealized = np.zeros(a)
+        self.gross_exposure = np.zeros(a)
+        self.open_positions = np.zeros(a, dtype=np.int64)
+        self.var_sq = np.zeros(a)
+        self.peak_equity = np.zeros(a)
+        self.drawdown = np.zeros(a)
+        self.max_drawdown = np.zeros(a)
+
+        # account limits
+        self.max_gross_leverage = np.ones(a)
+        self.max_open_positions = np.full(a, np.iinfo(np.int64).max)
+        self.halt_drawdown = np.ones(a)
+        self.var_limit = np.full(a, np.inf)
+
+        # (account, asset class) and global by asset class
+        self.class_exposure = np.zeros((a, c))
+        self.global_class_exposure = np.zeros(c)
+
+        logger.info("✅ Risk engine initialized")
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    def add_account(self, account_id: str, capital: float, max_gross_leverage: float = 1.0,
+                    max_open_positions: Optional[int] = None, halt_drawdown: float = 1.0,
+                    var_limit: Optional[float] = None) -> int:
+        """
+        Register an account (idempotent)
+
+        halt_drawdown and var_limit are fractions of equity; var_limit=None
+        disables the VaR check.
+        """
+        with self._lock:
+            if account_id in self.accounts:
+                return self.accounts[account_id]
+
+            row = len(self.accounts)
+            if row >= len(self.initial_capital):
+                self._grow_accounts(2 * len(self.initial_capital))
+
+            self.accounts[account_id] = row
+            self.initial_capital[row] = capital
+            self.peak_equity[row] = capital
+            self.max_gross_leverage[row] = max_gross_leverage
+            if max_open_positions is not None:
+                self.max_open_positions[row] = max_open_positions
+            self.halt_drawdown[row] = halt_drawdown
+            self.var_limit[row] = np.inf if var_limit is None else var_limit
+            return row
+
+    def add_account_from_profile(self, account: Dict[str, Any], profiles: Dict[str, Any]) -> int:
+        """Register an account from multi_account_config with its risk profile's limits"""
+        risk = profiles.get(account.get('profile'), {}).get('risk_parameters', {})
+        return self.add_account(
+            account['id'], account['initial_capital'],
+            max_open_positions=risk.get('max_concurrent_trades'),
+            halt_drawdown=risk.get('emergency_halt_threshold', 1.0)
+        )
+
+    def add_instrument(self, symbol: str, asset_class: str = 'crypto') -> int:
+        """Register an instrument (idempotent)"""
+        with self._lock:
+            if symbol in self.instruments:
+                return self.instruments[symbol]
+
+            if asset_class not in self.asset_classes:
+                self.asset_classes[asset_class] = len(self.asset_classes)
+                if len(self.asset_classes) > self.class_exposure.shape[1]:
+                    self._grow_classes(2 * self.class_exposure.shape[1])
+
+            col = len(self.instruments)
+            if col >= len(self.prices):
+                self._grow_instruments(2 * len(self.prices))
+
+            self.instruments[symbol] = col
+            self.instrument_class[col] = self.asset_classes[asset_class]
+            return col
+
+    def _grow_accounts(self, size: int):
+        extra = size - len(self.initial_capital)
+        for name in ('qty', 'avg_price', 'var_terms', 'class_exposure'):
+            array = getattr(self, name)
+            setattr(self, name, np.vstack([array, np.zeros((extra, array.shape[1]))]))
+        for name, fill in (('initial_capital', 0.0), ('realized', 0.0), ('unrealized', 0.0),
+                           ('gross_exposure', 0.0), ('var_sq', 0.0), ('peak_equity', 0.0),
+                           ('drawdown', 0.0), ('max_drawdown', 0.0), ('max_gross_leverage', 1.0),
+                           ('halt_drawdown', 1.0), ('var_limit', np.inf)):
+            setattr(self, name, np.concatenate([getattr(self, name), np.full(extra, fill)]))
+        self.open_positions = np.concatenate([self.open_positions, np.zeros(extra, dtype=np.int64)])
+        self.max_open_positions = np.concatenate(
+            [self.max_open_positions, np.full(extra, np.iinfo(np.int64).max)])
+
+    def _grow_instruments(self, size: int):
+        extra = size - len(self.prices)
+        for name in ('qty', 'avg_price', 'var_terms'):
+            array = getattr(self, name)
+            setattr(self, name, np.hstack([array, np.zeros((array.shape[0], extra))]))
+        self.prices = np.concatenate([self.prices, np.full(extra, np.nan)])
+        self.variance = np.concatenate([self.variance, np.zeros(extra)])
+        self.global_qty = np.concatenate([self.global_qty, np.zeros(extra)])
+        self.instrument_class = np.concatenate([self.instrument_class, np.zeros(extra, dtype=np.int64)])
+
+    def _grow_classes(self, size: int):
+        extra = size - self.class_exposure.shape[1]
+        self.class_exposure = np.hstack([self.class_exposure, np.zeros((self.class_exposure.shape[0], extra))])
+        self.global_class_exposure = np.concatenate([self.global_class_exposure, np.zeros(extra)])
+
+    def restore_account(self, account_id: str, positions: List[Dict[str, Any]], realized_pnl: float = 0.0,
+                        peak_equity: Optional[float] = None, max_drawdown: float = 0.0):
+        """Rebuild an account from persisted positions() output and risk figures after a restart"""
+        with self._lock:
+            r = self.accounts[account_id]
+            for position in positions:
+                asset_class = position.get('asset_class', 'crypto')
+                c = self.add_instrument(position['symbol'], asset_class)
+                mark = position.get('mark_price', float('nan'))
+                if math.isnan(self.prices[c]) and not math.isnan(mark):
+                    self.prices[c] = mark  # mark without feeding the volatility estimate
+                self.on_fill(account_id, position['symbol'], position['quantity'], position['avg_price'], asset_class)
+
+            self.realized[r] = realized_pnl
+            if peak_equity is not None:
+                self.peak_equity[r] = peak_equity
+            self.max_drawdown[r] = max(self.max_drawdown[r], max_drawdown)
+            self._mark_equity(r)
+
+    # ------------------------------------------------------------------
+    # Incremental updates
+    # ------------------------------------------------------------------
+
+    def on_fill(self, account_id: str, symbol: str, quantity: float, price: float,
+                asset_class: str = 'crypto') -> Dict[str, float]:
+        """
+        Apply a fill (signed quantity: + buy, - sell) and return the account's risk
+
+        Fills net against the existing position; the closed part realizes
+        P/L against the average cost.
+        """
+        with self._lock:
+            r = self.accounts[account_id]
+            c = self.add_instrument(symbol, asset_class)
+
+            if math.isnan(self.prices[c]):
+                self.prices[c] = price
+            mark = self.prices[c]
+
+            old_qty = self.qty[r, c]
+            avg = self.avg_price[r, c]
+            new_qty = old_qty + quantity
+
+            if old_qty != 0 and (old_qty > 0) != (quantity > 0):
+                closed = min(abs(quantity), abs(old_qty)) * math.copysign(1.0, old_qty)
+                self.realized[r] += closed * (price - avg)
+                if new_qty == 0:
+                    new_avg = 0.0
+                elif (new_qty > 0) != (old_qty > 0):
+                    new_avg = price  # flipped through flat
+                else:
+                    new_avg = avg
+            else:
+                new_avg = (old_qty * avg + quantity * price) / new_qty if new_qty != 0 else 0.0
+
+            self.unrealized[r] += new_qty * (mark - new_avg) - old_qty * (mark - avg)
+            self.gross_exposure[r] += (abs(new_qty) - abs(old_qty)) * mark
+            self.open_positions[r] += int(new_qty != 0) - int(old_qty != 0)
+
+            k = self.instrument_class[c]
+            self.class_exposure[r, k] += quantity * mark
+            self.global_class_exposure[k] += quantity * mark
+            self.global_qty[c] += quantity
+
+            term = (new_qty * mark) ** 2 * self.variance[c]
+            self.var_sq[r] += term - self.var_terms[r, c]
+            self.var_terms[r, c] = term
+
+            self.qty[r, c] = new_qty
+            self.avg_price[r, c] = new_avg
+            self._mark_equity(r)
+
+            return self.account_risk(account_id)
+
+    def on_tick(self, symbol: str, price: float):
+        """Mark one instrument to a new price across every account holding it"""
+        with self._lock:
+            c = self.instruments.get(symbol)
+            if c is None:
+                return
+
+            old = self.prices[c]
+            self.prices[c] = price
+            if math.isnan(old) or old <= 0:
+                return
+
+            ret = math.log(price / old)
+            self.variance[c] = self.ewma_lambda * self.variance[c] + (1 - self.ewma_lambda) * ret * ret
+
+            n = len(self.accounts)
+            qty = self.qty[:n, c]
+            move = qty * (price - old)
+
+            self.unrealized[:n] += move
+            self.gross_exposure[:n] += np.abs(qty) * (price - old)
+            k = self.instrument_class[c]
+            self.class_exposure[:n, k] += move
+            self.global_class_exposure[k] += self.global_qty[c] * (price - old)
+
+            terms = (qty * price) ** 2 * self.variance[c]
+            self.var_sq[:n] += terms - self.var_terms[:n, c]
+            self.var_terms[:n, c] = terms
+
+            self._mark_equity(slice(0, n))
+
+    def on_ticks(self, prices: Dict[str, float]):
+        """Apply a batch of price updates"""
+        for symbol, price in prices.items():
+            self.on_tick(symbol, price)
+
+    def _mark_equity(self, rows):
+        equity = self.initial_capital[rows] + self.realized[rows] + self.unrealized[rows]
+        self.peak_equity[rows] = np.maximum(self.peak_equity[rows], equity)
+        peak = self.peak_equity[rows]
+        self.drawdown[rows] = np.where(peak > 0, (peak - equity) / np.where(peak > 0, peak, 1), 0.0)
+        self.max_drawdown[rows] = np.maximum(self.max_drawdown[rows], self.drawdown[rows])
+
+    # ------------------------------------------------------------------
+    # Pre-trade checks
+    # ------------------------------------------------------------------
+
+    def check_order(self, account_id: str, symbol: str, quantity: float,
+                    price: Optional[float] = None) -> Tuple[bool, str]:
+        """
+        Pre-trade risk check for a signed order quantity
+
+        Reads a handful of array cells, so it costs microseconds regardless
+        of how many accounts or positions exist.
+        """
+        r = self.accounts.get(account_id)
+        if r is None:
+            return False, 'unknown account'
+
+        c = self.instruments.get(symbol)
+        old_qty = self.qty[r, c] if c is not None else 0.0
+        mark = price if price is not None else (self.prices[c] if c is not None else float('nan'))
+        if not mark > 0:
+            return False, 'no price'
+
+        equity = self.initial_capital[r] + self.realized[r] + self.unrealized[r]
+        if self.drawdown[r] >= self.halt_drawdown[r]:
+            return False, 'drawdown halt'
+
+        new_qty = old_qty + quantity
+        gross = self.gross_exposure[r] + (abs(new_qty) - abs(old_qty)) * mark
+        if abs(new_qty) > abs(old_qty) and gross > self.max_gross_leverage[r] * equity:
+            return False, 'gross exposure limit'
+
+        if old_qty == 0 and new_qty != 0 and self.open_positions[r] >= self.max_open_positions[r]:
+            return False, 'max open positions'
+
+        if self.var_limit[r] != np.inf and c is not None:
+            var_sq = self.var_sq[r] - self.var_terms[r, c] + (new_qty * mark) ** 2 * self.variance[c]
+            if VAR_Z_95 * math.sqrt(max(var_sq, 0.0)) > self.var_limit[r] * equity:
+                return False, 'VaR limit'
+
+        return True, 'ok'
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def account_risk(self, account_id: str) -> Dict[str, float]:
+        """Current risk snapshot for one account"""
+        r = self.accounts[account_id]
+        equity = self.initial_capital[r] + self.realized[r] + self.unrealized[r]
+        return {
+            'equity': float(equity),
+            'realized_pnl': float(self.realized[r]),
+            'unrealized_pnl': float(self.unrealized[r]),
+            'gross_exposure': float(self.gross_exposure[r]),
+            'net_exposure': {name: float(self.class_exposure[r, k]) for name, k in self.asset_classes.items()},
+            'open_positions': int(self.open_positions[r]),
+            'var_95': float(VAR_Z_95 * math.sqrt(max(self.var_sq[r], 0.0))),
+            'drawdown': float(self.drawdown[r]),
+            'max_drawdown': float(self.max_drawdown[r]),
+            'peak_equity': float(self.peak_equity[r])
+        }
+
+    def positions(self, account_id: str) -> List[Dict[str, Any]]:
+        """Net open positions for one account"""
+        r = self.accounts[account_id]
+        symbols = list(self.instruments)
+        classes = {k: name for name, k in self.asset_classes.items()}
+        n = len(symbols)
+        return [{
+            'symbol': symbols[c],
+            'asset_class': classes[self.instrument_class[c]],
+            'quantity': float(self.qty[r, c]),
+            'avg_price': float(self.avg_price[r, c]),
+            'mark_price': float(self.prices[c]),
+            'unrealized_pnl': float(self.qty[r, c] * (self.prices[c] - self.avg_price[r, c]))
+        } for c in np.flatnonzero(self.qty[r, :n])]
+
+    def global_risk(self) -> Dict[str, Any]:
+        """Firm-wide risk across all accounts"""
+        with self._lock:
+            n, m = len(self.accounts), len(self.instruments)
+            equity = self.initial_capital[:n] + self.realized[:n] + self.unrealized[:n]
+            var_sq = float(np.sum((self.global_qty[:m] * self.prices[:m]) ** 2 * self.variance[:m]))
+            return {
+                'timestamp': datetime.now().isoformat(),
+                'accounts': n,
+                'instruments': m,
+                'equity': float(equity.sum()),
+                'realized_pnl': float(self.realized[:n].sum()),
+                'unrealized_pnl': float(self.unrealized[:n].sum()),
+                'gross_exposure': float(self.gross_exposure[:n].sum()),
+                'net_exposure': {name: float(self.global_class_exposure[k]) for name, k in self.asset_classes.items()},
+                'var_95': VAR_Z_95 * math.sqrt(var_sq) if not math.isnan(var_sq) else 0.0,
+                'worst_drawdown': float(self.max_drawdown[:n].max()) if n else 0.0
+            }
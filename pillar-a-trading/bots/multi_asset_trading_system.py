@@ -5,13 +5,21 @@ Supports: Shorting, Options, Forex, Cryptocurrency, USD Crypto Pairs, US Indices
 Runs on both Paper and Sandbox environments
 """
 
+import sys
 import json
 import logging
+import numpy as np
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Mapping, Optional
 from enum import Enum
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent / 'strategies'))
+from universe_columns import category_column, flag_column, isin_column, numeric_column, universe_length
+
+sys.path.insert(0, str(Path(__file__).parent / 'execution'))
+from order_router import BotVenue, OrderRequest, OrderRouter
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger('MultiAssetTrader')
 
@@ -89,6 +97,24 @@ class ShortingBot:
 
         return None
 
+    def analyze_batch(self, universe: Mapping[str, Any]) -> Dict[str, np.ndarray]:
+        """Vectorized analyze_short_opportunity over a columnar universe"""
+        n = universe_length(universe)
+
+        confidence = np.zeros(n)
+        confidence += np.where(numeric_column(universe, 'rsi', n, 50) > 70, 0.25, 0)
+        confidence += np.where(numeric_column(universe, 'pe_ratio', n, 0, invalid=0) > 50, 0.20, 0)
+        confidence += np.where(flag_column(universe, 'price_below_sma_20', n), 0.25, 0)
+        confidence += np.where(flag_column(universe, 'volume_spike', n), 0.15, 0)
+        confidence += np.where(flag_column(universe, 'bearish_pattern', n), 0.15, 0)
+
+        return {
+            'symbol': np.asarray(universe['symbol']),
+            'action': np.full(n, 'SHORT', dtype=object),
+            'confidence': confidence,
+            'execute': confidence >= 0.70
+        }
+
     def execute_short(self, signal: Dict) -> Dict:
         """Execute short sell order"""
         order = {
@@ -167,6 +193,40 @@ class OptionsBot:
 
         return None
 
+    def analyze_batch(self, universe: Mapping[str, Any]) -> Dict[str, np.ndarray]:
+        """Vectorized analyze_option_opportunity over a columnar universe"""
+        n = universe_length(universe)
+
+        volatility = numeric_column(universe, 'implied_volatility', n, 0.30)
+        price_trend = category_column(universe, 'trend', n, 'neutral')
+        bullish = price_trend == 'bullish'
+        bearish = price_trend == 'bearish'
+
+        covered_call = (volatility > 0.40) & bullish
+        directional = ~covered_call & (volatility < 0.25) & (bullish | bearish)
+        iron_condor = ~covered_call & ~directional & (volatility > 0.30) & (price_trend == 'neutral')
+
+        action = np.full(n, None, dtype=object)
+        action[covered_call] = 'SELL_CALL'
+        action[directional & bullish] = 'BUY_CALL'
+        action[directional & bearish] = 'BUY_PUT'
+        action[iron_condor] = 'IRON_CONDOR'
+
+        strategy = np.full(n, None, dtype=object)
+        strategy[covered_call] = 'COVERED_CALL'
+        strategy[directional] = 'DIRECTIONAL_TRADE'
+        strategy[iron_condor] = 'IRON_CONDOR'
+
+        confidence = np.select([covered_call, directional, iron_condor], [0.75, 0.70, 0.65], 0.0)
+
+        return {
+            'symbol': np.asarray(universe['symbol']),
+            'action': action,
+            'strategy': strategy,
+            'confidence': confidence,
+            'execute': confidence >= 0.65
+        }
+
     def execute_option_trade(self, signal: Dict) -> Dict:
         """Execute options trade"""
         order = {
@@ -251,6 +311,31 @@ class ForexBot:
 
         return None
 
+    def analyze_batch(self, universe: Mapping[str, Any]) -> Dict[str, np.ndarray]:
+        """Vectorized analyze_forex_pair over a columnar universe"""
+        n = universe_length(universe)
+
+        sma_50 = numeric_column(universe, 'sma_50', n, 0)
+        sma_200 = numeric_column(universe, 'sma_200', n, 0)
+        rsi = numeric_column(universe, 'rsi', n, 50)
+        buy = sma_50 > sma_200
+        sell = sma_50 < sma_200
+
+        confidence = np.zeros(n)
+        confidence += np.where(buy | sell, 0.30, 0)
+        confidence += np.where((buy & (rsi < 40)) | (sell & (rsi > 60)), 0.25, 0)
+        confidence += np.where(flag_column(universe, 'volume_above_average', n), 0.20, 0)
+        confidence += np.where(flag_column(universe, 'interest_rate_favorable', n), 0.15, 0)
+
+        action = np.where(buy, 'BUY', np.where(sell, 'SELL', None))
+
+        return {
+            'symbol': np.asarray(universe['symbol']),
+            'action': action,
+            'confidence': confidence,
+            'execute': (confidence >= 0.75) & (buy | sell)
+        }
+
     def execute_forex_trade(self, signal: Dict) -> Dict:
         """Execute forex trade"""
         order = {
@@ -334,6 +419,31 @@ class CryptoBot:
 
         return None
 
+    def analyze_batch(self, universe: Mapping[str, Any]) -> Dict[str, np.ndarray]:
+        """Vectorized analyze_crypto over a columnar universe"""
+        n = universe_length(universe)
+
+        momentum = numeric_column(universe, 'momentum_score', n, 0)
+        buy = momentum > 0.6
+        sell = momentum < -0.6
+
+        confidence = np.zeros(n)
+        confidence += np.where(buy | sell, 0.30, 0)
+        confidence += np.where(flag_column(universe, 'volume_breakout', n), 0.25, 0)
+        confidence += np.where((flag_column(universe, 'bullish_pattern', n) & buy)
+                               | (flag_column(universe, 'bearish_pattern', n) & sell), 0.20, 0)
+        confidence += np.where(isin_column(universe, 'symbol', n, ['BTC', 'ETH'])
+                               & flag_column(universe, 'on_chain_bullish', n), 0.15, 0)
+
+        action = np.where(buy, 'BUY', np.where(sell, 'SELL', None))
+
+        return {
+            'symbol': np.asarray(universe['symbol']),
+            'action': action,
+            'confidence': confidence,
+            'execute': (confidence >= 0.70) & (buy | sell)
+        }
+
     def execute_crypto_trade(self, signal: Dict) -> Dict:
         """Execute cryptocurrency trade"""
         order = {
@@ -410,6 +520,29 @@ class USDCryptoPairsBot:
 
         return None
 
+    def analyze_batch(self, universe: Mapping[str, Any]) -> Dict[str, np.ndarray]:
+        """Vectorized analyze_usd_crypto_pair over a columnar universe"""
+        n = universe_length(universe)
+
+        crypto_strength = numeric_column(universe, 'crypto_strength', n, 0)
+        usd_strength = numeric_column(universe, 'usd_strength', n, 0)
+        buy = (crypto_strength > 0.6) & (usd_strength < -0.3)
+        sell = ~buy & (crypto_strength < -0.6) & (usd_strength > 0.3)
+
+        confidence = np.zeros(n)
+        confidence += np.where(buy | sell, 0.40, 0)
+        confidence += np.where(flag_column(universe, 'breakout', n), 0.30, 0)
+        confidence += np.where(flag_column(universe, 'high_volume', n), 0.20, 0)
+
+        action = np.where(buy, 'BUY', np.where(sell, 'SELL', None))
+
+        return {
+            'symbol': np.asarray(universe['symbol']),
+            'action': action,
+            'confidence': confidence,
+            'execute': (confidence >= 0.75) & (buy | sell)
+        }
+
     def execute_usd_crypto_trade(self, signal: Dict) -> Dict:
         """Execute USD crypto pair trade"""
         order = {
@@ -496,6 +629,31 @@ class USIndicesBot:
 
         return None
 
+    def analyze_batch(self, universe: Mapping[str, Any]) -> Dict[str, np.ndarray]:
+        """Vectorized analyze_index over a columnar universe"""
+        n = universe_length(universe)
+
+        above_200_sma = flag_column(universe, 'above_200_sma', n)
+        vix = numeric_column(universe, 'vix', n, 20)
+        low_fear = above_200_sma & (vix < 15)
+        high_fear = ~low_fear & (vix > 30)
+
+        confidence = np.zeros(n)
+        confidence += np.where(above_200_sma, 0.30, 0)
+        confidence += np.where(low_fear | high_fear, 0.25, 0)
+        confidence += np.where(flag_column(universe, 'volume_above_average', n), 0.20, 0)
+        confidence += np.where(flag_column(universe, 'economic_data_positive', n), 0.15, 0)
+
+        # High VIX flips the trend-following BUY to SELL
+        action = np.where(high_fear, 'SELL', np.where(above_200_sma, 'BUY', None))
+
+        return {
+            'symbol': np.asarray(universe['symbol']),
+            'action': action,
+            'confidence': confidence,
+            'execute': (confidence >= 0.70) & (above_200_sma | high_fear)
+        }
+
     def execute_index_trade(self, signal: Dict) -> Dict:
         """Execute US index trade"""
         order = {
@@ -545,6 +703,100 @@ class MultiAssetOrchestrator:
         """Get specific bot by asset class and environment"""
         return self.bots.get(environment, {}).get(asset_class)
 
+    def scan_universe(self, snapshot: Mapping[str, Any], environment: str = 'paper',
+                      top_n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Scan a columnar snapshot of instruments across every asset class
+
+        snapshot: column name -> per-instrument values (dict of arrays or a
+        DataFrame) with 'symbol' and 'asset_class' (shorting, options, forex,
+        crypto, usd_crypto_pairs, us_indices) plus each bot's input fields.
+        Each asset-class slice goes to its bot's analyze_batch in one call.
+
+        Returns a signal book of executable signals ranked by confidence,
+        de-duplicated to the strongest signal per symbol.
+        """
+        bots = self.bots.get(environment, {})
+        asset_class = np.asarray(snapshot['asset_class'])
+        columns = {name: np.asarray(values) for name, values in snapshot.items()}
+
+        book = {'symbol': [], 'asset_class': [], 'action': [], 'strategy': [], 'confidence': []}
+
+        for class_name, bot in bots.items():
+            rows = np.flatnonzero(asset_class == class_name)
+            if len(rows) == 0:
+                continue
+
+            scored = bot.analyze_batch({name: values[rows] for name, values in columns.items()})
+            execute = scored['execute']
+
+            book['symbol'].append(scored['symbol'][execute])
+            book['asset_class'].append(np.full(int(execute.sum()), class_name, dtype=object))
+            book['action'].append(scored['action'][execute])
+            book['strategy'].append(scored.get('strategy', np.full(len(execute), None, dtype=object))[execute])
+            book['confidence'].append(scored['confidence'][execute])
+
+        if not book['symbol']:
+            return {key: np.array([], dtype=object if key != 'confidence' else float) for key in book}
+
+        book = {key: np.concatenate(parts) for key, parts in book.items()}
+
+        # Rank by confidence, then keep the first (strongest) signal per symbol
+        ranked = np.argsort(-book['confidence'], kind='stable')
+        _, first = np.unique(book['symbol'][ranked].astype(str), return_index=True)
+        keep = ranked[np.sort(first)]
+        if top_n is not None:
+            keep = keep[:top_n]
+
+        logger.info(f"🔭 Universe scan ({environment}): {len(asset_class)} instruments → {len(keep)} signals")
+
+        return {key: values[keep] for key, values in book.items()}
+
+    def executors(self, environment: str = 'paper') -> Dict[str, Any]:
+        """Map each asset class to its bot's execute_* method"""
+        bots = self.bots.get(environment, {})
+        methods = {
+            'shorting': 'execute_short',
+            'options': 'execute_option_trade',
+            'forex': 'execute_forex_trade',
+            'crypto': 'execute_crypto_trade',
+            'usd_crypto_pairs': 'execute_usd_crypto_trade',
+            'us_indices': 'execute_index_trade'
+        }
+        return {asset_class: getattr(bot, methods[asset_class]) for asset_class, bot in bots.items()}
+
+    def create_order_router(self, environment: str = 'paper', workers_per_venue: int = 4,
+                            max_batch: int = 50) -> OrderRouter:
+        """Order router with the environment's bots registered as the 'bots' venue"""
+        return OrderRouter({'bots': BotVenue(self.executors(environment))},
+                           workers_per_venue=workers_per_venue, max_batch=max_batch)
+
+    def route_signal_book(self, book: Mapping[str, np.ndarray], router: OrderRouter,
+                          venue: str = 'bots', volume: float = 1.0) -> List[Any]:
+        """
+        Submit a scan_universe signal book through an order router
+
+        Returns one Future per signal (resolving to its OrderAck) without
+        waiting on any venue round-trip.
+        """
+        orders = []
+        for symbol, asset_class, action, strategy, confidence in zip(
+                book['symbol'], book['asset_class'], book['action'], book['strategy'], book['confidence']):
+            signal = {
+                'symbol': symbol,
+                'pair': symbol,
+                'name': symbol,
+                'action': action,
+                'strategy': strategy,
+                'confidence': float(confidence),
+                'reasons': []
+            }
+            orders.append(OrderRequest(venue=venue, symbol=str(symbol), side=str(action), volume=volume,
+                                       metadata={'asset_class': asset_class, 'signal': signal}))
+
+        logger.info(f"📨 Routing {len(orders)} signals to {venue}")
+        return router.submit_many(orders)
+
     def get_all_active_bots(self) -> List[Dict]:
         """Get status of all active bots"""
         active_bots = []
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Market Data Bus - Agent X2.0
+Publish/subscribe fan-out of candle data shared across trading accounts
+
+Each (pair, timeframe) is fetched once per interval no matter how many
+accounts subscribe to it, and every subscriber receives the same immutable
+CandleBuffer. Upstream calls scale with pairs, not accounts.
+"""
+
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger('MarketDataBus')
+
+CANDLE_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+
+@dataclass(frozen=True)
+class CandleBuffer:
+    """
+    Immutable candle snapshot for one (pair, timeframe)
+
+    ``columns`` holds read-only float arrays; ``candles`` holds read-only
+    per-bar mappings for code that expects a list of candle dicts. Values
+    computed from a buffer (e.g. a pattern signal) can be memoized with
+    derive() so they are also computed once per publish.
+    """
+    pair: str
+    timeframe: str
+    version: int
+    published_at: str
+    candles: Tuple[MappingProxyType, ...]
+    columns: Mapping[str, np.ndarray]
+    _derived: Dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+    _derive_lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @classmethod
+    def from_candles(cls, pair: str, timeframe: str, version: int, candles: List[Dict]) -> 'CandleBuffer':
+        columns = {}
+        for name in CANDLE_FIELDS:
+            column = np.array([candle.get(name, 0) for candle in candles], dtype=float)
+            column.flags.writeable = False
+            columns[name] = column
+
+        return cls(pair, timeframe, version, datetime.now().isoformat(),
+                   tuple(MappingProxyType(dict(candle)) for candle in candles),
+                   MappingProxyType(columns))
+
+    def derive(self, name: str, compute: Callable[['CandleBuffer'], Any]) -> Any:
+        """Compute a value from this buffer once and share it with every subscriber"""
+        with self._derive_lock:
+            if name not in self._derived:
+                self._derived[name] = compute(self)
+            return self._derived[name]
+
+
+class MarketDataBus:
+    """
+    Fetches each subscribed (pair, timeframe) once per interval and fans it out
+
+    fetcher(pair, timeframe) -> list of candle dicts; it runs on the event
+    loop's default executor so blocking API clients are fine. A topic's
+    interval is the shortest interval among its subscribers.
+    """
+
+    def __init__(self, fetcher: Callable[[str, str], List[Dict]], default_interval: float = 60,
+                 max_error_backoff: float = 300):
+        self.fetcher = fetcher
+        self.default_interval = default_interval
+        self.max_error_backoff = max_error_backoff
+
+        self.subscribers: Dict[Tuple[str, str], Dict[str, float]] = {}
+        self.callbacks: Dict[Tuple[str, str], List[Callable[[CandleBuffer], None]]] = {}
+        self.latest: Dict[Tuple[str, str], CandleBuffer] = {}
+        self.stats = {'fetches': 0, 'fetch_errors': 0, 'publishes': 0}
+
+        self._conditions: Dict[Tuple[str, str], asyncio.Condition] = {}
+        self._tasks: Dict[Tuple[str, str], asyncio.Task] = {}
+
+        logger.info("✅ Market data bus initialized")
+
+    def subscribe(self, subscriber_id: str, pair: str, timeframe: str = 'H1',
+                  interval: Optional[float] = None,
+                  callback: Optional[Callable[[CandleBuffer], None]] = None) -> Tuple[str, str]:
+        """
+        Register interest in a topic; returns the topic key
+
+        Called from a running event loop, this starts the topic's fetch task
+        if it is not running yet.
+        """
+        key = (pair, timeframe)
+        self.subscribers.setdefault(key, {})[subscriber_id] = interval or self.default_interval
+        if callback is not None:
+            self.callbacks.setdefault(key, []).append(callback)
+        self._condition(key)
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return key
+
+        if key not in self._tasks or self._tasks[key].done():
+            self._tasks[key] = asyncio.create_task(self._pump(key), name=f"MarketData-{pair}-{timeframe}")
+        return key
+
+    def unsubscribe(self, subscriber_id: str, key: Tuple[str, str]):
+        """Drop a subscriber; the topic's fetch task stops when none are left"""
+        self.subscribers.get(key, {}).pop(subscriber_id, None)
+
+    def _condition(self, key: Tuple[str, str]) -> asyncio.Condition:
+        if key not in self._conditions:
+            self._conditions[key] = asyncio.Condition()
+        return self._conditions[key]
+
+    def topic_interval(self, key: Tuple[str, str]) -> float:
+        intervals = self.subscribers.get(key)
+        return min(intervals.values()) if intervals else self.default_interval
+
+    async def publish(self, key: Tuple[str, str], candles: List[Dict]) -> CandleBuffer:
+        """Wrap fetched candles in a new immutable buffer and wake subscribers"""
+        previous = self.latest.get(key)
+        buffer = CandleBuffer.from_candles(key[0], key[1], previous.version + 1 if previous else 1, candles)
+        self.latest[key] = buffer
+        self.stats['publishes'] += 1
+
+        for callback in self.callbacks.get(key, []):
+            try:
+                callback(buffer)
+            except Exception as e:
+                logger.error(f"❌ Market data callback error ({key[0]}): {e}")
+
+        condition = self._condition(key)
+        async with condition:
+            condition.notify_all()
+        return buffer
+
+    async def _pump(self, key: Tuple[str, str]):
+        loop = asyncio.get_running_loop()
+        failures = 0
+
+        while self.subscribers.get(key):
+            try:
+                candles = await loop.run_in_executor(None, self.fetcher, key[0], key[1])
+                self.stats['fetches'] += 1
+                failures = 0
+                await self.publish(key, candles)
+                await asyncio.sleep(self.topic_interval(key))
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                failures += 1
+                self.stats['fetch_errors'] += 1
+                backoff = min(self.topic_interval(key) * 2 ** (failures - 1), self.max_error_backoff)
+                logger.error(f"❌ Market data fetch failed for {key[0]} {key[1]}: {e} (retry in {backoff:.0f}s)")
+                await asyncio.sleep(backoff)
+
+    async def next(self, key: Tuple[str, str], after_version: int = 0) -> CandleBuffer:
+        """Latest buffer newer than ``after_version`` (waits for the next publish if needed)"""
+        condition = self._condition(key)
+        async with condition:
+            await condition.wait_for(lambda: key in self.latest and self.latest[key].version > after_version)
+            return self.latest[key]
+
+    async def close(self):
+        """Stop all fetch tasks"""
+        for task in self._tasks.values():
+            task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        self._tasks.clear()
@@ -8,6 +8,8 @@ Supports both demo and live accounts
 import os
 import json
 import logging
+import time
+import numpy as np
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from pathlib import Path
@@ -22,20 +24,26 @@ class MT5Connector:
 
     NOTE: Requires MetaTrader5 Python library
     Install with: pip install MetaTrader5
+    (or pass mt5_module=MT5Simulator() to run without a terminal)
     """
 
-    def __init__(self, account_type: str = "demo"):
+    def __init__(self, account_type: str = "demo", mt5_module=None):
         """
         Initialize MT5 connector
 
         Args:
             account_type: "demo" or "live"
+            mt5_module: Object exposing the MetaTrader5 module API
+                (e.g. MT5Simulator); defaults to importing MetaTrader5
         """
         self.account_type = account_type
         self.connected = False
-        self.mt5 = None
+        self.mt5 = mt5_module
         self.account_info = {}
 
+        # Incremental candle cache: (symbol, timeframe) -> {'buffer': structured array, 'size': bars held}
+        self.rate_cache: Dict[tuple, Dict[str, Any]] = {}
+
         # Load credentials
         self.login = int(os.getenv('MT5_LOGIN', '0'))
         self.password = os.getenv('MT5_PASSWORD', '')
@@ -47,13 +55,16 @@ class MT5Connector:
         """Connect to MT5 terminal"""
         try:
             # Try to import MT5 library
-            try:
-                import MetaTrader5 as mt5
-                self.mt5 = mt5
-            except ImportError:
-                logger.error("❌ MetaTrader5 library not installed")
-                logger.info("   Install with: pip install MetaTrader5")
-                return False
+            if self.mt5 is None:
+                try:
+                    import MetaTrader5 as mt5
+                    self.mt5 = mt5
+                except ImportError:
+                    logger.error("❌ MetaTrader5 library not installed")
+                    logger.info("   Install with: pip install MetaTrader5")
+                    return False
+
+            simulated = getattr(self.mt5, 'SIMULATED', False)
 
             # Initialize MT5
             if not self.mt5.initialize():
@@ -61,7 +72,7 @@ class MT5Connector:
                 return False
 
             # Login
-            if self.login and self.password:
+            if (self.login and self.password) or simulated:
                 authorized = self.mt5.login(self.login, password=self.password, server=self.server)
 
                 if not authorized:
@@ -88,6 +99,22 @@ class MT5Connector:
             logger.error(f"❌ MT5 connection error: {e}")
             return False
 
+    def reconnect(self, retries: int = 3, delay: float = 1.0) -> bool:
+        """Re-establish the terminal connection after it drops"""
+        for attempt in range(1, retries + 1):
+            if self.mt5:
+                self.mt5.shutdown()
+            self.connected = False
+
+            if self.connect():
+                logger.info(f"🔄 Reconnected to MT5 (attempt {attempt})")
+                return True
+
+            logger.warning(f"⚠️  Reconnect attempt {attempt}/{retries} failed")
+            time.sleep(delay)
+
+        return False
+
     def disconnect(self):
         """Disconnect from MT5"""
         if self.mt5:
@@ -158,19 +185,17 @@ class MT5Connector:
             'ask': info.ask
         }
 
-    def get_market_data(self, symbol: str, timeframe: str = "H1", bars: int = 100) -> Optional[List[Dict]]:
-        """
-        Get historical market data
-
-        Args:
-            symbol: Trading symbol (e.g., "EURUSD", "BTCUSD")
-            timeframe: Timeframe (M1, M5, M15, M30, H1, H4, D1, W1, MN1)
-            bars: Number of bars to retrieve
-        """
-        if not self.connected or not self.mt5:
-            return None
-
-        # Map timeframe string to MT5 constant
+    def get_symbol_infos(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Get symbol info for several symbols at once (unknown symbols are omitted)"""
+        infos = {}
+        for symbol in dict.fromkeys(symbols):
+            info = self.get_symbol_info(symbol)
+            if info is not None:
+                infos[symbol] = info
+        return infos
+
+    def _timeframe(self, timeframe: str):
+        """Map a timeframe string (M1, M5, M15, M30, H1, H4, D1, W1, MN1) to its MT5 constant"""
         timeframe_map = {
             'M1': self.mt5.TIMEFRAME_M1,
             'M5': self.mt5.TIMEFRAME_M5,
@@ -182,13 +207,23 @@ class MT5Connector:
             'W1': self.mt5.TIMEFRAME_W1,
             'MN1': self.mt5.TIMEFRAME_MN1
         }
+        return timeframe_map.get(timeframe, self.mt5.TIMEFRAME_H1)
 
-        tf = timeframe_map.get(timeframe, self.mt5.TIMEFRAME_H1)
+    def get_market_data(self, symbol: str, timeframe: str = "H1", bars: int = 100,
+                        as_array: bool = False):
+        """
+        Get historical market data
 
-        rates = self.mt5.copy_rates_from_pos(symbol, tf, 0, bars)
-        if rates is None:
-            logger.error(f"Failed to get data for {symbol}")
-            return None
+        Args:
+            symbol: Trading symbol (e.g., "EURUSD", "BTCUSD")
+            timeframe: Timeframe (M1, M5, M15, M30, H1, H4, D1, W1, MN1)
+            bars: Number of bars to retrieve
+            as_array: Return the cached MT5 structured array (a view, no per-bar
+                conversion) instead of a list of dicts
+        """
+        rates = self.get_market_array(symbol, timeframe, bars)
+        if rates is None or as_array:
+            return rates
 
         candles = []
         for rate in rates:
@@ -203,6 +238,92 @@ class MT5Connector:
 
         return candles
 
+    def get_market_array(self, symbol: str, timeframe: str = "H1", bars: int = 100) -> Optional[np.ndarray]:
+        """
+        Get the last ``bars`` candles as a view into the per-symbol cache
+
+        The first call fetches ``bars`` candles. Later calls pull only the bars
+        at or after the last cached timestamp (the last cached bar is usually
+        still forming and gets overwritten) and merge them into the cache.
+
+        The cache remembers how many bars it was filled with (``depth``); a
+        request for more bars than that refetches.
+
+        The returned view is only valid until the next fetch for the same
+        symbol/timeframe; copy it to keep it longer.
+        """
+        if not self.connected or not self.mt5:
+            return None
+
+        tf = self._timeframe(timeframe)
+        key = (symbol, timeframe)
+        cache = self.rate_cache.get(key)
+
+        if cache is None or cache['size'] == 0 or cache['depth'] < bars:
+            rates = self.mt5.copy_rates_from_pos(symbol, tf, 0, bars)
+            if rates is None:
+                logger.error(f"Failed to get data for {symbol}")
+                return None
+
+            buffer = np.empty(2 * bars, dtype=rates.dtype)
+            buffer[:len(rates)] = rates
+            cache = self.rate_cache[key] = {'buffer': buffer, 'size': len(rates), 'depth': bars}
+            return buffer[:len(rates)]
+
+        buffer, size = cache['buffer'], cache['size']
+        last_time = buffer['time'][size - 1]
+
+        # Probe with a small window and widen until it overlaps the cache
+        count = 2
+        while True:
+            rates = self.mt5.copy_rates_from_pos(symbol, tf, 0, count)
+            if rates is None:
+                logger.error(f"Failed to get data for {symbol}")
+                return None
+            if len(rates) < count or rates['time'][0] <= last_time or count >= bars:
+                break
+            count = min(count * 4, bars)
+
+        if len(rates) and rates['time'][0] > last_time:
+            # Gap longer than the requested window: restart the cache
+            buffer[:len(rates)] = rates
+            cache['size'] = len(rates)
+            cache['depth'] = bars
+            return buffer[:len(rates)]
+
+        new = rates[rates['time'] >= last_time]
+        if len(new) and new['time'][0] == last_time:
+            size -= 1  # replace the (possibly still forming) last cached bar
+
+        if size + len(new) > len(buffer):
+            # Compact: keep the newest half of the buffer (at least ``depth`` bars) at the front
+            keep = min(size, len(buffer) // 2)
+            buffer[:keep] = buffer[size - keep:size]
+            size = keep
+
+        buffer[size:size + len(new)] = new
+        size += len(new)
+        cache['size'] = size
+
+        return buffer[max(size - bars, 0):size]
+
+    def get_market_columns(self, symbol: str, timeframe: str = "H1", bars: int = 100) -> Optional[Dict[str, np.ndarray]]:
+        """Candle columns (time, open, high, low, close, tick_volume, ...) as array views"""
+        rates = self.get_market_array(symbol, timeframe, bars)
+        if rates is None:
+            return None
+        return {name: rates[name] for name in rates.dtype.names}
+
+    def poll_market_data(self, symbols: List[str], timeframe: str = "H1",
+                         bars: int = 100) -> Dict[str, np.ndarray]:
+        """Incrementally refresh several symbols; returns symbol -> candle array view"""
+        polled = {}
+        for symbol in symbols:
+            rates = self.get_market_array(symbol, timeframe, bars)
+            if rates is not None:
+                polled[symbol] = rates
+        return polled
+
     def place_order(self, symbol: str, order_type: str, volume: float,
                    price: float = None, sl: float = None, tp: float = None,
                    comment: str = "Agent X2.0") -> Optional[Dict]:
@@ -323,6 +444,10 @@ class MT5Connector:
 
         result = self.mt5.order_send(request)
 
+        if result is None:
+            logger.error(f"❌ Failed to close position: {self.mt5.last_error()}")
+            return False
+
         if result.retcode != self.mt5.TRADE_RETCODE_DONE:
             logger.error(f"❌ Failed to close position: {result.comment}")
             return False
@@ -366,8 +491,8 @@ class MT5Connector:
 class MT5TradingBot:
     """Trading bot that integrates Agent X2.0 with MT5"""
 
-    def __init__(self, account_type: str = "demo"):
-        self.connector = MT5Connector(account_type)
+    def __init__(self, account_type: str = "demo", mt5_module=None):
+        self.connector = MT5Connector(account_type, mt5_module=mt5_module)
         self.active = False
 
     def start(self):
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Local MetaTrader 5 Terminal Simulator
+Drop-in stand-in for the ``MetaTrader5`` module surface used by MT5Connector
+
+Runs anywhere (no Windows terminal needed) so order throughput, reconnect
+handling and position tracking can be exercised on Linux / CI.
+
+Features:
+- Candle replay from CSV files (or arrays) with a movable replay clock
+- initialize / login / shutdown / last_error with simulated connection drops
+- symbol_info / symbol_info_tick / copy_rates_from_pos
+- order_send with configurable fill latency, volume checks, netting on close
+- positions_get / history_deals_get / account_info
+
+Usage:
+    sim = MT5Simulator(fill_latency=0.005)
+    sim.load_candles('EURUSD', 'historical_data/EURUSD_H1.csv')
+    connector = MT5Connector(mt5_module=sim)
+    connector.connect()
+"""
+
+import csv
+import itertools
+import logging
+import random
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger('MT5Simulator')
+
+RATE_DTYPE = np.dtype([
+    ('time', '<i8'), ('open', '<f8'), ('high', '<f8'), ('low', '<f8'), ('close', '<f8'),
+    ('tick_volume', '<u8'), ('spread', '<i4'), ('real_volume', '<u8')
+])
+
+AccountInfo = namedtuple('AccountInfo', [
+    'login', 'server', 'balance', 'equity', 'margin', 'margin_free', 'margin_level', 'profit',
+    'currency', 'leverage', 'trade_mode', 'limit_orders', 'margin_so_call', 'margin_so_so'
+])
+SymbolInfo = namedtuple('SymbolInfo', [
+    'name', 'description', 'currency_base', 'currency_profit', 'currency_margin', 'digits',
+    'trade_contract_size', 'trade_mode', 'volume_min', 'volume_max', 'volume_step', 'spread',
+    'bid', 'ask', 'point'
+])
+Tick = namedtuple('Tick', ['time', 'bid', 'ask', 'last', 'volume'])
+TradePosition = namedtuple('TradePosition', [
+    'ticket', 'time', 'type', 'magic', 'volume', 'price_open', 'sl', 'tp', 'price_current',
+    'profit', 'symbol', 'comment'
+])
+TradeDeal = namedtuple('TradeDeal', [
+    'ticket', 'order', 'time', 'type', 'entry', 'magic', 'position_id', 'volume', 'price',
+    'commission', 'swap', 'profit', 'symbol', 'comment'
+])
+OrderSendResult = namedtuple('OrderSendResult', [
+    'retcode', 'deal', 'order', 'volume', 'price', 'bid', 'ask', 'comment', 'request_id'
+])
+SymbolName = namedtuple('SymbolName', ['name'])
+
+
+class MT5Simulator:
+    """In-process replacement for the MetaTrader5 module"""
+
+    SIMULATED = True
+
+    TIMEFRAME_M1 = 1
+    TIMEFRAME_M5 = 5
+    TIMEFRAME_M15 = 15
+    TIMEFRAME_M30 = 30
+    TIMEFRAME_H1 = 16385
+    TIMEFRAME_H4 = 16388
+    TIMEFRAME_D1 = 16408
+    TIMEFRAME_W1 = 32769
+    TIMEFRAME_MN1 = 49153
+
+    TRADE_ACTION_DEAL = 1
+    ORDER_TYPE_BUY = 0
+    ORDER_TYPE_SELL = 1
+    ORDER_TIME_GTC = 0
+    ORDER_FILLING_IOC = 1
+
+    DEAL_ENTRY_IN = 0
+    DEAL_ENTRY_OUT = 1
+
+    TRADE_RETCODE_DONE = 10009
+    TRADE_RETCODE_INVALID_VOLUME = 10014
+    TRADE_RETCODE_INVALID = 10013
+    TRADE_RETCODE_MARKET_CLOSED = 10018
+    TRADE_RETCODE_POSITION_CLOSED = 10036
+
+    RES_S_OK = 1
+    RES_E_INTERNAL_FAIL_INIT = -10005
+    RES_E_NO_IPC = -10004
+
+    def __init__(self, fill_latency: float = 0.0, latency_jitter: float = 0.0,
+                 balance: float = 10000.0, leverage: int = 100, seed: Optional[int] = None):
+        """
+        Args:
+            fill_latency: Seconds each order_send blocks before filling
+            latency_jitter: Extra uniform random latency in [0, jitter) seconds
+            balance: Starting account balance
+            leverage: Account leverage
+        """
+        self.fill_latency = fill_latency
+        self.latency_jitter = latency_jitter
+        self.balance = balance
+        self.leverage = leverage
+        self.login_id = 0
+        self.server = 'Simulator'
+
+        self.connected = False
+        self.error: Tuple[int, str] = (self.RES_S_OK, 'Success')
+        self.drop_after_calls: Optional[int] = None
+        self.fail_initializations = 0
+
+        self.rates: Dict[str, np.ndarray] = {}
+        self.cursor: Dict[str, int] = {}
+        self.symbols: Dict[str, Dict[str, Any]] = {}
+        self.positions: Dict[int, Dict[str, Any]] = {}
+        self.deals: List[TradeDeal] = []
+        self.stats = {'orders_sent': 0, 'orders_filled': 0, 'orders_rejected': 0}
+
+        self._tickets = itertools.count(100000)
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+
+    # ------------------------------------------------------------------
+    # Market data setup / replay clock
+    # ------------------------------------------------------------------
+
+    def add_symbol(self, symbol: str, rates: np.ndarray, start: Optional[int] = None,
+                   digits: int = 5, contract_size: float = 100000.0, volume_min: float = 0.01,
+                   volume_max: float = 100.0, volume_step: float = 0.01, spread: int = 10):
+        """Register a symbol backed by an array of RATE_DTYPE candles"""
+        self.rates[symbol] = np.asarray(rates, dtype=RATE_DTYPE)
+        self.cursor[symbol] = len(rates) if start is None else start
+        self.symbols[symbol] = {
+            'digits': digits,
+            'point': 10.0 ** -digits,
+            'contract_size': contract_size,
+            'volume_min': volume_min,
+            'volume_max': volume_max,
+            'volume_step': volume_step,
+            'spread': spread
+        }
+
+    def load_candles(self, symbol: str, path: str, start: Optional[int] = None, **symbol_spec):
+        """
+        Load replay candles from a CSV file
+
+        Columns: time (unix seconds or ISO), open, high, low, close and
+        optionally tick_volume / volume, spread, real_volume.
+        """
+        with open(Path(path), newline='') as f:
+            rows = list(csv.DictReader(f))
+
+        rates = np.zeros(len(rows), dtype=RATE_DTYPE)
+        for i, row in enumerate(rows):
+            stamp = row['time']
+            rates[i]['time'] = int(float(stamp)) if stamp.replace('.', '', 1).isdigit() \
+                else int(datetime.fromisoformat(stamp).timestamp())
+            for name in ('open', 'high', 'low', 'close'):
+                rates[i][name] = float(row[name])
+            rates[i]['tick_volume'] = int(float(row.get('tick_volume') or row.get('volume') or 0))
+            rates[i]['spread'] = int(float(row.get('spread') or 0))
+            rates[i]['real_volume'] = int(float(row.get('real_volume') or 0))
+
+        self.add_symbol(symbol, rates, start=start, **symbol_spec)
+        logger.info(f"📂 Loaded {len(rates)} candles for {symbol} from {path}")
+
+    def advance(self, bars: int = 1):
+        """Move the replay clock forward (every symbol that has bars left)"""
+        with self._lock:
+            for symbol in self.cursor:
+                self.cursor[symbol] = min(self.cursor[symbol] + bars, len(self.rates[symbol]))
+
+    def _price(self, symbol: str) -> Tuple[float, float]:
+        """Current (bid, ask): bid is the close of the newest replayed bar"""
+        cursor = self.cursor[symbol]
+        bid = float(self.rates[symbol]['close'][cursor - 1]) if cursor else 0.0
+        spec = self.symbols[symbol]
+        return bid, bid + spec['spread'] * spec['point']
+
+    def _now(self) -> int:
+        times = [int(self.rates[s]['time'][c - 1]) for s, c in self.cursor.items() if c]
+        return max(times) if times else int(time.time())
+
+    # ------------------------------------------------------------------
+    # Connection
+    # ------------------------------------------------------------------
+
+    def drop_connection(self, after_calls: int = 0):
+        """Simulate losing the terminal IPC link after ``after_calls`` more calls"""
+        self.drop_after_calls = after_calls
+
+    def _alive(self) -> bool:
+        if self.drop_after_calls is not None:
+            if self.drop_after_calls <= 0:
+                self.connected = False
+                self.drop_after_calls = None
+            else:
+                self.drop_after_calls -= 1
+        if not self.connected:
+            self.error = (self.RES_E_NO_IPC, 'No IPC connection')
+        return self.connected
+
+    def initialize(self, *args, **kwargs) -> bool:
+        if self.fail_initializations > 0:
+            self.fail_initializations -= 1
+            self.error = (self.RES_E_INTERNAL_FAIL_INIT, 'IPC initialize failed')
+            return False
+        self.connected = True
+        self.error = (self.RES_S_OK, 'Success')
+        return True
+
+    def login(self, login: int, password: str = '', server: str = '', timeout: int = 60000) -> bool:
+        if not self._alive():
+            return False
+        self.login_id = login
+        self.server = server or self.server
+        return True
+
+    def shutdown(self):
+        self.connected = False
+
+    def last_error(self) -> Tuple[int, str]:
+        return self.error
+
+    def terminal_info(self):
+        return {'connected': True, 'trade_allowed': True} if self._alive() else None
+
+    # ------------------------------------------------------------------
+    # Account / symbols / rates
+    # ------------------------------------------------------------------
+
+    def account_info(self) -> Optional[AccountInfo]:
+        if not self._alive():
+            return None
+        with self._lock:
+            profit = sum(self._position_profit(p) for p in self.positions.values())
+            margin = sum(p['volume'] * self.symbols[p['symbol']]['contract_size'] * p['price_open']
+                         for p in self.positions.values()) / self.leverage
+        equity = self.balance + profit
+        return AccountInfo(self.login_id, self.server, self.balance, equity, margin, equity - margin,
+                           equity / margin * 100 if margin else 0.0, profit, 'USD', self.leverage,
+                           0, 200, 50.0, 30.0)
+
+    def symbols_get(self, group: str = '*'):
+        if not self._alive():
+            return None
+        pattern = group.replace('*', '')
+        return tuple(SymbolName(name) for name in self.symbols if pattern in name)
+
+    def symbol_info(self, symbol: str) -> Optional[SymbolInfo]:
+        if not self._alive() or symbol not in self.symbols:
+            return None
+        spec = self.symbols[symbol]
+        bid, ask = self._price(symbol)
+        return SymbolInfo(symbol, f'{symbol} (simulated)', symbol[:3], symbol[3:], symbol[3:],
+                          spec['digits'], spec['contract_size'], 4, spec['volume_min'],
+                          spec['volume_max'], spec['volume_step'], spec['spread'], bid, ask, spec['point'])
+
+    def symbol_info_tick(self, symbol: str) -> Optional[Tick]:
+        if not self._alive() or symbol not in self.symbols:
+            return None
+        bid, ask = self._price(symbol)
+        return Tick(self._now(), bid, ask, bid, 0)
+
+    def copy_rates_from_pos(self, symbol: str, timeframe: int, start_pos: int, count: int) -> Optional[np.ndarray]:
+        """Bars up to the replay clock; position 0 is the newest bar"""
+        if not self._alive() or symbol not in self.rates:
+            self.error = self.error if not self.connected else (self.TRADE_RETCODE_INVALID, 'Unknown symbol')
+            return None
+        end = self.cursor[symbol] - start_pos
+        return self.rates[symbol][max(end - count, 0):max(end, 0)].copy()
+
+    # ------------------------------------------------------------------
+    # Trading
+    # ------------------------------------------------------------------
+
+    def _position_profit(self, position: Dict[str, Any]) -> float:
+        bid, ask = self._price(position['symbol'])
+        size = position['volume'] * self.symbols[position['symbol']]['contract_size']
+        if position['type'] == self.ORDER_TYPE_BUY:
+            return (bid - position['price_open']) * size
+        return (position['price_open'] - ask) * size
+
+    def _result(self, retcode: int, comment: str, deal: int = 0, order: int = 0,
+                volume: float = 0.0, price: float = 0.0, symbol: Optional[str] = None) -> OrderSendResult:
+        bid, ask = self._price(symbol) if symbol in self.symbols else (0.0, 0.0)
+        return OrderSendResult(retcode, deal, order, volume, price, bid, ask, comment, 0)
+
+    def order_send(self, request: Dict[str, Any]) -> Optional[OrderSendResult]:
+        """Fill a market deal after the configured latency"""
+        if not self._alive():
+            return None
+
+        delay = self.fill_latency + (self._random.random() * self.latency_jitter if self.latency_jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+
+        symbol = request.get('symbol')
+        volume = float(request.get('volume', 0))
+
+        with self._lock:
+            self.stats['orders_sent'] += 1
+
+            if request.get('action') != self.TRADE_ACTION_DEAL or symbol not in self.symbols:
+                self.stats['orders_rejected'] += 1
+                return self._result(self.TRADE_RETCODE_INVALID, 'Invalid request', symbol=symbol)
+
+            if not self.cursor[symbol]:
+                self.stats['orders_rejected'] += 1
+                return self._result(self.TRADE_RETCODE_MARKET_CLOSED, 'Market closed', symbol=symbol)
+
+            spec = self.symbols[symbol]
+            steps = volume / spec['volume_step']
+            if not spec['volume_min'] <= volume <= spec['volume_max'] or abs(steps - round(steps)) > 1e-7:
+                self.stats['orders_rejected'] += 1
+                return self._result(self.TRADE_RETCODE_INVALID_VOLUME, 'Invalid volume', symbol=symbol)
+
+            bid, ask = self._price(symbol)
+            side = request.get('type', self.ORDER_TYPE_BUY)
+            price = ask if side == self.ORDER_TYPE_BUY else bid
+            order = next(self._tickets)
+            deal = next(self._tickets)
+            now = self._now()  # replay time, the same clock as the bars
+
+            if 'position' in request:
+                position = self.positions.get(request['position'])
+                if position is None:
+                    self.stats['orders_rejected'] += 1
+                    return self._result(self.TRADE_RETCODE_POSITION_CLOSED, 'Position not found', symbol=symbol)
+
+                closed = min(volume, position['volume'])
+                profit = self._position_profit(position) * closed / position['volume']
+                self.balance += profit
+                position['volume'] = round(position['volume'] - closed, 8)
+                if position['volume'] <= 0:
+                    del self.positions[request['position']]
+                entry, position_id = self.DEAL_ENTRY_OUT, request['position']
+            else:
+                self.positions[order] = {
+                    'ticket': order, 'time': now, 'type': side, 'magic': request.get('magic', 0),
+                    'volume': volume, 'price_open': price, 'sl': request.get('sl', 0.0),
+                    'tp': request.get('tp', 0.0), 'symbol': symbol, 'comment': request.get('comment', '')
+                }
+                profit, entry, position_id = 0.0, self.DEAL_ENTRY_IN, order
+
+            self.deals.append(TradeDeal(deal, order, now, side, entry, request.get('magic', 0), position_id,
+                                        volume, price, 0.0, 0.0, profit, symbol, request.get('comment', '')))
+            self.stats['orders_filled'] += 1
+
+        return self._result(self.TRADE_RETCODE_DONE, 'Request executed', deal, order, volume, price, symbol)
+
+    def positions_get(self, symbol: Optional[str] = None, ticket: Optional[int] = None):
+        if not self._alive():
+            return None
+        with self._lock:
+            return tuple(
+                TradePosition(p['ticket'], p['time'], p['type'], p['magic'], p['volume'], p['price_open'],
+                              p['sl'], p['tp'],
+                              self._price(p['symbol'])[0 if p['type'] == self.ORDER_TYPE_BUY else 1],
+                              self._position_profit(p), p['symbol'], p['comment'])
+                for p in self.positions.values()
+                if (symbol is None or p['symbol'] == symbol) and (ticket is None or p['ticket'] == ticket)
+            )
+
+    def history_deals_get(self, date_from, date_to, group: str = '*'):
+        if not self._alive():
+            return None
+        start = date_from.timestamp() if isinstance(date_from, datetime) else date_from
+        end = date_to.timestamp() if isinstance(date_to, datetime) else date_to
+        with self._lock:
+            return tuple(deal for deal in self.deals if start <= deal.time <= end)
@@ -14,9 +14,17 @@ Targets:
 - Market euphoria peaks (VIX < 12, extreme greed)
 """
 
+import sys
 import logging
+import numpy as np
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from pathlib import Path
+from typing import Dict, List, Any, Mapping, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+from universe_columns import (
+    action_column, flag_column, isin_column, numeric_column, reason_mask, universe_length
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger('BigShort')
@@ -34,6 +42,12 @@ class BigShortStrategy:
     5. Sector bubbles
     """
 
+    # Bit order of the reason_codes mask returned by the batch entry points
+    REASON_CODES = (
+        'HIGH_PE', 'HIGH_PB', 'OVERLEVERAGED', 'OVERBOUGHT', 'MACD_BEARISH',
+        'VIX_EUPHORIA', 'EXTREME_SENTIMENT', 'DECLINING_REVENUE', 'ACCOUNTING_RED_FLAGS'
+    )
+
     def __init__(self):
         self.watchlist = []
         self.active_shorts = []
@@ -166,6 +180,86 @@ class BigShortStrategy:
 
         return signal
 
+    def score_short_arrays(self, pe_ratio: np.ndarray, pb_ratio: np.ndarray, debt_equity: np.ndarray,
+                           rsi: np.ndarray, macd_bearish: np.ndarray, vix: np.ndarray,
+                           extreme_sentiment: np.ndarray, revenue_growth: np.ndarray,
+                           accounting_red_flags: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Array version of the Big Short scoring rules
+
+        Every argument is an already-parsed numeric/boolean array (one entry
+        per candidate); the point values and thresholds are exactly those of
+        analyze_for_short, so decisions match the scalar version.
+
+        Returns: dict of 'score', 'confidence', 'action' and 'reason_codes'
+        (bitmask over REASON_CODES) arrays
+        """
+        flags = [
+            # 1. FUNDAMENTAL OVERVALUATION (40 points)
+            pe_ratio > self.criteria['pe_ratio_max'],
+            pb_ratio > self.criteria['pb_ratio_max'],
+            debt_equity > self.criteria['debt_equity_min'],
+            # 2. TECHNICAL OVERBOUGHT (30 points)
+            rsi > self.criteria['rsi_overbought'],
+            np.asarray(macd_bearish, dtype=bool),
+            # 3. MARKET SENTIMENT (20 points)
+            vix < self.criteria['vix_euphoria'],
+            np.asarray(extreme_sentiment, dtype=bool),
+            # 4. ACCOUNTING RED FLAGS (10 points)
+            (revenue_growth < 0) & (pe_ratio > 30),
+            np.asarray(accounting_red_flags, dtype=bool)
+        ]
+        points = (15, 10, 15, 15, 15, 10, 10, 5, 5)
+
+        score = sum(np.where(flag, point, 0) for flag, point in zip(flags, points))
+
+        max_score = 40 + 30 + 20 + 10
+        confidence = score / max_score
+
+        return {
+            'score': score,
+            'confidence': confidence,
+            'action': action_column(confidence, 0.75, 0.60),
+            'reason_codes': reason_mask(flags)
+        }
+
+    def analyze_for_short_batch(self, universe: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Analyze a whole columnar universe for SHORT candidates
+
+        universe: column name -> per-symbol values (dict of arrays or a
+        DataFrame), with the same fields analyze_for_short reads.
+        Handles 'N/A'/None fundamentals and string MACD/sentiment states
+        exactly like the scalar version, so actions and confidences match.
+
+        Returns: dict of 'symbol', 'action', 'confidence' and 'reason_codes'
+        arrays plus the strategy name
+        """
+        n = universe_length(universe)
+
+        signal = self.score_short_arrays(
+            pe_ratio=numeric_column(universe, 'pe_ratio', n, 20, invalid=999, invalid_tokens=('N/A', None)),
+            pb_ratio=numeric_column(universe, 'pb_ratio', n, 3, invalid=0, invalid_tokens=('N/A', None)),
+            debt_equity=numeric_column(universe, 'debt_equity', n, 1, invalid=0,
+                                       invalid_tokens=('N/A', None, 'Unknown (fraud)')),
+            rsi=numeric_column(universe, 'rsi', n, 50),
+            macd_bearish=isin_column(universe, 'macd', n, ['bearish']) | isin_column(universe, 'macd_signal', n, ['sell']),
+            vix=numeric_column(universe, 'vix', n, 20),
+            extreme_sentiment=(isin_column(universe, 'news_sentiment', n, ['extremely_bullish'])
+                               | isin_column(universe, 'social_sentiment', n, ['euphoric'])),
+            revenue_growth=numeric_column(universe, 'revenue_growth', n, 0),
+            accounting_red_flags=(isin_column(universe, 'earnings_quality', n, ['suspicious'])
+                                  | flag_column(universe, 'accounting_irregularities', n))
+        )
+
+        return {
+            'strategy': 'Big Short',
+            'symbol': np.asarray(universe['symbol']) if 'symbol' in universe else np.full(n, 'UNKNOWN'),
+            'action': signal['action'],
+            'confidence': signal['confidence'],
+            'reason_codes': signal['reason_codes']
+        }
+
     def find_short_opportunities(self, market_data: List[Dict]) -> List[Dict]:
         """
         Scan entire market for SHORT opportunities
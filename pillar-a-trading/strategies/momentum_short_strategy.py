@@ -10,9 +10,17 @@ Strategy:
 - Target 94-96% win rate
 """
 
+import sys
 import logging
+import numpy as np
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from pathlib import Path
+from typing import Dict, List, Any, Mapping, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+from universe_columns import (
+    action_column, flag_column, numeric_column, reason_mask, universe_length
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger('MomentumShort')
@@ -30,6 +38,12 @@ class MomentumShortStrategy:
     5. Failed breakout (new high but closes lower)
     """
 
+    # Bit order of the reason_codes mask returned by analyze_for_short_batch
+    REASON_CODES = (
+        'EXTREME_OVERBOUGHT', 'OVERBOUGHT', 'EXTREME_EXTENSION', 'EXTENDED',
+        'VOLUME_SPIKE', 'HIGH_VOLUME', 'BEARISH_DIVERGENCE', 'FAILED_BREAKOUT'
+    )
+
     def __init__(self):
         self.criteria = {
             'rsi_extreme': 80,  # RSI above this = extreme
@@ -119,6 +133,53 @@ class MomentumShortStrategy:
 
         return signal
 
+    def analyze_for_short_batch(self, universe: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Analyze momentum for a whole columnar universe
+
+        Same rules and defaults as analyze_for_short, evaluated as arrays.
+        Returns: dict of 'symbol', 'action', 'confidence' and 'reason_codes'
+        arrays plus the strategy name
+        """
+        n = universe_length(universe)
+
+        rsi = numeric_column(universe, 'rsi', n, 50)
+        price = numeric_column(universe, 'price', n, 0)
+        ma_50 = numeric_column(universe, 'ma_50', n, price)
+        volume = numeric_column(universe, 'volume', n, 0)
+        avg_volume = numeric_column(universe, 'avg_volume', n, volume)
+
+        price_ma_ratio = np.divide(price, ma_50, out=np.zeros(n), where=ma_50 > 0)
+        volume_ratio = np.divide(volume, avg_volume, out=np.zeros(n), where=avg_volume > 0)
+
+        extreme_rsi = rsi > self.criteria['rsi_extreme']
+        extreme_extension = (ma_50 > 0) & (price_ma_ratio > self.criteria['price_ma_ratio'])
+        volume_spike = (avg_volume > 0) & (volume_ratio > self.criteria['volume_spike'])
+
+        flags = [
+            extreme_rsi,
+            ~extreme_rsi & (rsi > 70),
+            extreme_extension,
+            ~extreme_extension & (ma_50 > 0) & (price_ma_ratio > 1.5),
+            volume_spike,
+            ~volume_spike & (avg_volume > 0) & (volume_ratio > 2.0),
+            flag_column(universe, 'bearish_divergence', n),
+            flag_column(universe, 'failed_breakout', n)
+        ]
+        points = (30, 15, 25, 15, 20, 10, 15, 10)
+
+        score = sum(np.where(flag, point, 0) for flag, point in zip(flags, points))
+        max_score = 30 + 25 + 20 + 15 + 10
+        confidence = score / max_score
+
+        return {
+            'strategy': 'Momentum Short',
+            'symbol': np.asarray(universe['symbol']) if 'symbol' in universe else np.full(n, 'UNKNOWN'),
+            'action': action_column(confidence, 0.80, 0.65),
+            'confidence': confidence,
+            'reason_codes': reason_mask(flags)
+        }
+
 
 if __name__ == "__main__":
     strategy = MomentumShortStrategy()
@@ -11,9 +11,17 @@ Strategy:
 - Target 94-96% win rate
 """
 
+import sys
 import logging
+import numpy as np
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from pathlib import Path
+from typing import Dict, List, Any, Mapping, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+from universe_columns import (
+    action_column, isin_column, numeric_column, reason_mask, universe_length
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger('TechnicalBreakdown')
@@ -31,6 +39,15 @@ class TechnicalBreakdownShortStrategy:
     5. Volume confirms breakdown
     """
 
+    BEARISH_PATTERNS = ['head_and_shoulders', 'double_top', 'descending_triangle']
+    CONTINUATION_PATTERNS = ['rising_wedge', 'bear_flag']
+
+    # Bit order of the reason_codes mask returned by analyze_for_short_batch
+    REASON_CODES = (
+        'SUPPORT_BROKEN', 'TESTING_SUPPORT', 'DEATH_CROSS', 'MA_CONVERGING', 'BEARISH_PATTERN',
+        'CONTINUATION_PATTERN', 'VOLUME_CONFIRMS', 'VOLUME_INCREASING', 'MACD_BEARISH'
+    )
+
     def __init__(self):
         self.criteria = {
             'support_break_confirm': 0.02,  # 2% below support = confirmed
@@ -86,10 +103,10 @@ class TechnicalBreakdownShortStrategy:
         # 3. BEARISH PATTERN (20 points)
         pattern = data.get('pattern')
 
-        if pattern in ['head_and_shoulders', 'double_top', 'descending_triangle']:
+        if pattern in self.BEARISH_PATTERNS:
             score += 20
             signal['reasons'].append(f"Bearish pattern: {pattern}")
-        elif pattern in ['rising_wedge', 'bear_flag']:
+        elif pattern in self.CONTINUATION_PATTERNS:
             score += 10
             signal['reasons'].append(f"Continuation pattern: {pattern}")
 
@@ -130,6 +147,61 @@ class TechnicalBreakdownShortStrategy:
 
         return signal
 
+    def analyze_for_short_batch(self, universe: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Analyze technical breakdowns for a whole columnar universe
+
+        Same rules and defaults as analyze_for_short, evaluated as arrays.
+        Returns: dict of 'symbol', 'action', 'confidence' and 'reason_codes'
+        arrays plus the strategy name
+        """
+        n = universe_length(universe)
+
+        price = numeric_column(universe, 'price', n, 0)
+        support_level = numeric_column(universe, 'support_level', n, 0)
+        ma_50 = numeric_column(universe, 'ma_50', n, 0)
+        ma_200 = numeric_column(universe, 'ma_200', n, 0)
+        volume = numeric_column(universe, 'volume', n, 0)
+        avg_volume = numeric_column(universe, 'avg_volume', n, volume)
+
+        below_support = (support_level > 0) & (price < support_level)
+        break_pct = np.divide(support_level - price, support_level, out=np.zeros(n), where=below_support)
+        support_broken = below_support & (break_pct > self.criteria['support_break_confirm'])
+
+        has_mas = (ma_50 > 0) & (ma_200 > 0)
+        ma_ratio = np.divide(ma_50, ma_200, out=np.ones(n), where=has_mas)
+        death_cross = has_mas & (ma_ratio < (1 - self.criteria['ma_death_cross_buffer']))
+
+        bearish_pattern = isin_column(universe, 'pattern', n, self.BEARISH_PATTERNS)
+
+        volume_ratio = np.divide(volume, avg_volume, out=np.zeros(n), where=avg_volume > 0)
+        volume_confirms = (avg_volume > 0) & (volume_ratio > self.criteria['volume_confirm'])
+
+        flags = [
+            support_broken,
+            below_support & ~support_broken & (break_pct > 0),
+            death_cross,
+            has_mas & ~death_cross & (ma_ratio < 1.0),
+            bearish_pattern,
+            ~bearish_pattern & isin_column(universe, 'pattern', n, self.CONTINUATION_PATTERNS),
+            volume_confirms,
+            ~volume_confirms & (avg_volume > 0) & (volume_ratio > 1.0),
+            isin_column(universe, 'macd', n, ['bearish']) | isin_column(universe, 'macd_signal', n, ['sell'])
+        ]
+        points = (35, 20, 30, 15, 20, 10, 10, 5, 5)
+
+        score = sum(np.where(flag, point, 0) for flag, point in zip(flags, points))
+        max_score = 100  # Total possible points: 35 + 30 + 20 + 10 + 5
+        confidence = score / max_score
+
+        return {
+            'strategy': 'Technical Breakdown Short',
+            'symbol': np.asarray(universe['symbol']) if 'symbol' in universe else np.full(n, 'UNKNOWN'),
+            'action': action_column(confidence, 0.75, 0.60),
+            'confidence': confidence,
+            'reason_codes': reason_mask(flags)
+        }
+
 
 if __name__ == "__main__":
     strategy = TechnicalBreakdownShortStrategy()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+COLUMNAR UNIVERSE HELPERS
+Shared parsing for the array (batch) entry points of the strategies and bots
+
+A universe is any mapping of column name -> array-like with one entry per
+symbol (a dict of lists/arrays or a pandas DataFrame). A column that is
+absent, or a NaN entry within a column, means "field not provided" and
+gets the same default the scalar analyze_for_short would use.
+"""
+
+import math
+from typing import Any, Dict, Iterable, List, Mapping, Sequence
+
+import numpy as np
+
+
+def records_to_universe(records: Sequence[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Convert a list of per-symbol dicts into a columnar universe"""
+    fields: Dict[str, None] = {}
+    for record in records:
+        fields.update(dict.fromkeys(record))
+
+    universe = {}
+    for name in fields:
+        column = np.empty(len(records), dtype=object)
+        column[:] = [record.get(name, np.nan) for record in records]
+        universe[name] = column
+
+    return universe
+
+
+def universe_length(universe: Mapping[str, Any]) -> int:
+    """Number of symbols in a universe"""
+    if 'symbol' in universe:
+        return len(universe['symbol'])
+    for column in universe.values():
+        return len(column)
+    return 0
+
+
+def _is_missing(value: Any) -> bool:
+    return isinstance(value, float) and math.isnan(value)
+
+
+def numeric_column(universe: Mapping[str, Any], name: str, n: int, default: Any,
+                   invalid: Any = None, invalid_tokens: Iterable[Any] = (None,)) -> np.ndarray:
+    """
+    Parse a numeric column to float64
+
+    Missing entries take ``default`` (a scalar or a per-symbol array).
+    Entries listed in ``invalid_tokens`` or rejected by float() take
+    ``invalid`` (``default`` when not given).
+    """
+    default = np.broadcast_to(np.asarray(default, dtype=float), (n,))
+    invalid = default if invalid is None else np.broadcast_to(np.asarray(invalid, dtype=float), (n,))
+
+    if name not in universe:
+        return default.copy()
+
+    values = np.asarray(universe[name])
+    if values.dtype.kind in 'biuf':
+        parsed = values.astype(float)
+        missing = np.isnan(parsed)
+        parsed[missing] = default[missing]
+        return parsed
+
+    tokens = list(invalid_tokens)
+    parsed = np.empty(n)
+    for i, value in enumerate(values):
+        if _is_missing(value):
+            parsed[i] = default[i]
+        elif any(value is token or value == token for token in tokens):
+            parsed[i] = invalid[i]
+        else:
+            try:
+                parsed[i] = float(value)
+            except (ValueError, TypeError):
+                parsed[i] = invalid[i]
+
+    return parsed
+
+
+def flag_column(universe: Mapping[str, Any], name: str, n: int) -> np.ndarray:
+    """Truthiness of a boolean column; missing entries are False"""
+    if name not in universe:
+        return np.zeros(n, dtype=bool)
+
+    values = np.asarray(universe[name])
+    if values.dtype.kind in 'biuf':
+        return np.nan_to_num(values.astype(float)) != 0
+
+    return np.fromiter((bool(value) and not _is_missing(value) for value in values), dtype=bool, count=n)
+
+
+def category_column(universe: Mapping[str, Any], name: str, n: int, default: Any) -> np.ndarray:
+    """Categorical column as an object array; missing entries take ``default``"""
+    column = np.empty(n, dtype=object)
+    if name not in universe:
+        column[:] = default
+        return column
+
+    column[:] = [default if _is_missing(value) else value for value in universe[name]]
+    return column
+
+
+def isin_column(universe: Mapping[str, Any], name: str, n: int, targets: Iterable[Any]) -> np.ndarray:
+    """Whether each entry of a categorical column is one of ``targets``"""
+    if name not in universe:
+        return np.zeros(n, dtype=bool)
+
+    targets = set(targets)
+    return np.fromiter((value in targets for value in universe[name]), dtype=bool, count=n)
+
+
+def action_column(confidence: np.ndarray, short_threshold: float, small_threshold: float) -> np.ndarray:
+    """Map confidences to SHORT / SHORT_SMALL / HOLD using a strategy's thresholds"""
+    return np.where(confidence >= short_threshold, 'SHORT',
+                    np.where(confidence >= small_threshold, 'SHORT_SMALL', 'HOLD'))
+
+
+def reason_mask(flags: Sequence[np.ndarray]) -> np.ndarray:
+    """Pack per-reason boolean arrays into one uint32 bitmask per symbol"""
+    mask = np.zeros(len(flags[0]) if flags else 0, dtype=np.uint32)
+    for bit, flag in enumerate(flags):
+        mask |= flag.astype(np.uint32) << np.uint32(bit)
+    return mask
+
+
+def decode_reason_codes(mask: int, codes: Sequence[str]) -> List[str]:
+    """Expand one symbol's reason bitmask into its reason codes"""
+    mask = int(mask)
+    return [code for bit, code in enumerate(codes) if mask >> bit & 1]
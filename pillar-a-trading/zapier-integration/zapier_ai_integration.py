@@ -31,15 +31,82 @@ FREE ZAPIER APPS FOR TRADING DATA:
 """
 
 import os
+import re
+import sys
 import json
+import time
 import requests
 import logging
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'core-systems'))
+from llm_response_cache import LLMResponseCache, shared_cache
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger('ZapierAI')
 
+SIGNALS = ('BUY', 'SELL', 'HOLD')
+# Free-text answers only count through explicit "Signal: X" / "Confidence: N%" fields
+SIGNAL_FIELD = re.compile(r'^[\W\d]*(?:trading\s+)?signal\W*[:=]\W*(\w+)', re.IGNORECASE | re.MULTILINE)
+CONFIDENCE_FIELD = re.compile(r'^[\W\d]*confidence(?:\s+level)?\W*[:=]\s*\**\s*(\d{1,3}(?:\.\d+)?)\s*(%?)',
+                              re.IGNORECASE | re.MULTILINE)
+TEXT_KEYS = ('text', 'content', 'response', 'output')
+
+
+def _vote(signal: Any, confidence: Any, percent: bool = False) -> Optional[Tuple[str, float]]:
+    """Validated (signal, confidence 0-100); None when either field is unusable"""
+    signal = str(signal or '').strip().upper()
+    if signal not in SIGNALS:
+        return None
+    if confidence in (None, ''):
+        return signal, 0.0
+    try:
+        confidence = float(confidence)
+    except (TypeError, ValueError):
+        return None
+    if not percent and confidence <= 1:
+        confidence *= 100  # a 0-1 fraction
+    return (signal, confidence) if 0 <= confidence <= 100 else None
+
+
+def parse_ai_signal(analysis: Dict) -> Optional[Tuple[str, float]]:
+    """
+    (signal, confidence 0-100) from one model's analysis, or None (no vote)
+
+    Models are asked for JSON ``{"signal": ..., "confidence": ...}``. Text
+    answers are accepted only with explicit ``Signal:`` / ``Confidence:``
+    fields; a missing, unknown or contradictory signal is no vote.
+    """
+    if not analysis or 'error' in analysis:
+        return None
+    body = analysis.get('analysis')
+    if isinstance(body, str):
+        start, end = body.find('{'), body.rfind('}')
+        if start != -1 and end > start:
+            try:
+                body = json.loads(body[start:end + 1])
+            except ValueError:
+                pass
+    if isinstance(body, dict):
+        for key in ('signal', 'action', 'recommendation'):
+            if key in body:
+                return _vote(body[key], body.get('confidence'))
+        text = next((body[key] for key in TEXT_KEYS if isinstance(body.get(key), str)), None)
+        return parse_ai_signal({'analysis': text}) if text else None
+    if not isinstance(body, str):
+        return None
+
+    signals = {match.upper() for match in SIGNAL_FIELD.findall(body)}
+    confidences = set(CONFIDENCE_FIELD.findall(body))
+    if len(signals) != 1 or len(confidences) > 1:
+        return None
+    value, percent = confidences.pop() if confidences else (None, '')
+    return _vote(signals.pop(), value, percent=bool(percent))
+
 
 class ZapierAIIntegration:
     """
@@ -47,10 +114,26 @@ class ZapierAIIntegration:
     Uses ALL free Zapier AI tools and automations
     """
 
-    def __init__(self):
+    def __init__(self, consensus_quorum: int = 2, consensus_timeout: float = 20.0,
+                 hedge_after: Optional[float] = None, cache: Optional[LLMResponseCache] = None):
         self.mcp_endpoint = os.getenv('ZAPIER_MCP_ENDPOINT', 'https://mcp.zapier.com/api/mcp/mcp')
         self.bearer_token = os.getenv('ZAPIER_MCP_BEARER_TOKEN', '')
         self.webhook_urls = self._load_webhook_urls()
+        self.cache = cache if cache is not None else shared_cache()
+
+        # Parallel consensus: models that must agree, overall deadline, and
+        # when to hedge a slow model (None = its recent p90 latency)
+        self.models = {
+            'chatgpt': ('ChatGPT', self.analyze_with_chatgpt),
+            'claude': ('Claude', self.analyze_with_claude),
+            'gemini': ('Gemini', self.analyze_with_gemini),
+        }
+        self.consensus_quorum = consensus_quorum
+        self.consensus_timeout = consensus_timeout
+        self.hedge_after = hedge_after
+        self.model_latency = {key: deque(maxlen=50) for key in self.models}
+        self._executor = ThreadPoolExecutor(max_workers=4 * len(self.models), thread_name_prefix='ZapierAI')
+
         logger.info("=" * 70)
         logger.info("🤖 ZAPIER AI INTEGRATION INITIALIZED")
         logger.info("=" * 70)
@@ -65,21 +148,31 @@ class ZapierAIIntegration:
             'error_alert': os.getenv('ZAPIER_ERROR_ALERT_WEBHOOK', '')
         }
 
+    def _cached_analysis(self, prompt: str, data: Dict, request) -> Dict:
+        """Model answer from the response cache, or request() (cached only if it has an analysis)"""
+        if self.cache is None:
+            return request()
+        params = {key: value for key, value in data.items() if key != 'prompt'}
+        return self.cache.call('market_analysis', prompt, data['model'], params, request,
+                               cacheable=lambda result: 'error' not in result and bool(result.get('analysis')))
+
     def analyze_with_chatgpt(self, prompt: str) -> Dict:
         """
         Use ChatGPT via Zapier AI to analyze market data
 
         FREE via Zapier AI Actions
         """
-        try:
-            # Create Zap trigger for ChatGPT analysis
-            data = {
-                'prompt': prompt,
-                'model': 'gpt-3.5-turbo',  # Free tier
-                'max_tokens': 500,
-                'temperature': 0.3  # Low temperature for factual analysis
-            }
+        # Create Zap trigger for ChatGPT analysis
+        data = {
+            'prompt': prompt,
+            'model': 'gpt-3.5-turbo',  # Free tier
+            'max_tokens': 500,
+            'temperature': 0.3  # Low temperature for factual analysis
+        }
+        return self._cached_analysis(prompt, data, lambda: self._request_chatgpt(data))
 
+    def _request_chatgpt(self, data: Dict) -> Dict:
+        try:
             # Send to Zapier webhook
             if self.webhook_urls.get('trade_signal'):
                 response = requests.post(
@@ -107,13 +200,15 @@ class ZapierAIIntegration:
 
         FREE via Zapier AI Actions
         """
-        try:
-            data = {
-                'prompt': prompt,
-                'model': 'claude-3-haiku',  # Fast and free
-                'max_tokens': 1000
-            }
+        data = {
+            'prompt': prompt,
+            'model': 'claude-3-haiku',  # Fast and free
+            'max_tokens': 1000
+        }
+        return self._cached_analysis(prompt, data, lambda: self._request_claude(data))
 
+    def _request_claude(self, data: Dict) -> Dict:
+        try:
             # Claude provides better reasoning for complex market analysis
             # Send via Zapier MCP
             headers = {
@@ -145,13 +240,15 @@ class ZapierAIIntegration:
 
         FREE via Zapier AI Actions
         """
-        try:
-            data = {
-                'prompt': prompt,
-                'model': 'gemini-pro',
-                'temperature': 0.2
-            }
+        data = {
+            'prompt': prompt,
+            'model': 'gemini-pro',
+            'temperature': 0.2
+        }
+        return self._cached_analysis(prompt, data, lambda: self._request_gemini(data))
 
+    def _request_gemini(self, data: Dict) -> Dict:
+        try:
             # Gemini is great for pattern recognition
             return {
                 'analysis': 'Gemini analysis via Zapier',
@@ -165,12 +262,17 @@ class ZapierAIIntegration:
             logger.error(f"Gemini analysis error: {e}")
             return {'error': str(e)}
 
-    def get_consensus_ai_signal(self, market_data: Dict) -> Dict:
+    def get_consensus_ai_signal(self, market_data: Dict, parallel: bool = True,
+                                quorum: Optional[int] = None, timeout: Optional[float] = None) -> Dict:
         """
         Get consensus trading signal from multiple AIs
 
         Uses: ChatGPT + Claude + Gemini (all FREE via Zapier)
         This increases accuracy to 91-95%!
+
+        parallel=True asks all models at once and returns as soon as
+        ``quorum`` of them agree (latency of the quorum-th answer, not the
+        slowest model); parallel=False asks them one after another.
         """
         logger.info("🤖 Getting consensus from ChatGPT, Claude, and Gemini...")
 
@@ -186,42 +288,144 @@ class ZapierAIIntegration:
         News Sentiment: {market_data.get('news_sentiment', 'neutral')}
         Social Sentiment: {market_data.get('social_sentiment', 'neutral')}
 
-        Provide:
-        1. Trading signal (BUY/SELL/HOLD)
-        2. Confidence level (0-100%)
-        3. Key reasons (3-5 bullet points)
-        4. Risk assessment
+        Reply with only a JSON object, no other text:
+        {{"signal": "BUY" | "SELL" | "HOLD", "confidence": <0-100>,
+          "reasons": [<3-5 short reasons>], "risk": "<one-line risk assessment>"}}
 
         Be concise and data-driven.
         """
 
-        # Get analysis from all three AIs
-        chatgpt_analysis = self.analyze_with_chatgpt(prompt)
-        claude_analysis = self.analyze_with_claude(prompt)
-        gemini_analysis = self.analyze_with_gemini(prompt)
+        started = time.perf_counter()
+        quorum = min(quorum or self.consensus_quorum, len(self.models))
+        if parallel:
+            analyses, votes, hedged = self._gather_quorum(prompt, quorum, timeout or self.consensus_timeout)
+        else:
+            analyses, votes, hedged = {}, {}, []
+            for key, (_, analyze) in self.models.items():
+                analyses[key] = self._timed(key, analyze, prompt)
+                votes[key] = parse_ai_signal(analyses[key])
 
         # Combine results for consensus
         consensus = {
             'timestamp': datetime.now().isoformat(),
             'symbol': market_data.get('symbol'),
             'ai_models_used': ['ChatGPT', 'Claude', 'Gemini'],
-            'chatgpt': chatgpt_analysis,
-            'claude': claude_analysis,
-            'gemini': gemini_analysis,
+            'chatgpt': analyses.get('chatgpt'),
+            'claude': analyses.get('claude'),
+            'gemini': analyses.get('gemini'),
             'consensus_signal': 'HOLD',  # Default
             'consensus_confidence': 0.0,
             'agreement_level': 'low',
+            'quorum': quorum,
+            'votes': {key: vote[0] for key, vote in votes.items() if vote},
+            'responded': [self.models[key][0] for key in analyses if 'error' not in analyses[key]],
+            'not_responded': [name for key, (name, _) in self.models.items()
+                              if key not in analyses or 'error' in analyses[key]],
+            'hedged': [self.models[key][0] for key in hedged],
+            'latency_ms': (time.perf_counter() - started) * 1000,
             'via': 'Zapier AI (FREE)'
         }
 
-        # Calculate consensus (simplified - in production, parse AI responses)
-        # When all 3 AIs agree, confidence is 91-95%!
-
+        # Signal backed by the most models; it only counts once it meets the quorum
+        tally: Dict[str, List[float]] = {}
+        for vote in votes.values():
+            if vote:
+                tally.setdefault(vote[0], []).append(vote[1])
+        if tally:
+            signal, confidences = max(tally.items(), key=lambda item: len(item[1]))
+            if len(confidences) >= quorum:
+                consensus['consensus_signal'] = signal
+                consensus['consensus_confidence'] = sum(confidences) / len(confidences)
+                consensus['agreement_level'] = 'high' if len(confidences) == len(self.models) else 'medium'
+
+        if consensus['not_responded']:
+            logger.warning(f"⚠️  No answer from: {', '.join(consensus['not_responded'])}")
         logger.info(f"✅ AI Consensus: {consensus['consensus_signal']} "
-                   f"@ {consensus['consensus_confidence']:.0f}% confidence")
+                   f"@ {consensus['consensus_confidence']:.0f}% confidence "
+                   f"({consensus['latency_ms']:.0f}ms)")
 
         return consensus
 
+    def _timed(self, key: str, analyze, prompt: str) -> Dict:
+        started = time.perf_counter()
+        result = analyze(prompt)
+        if 'error' not in result and not result.get('cached'):
+            self.model_latency[key].append(time.perf_counter() - started)
+        return result
+
+    def _hedge_delay(self, key: str) -> Optional[float]:
+        """Seconds before a duplicate request is sent to a slow model"""
+        if self.hedge_after is not None:
+            return self.hedge_after
+        samples = sorted(self.model_latency[key])
+        if len(samples) < 5:
+            return None  # not enough history to tell slow from normal
+        return samples[int(len(samples) * 0.9) - 1]
+
+    def _gather_quorum(self, prompt: str, quorum: int, timeout: float):
+        """
+        Ask every model at once; stop when ``quorum`` votes agree or agreement
+        becomes impossible. A model still running after its hedge delay gets
+        one duplicate request and the first answer wins. Calls still running
+        at the end are abandoned (queued ones are cancelled); their models
+        are reported as not responded.
+        """
+        started = time.monotonic()
+        deadline = started + timeout
+        pending = {self._executor.submit(self._timed, key, analyze, prompt): key
+                   for key, (_, analyze) in self.models.items()}
+        analyses: Dict[str, Dict] = {}
+        votes: Dict[str, Optional[Tuple[str, float]]] = {}
+        hedged: List[str] = []
+
+        while pending:
+            # Wake at the deadline or the next hedge point, whichever is first
+            now = time.monotonic()
+            wake = deadline
+            for key in set(pending.values()) - set(hedged):
+                delay = self._hedge_delay(key)
+                if delay is not None:
+                    wake = min(wake, started + delay)
+            done, _ = wait(list(pending), timeout=max(0.0, wake - now), return_when=FIRST_COMPLETED)
+
+            for future in done:
+                key = pending.pop(future)
+                if key in analyses:
+                    continue  # the other copy of a hedged call already answered
+                result = future.result()
+                if 'error' in result and key in pending.values():
+                    continue  # a hedged copy is still running; wait for it
+                analyses[key] = result
+                votes[key] = parse_ai_signal(result)
+                for other, other_key in list(pending.items()):
+                    if other_key == key:
+                        other.cancel()
+                        pending.pop(other)
+
+            counts: Dict[str, int] = {}
+            for vote in votes.values():
+                if vote:
+                    counts[vote[0]] = counts.get(vote[0], 0) + 1
+            outstanding = len(set(pending.values()))
+            if counts and max(counts.values()) >= quorum:
+                break
+            if max(counts.values(), default=0) + outstanding < quorum:
+                break  # the remaining models cannot form a quorum
+
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            for key in set(pending.values()) - set(hedged):
+                delay = self._hedge_delay(key)
+                if delay is not None and now - started >= delay:
+                    hedged.append(key)
+                    logger.info(f"⏱️  {self.models[key][0]} slower than {delay:.1f}s, sending hedged request")
+                    pending[self._executor.submit(self._timed, key, self.models[key][1], prompt)] = key
+
+        for future in pending:
+            future.cancel()
+        return analyses, votes, hedged
+
     def send_trade_to_google_sheets(self, trade_data: Dict) -> bool:
         """
         Log trade to Google Sheets via Zapier (FREE)
@@ -1,16 +1,28 @@
 """
 Zapier MCP (Model Context Protocol) Connector
 Integrates Agent X2.0 with Zapier via MCP endpoint
+
+With the outbound queue enabled (``ZapierMCPConnector(queued=True)`` or
+ZAPIER_OUTBOUND_QUEUE=1), trigger_zap, send_trading_signal, log_to_sheets,
+send_email_alert and trigger_webhook enqueue to a durable local queue and
+return a delivery id at once; see zapier_outbound_queue.py. Only the
+Sheets zap is batched by default (one call carries many rows); other zaps
+keep one event per call unless listed in ``batch_zaps``, because a batch
+changes the payload to ``{"events": [...], "count": n}``. Once the queue
+is closed (e.g. at exit), events are sent directly instead.
 """
 
 import os
 import json
+import uuid
 import requests
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from pathlib import Path
 
+from zapier_outbound_queue import QueueClosed, ZapierOutboundQueue, batch_key
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger('ZapierMCP')
 
@@ -23,6 +35,11 @@ try:
 except ImportError:
     logger.warning("python-dotenv not installed. Install with: pip install python-dotenv")
 
+OUTBOX_PATH = Path(__file__).parent.parent.parent / 'logs' / 'zapier_outbox.db'
+SHEETS_ZAP = "Log to Google Sheets"
+WEBHOOK_TARGET = "__webhook__"  # queue name for trigger_webhook events
+BATCH_ZAPS = {SHEETS_ZAP}  # zaps whose receivers accept several events per call
+
 
 class ZapierMCPConnector:
     """
@@ -30,7 +47,7 @@ class ZapierMCPConnector:
     Provides programmatic access to Zapier Zaps via MCP
     """
 
-    def __init__(self):
+    def __init__(self, queued: Optional[bool] = None, outbox_path: Optional[Path] = None, **queue_options):
         self.endpoint = os.getenv('ZAPIER_MCP_ENDPOINT', 'https://mcp.zapier.com/api/mcp/mcp')
         self.bearer_token = os.getenv('ZAPIER_MCP_BEARER_TOKEN')
         self.webhook_url = os.getenv('ZAPIER_WEBHOOK_URL')
@@ -43,6 +60,13 @@ class ZapierMCPConnector:
             'Content-Type': 'application/json'
         }
 
+        if queued is None:
+            queued = os.getenv('ZAPIER_OUTBOUND_QUEUE', '').lower() in ('1', 'true', 'yes')
+        self.outbound: Optional[ZapierOutboundQueue] = None
+        if queued:
+            queue_options.setdefault('batch_zaps', BATCH_ZAPS)
+            self.outbound = ZapierOutboundQueue(self._deliver_batch, outbox_path or OUTBOX_PATH, **queue_options)
+
         logger.info("Zapier MCP Connector initialized")
 
     def check_connection(self) -> Dict[str, Any]:
@@ -111,26 +135,54 @@ class ZapierMCPConnector:
 
     def trigger_zap(self, zap_name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Trigger a specific Zap via MCP
+        Trigger a specific Zap via MCP (queued when the outbound queue is enabled)
 
         Args:
             zap_name: Name of the Zap to trigger
             payload: Data to send to the Zap
 
         Returns:
-            Response from Zapier
+            Response from Zapier, or the delivery id when queued
         """
+        if self.outbound:
+            return self._enqueue(zap_name, payload)
+        return self._post_zap(zap_name, payload)
+
+    def _enqueue(self, zap_name: str, payload: Dict[str, Any], group_key: str = '') -> Dict[str, Any]:
+        try:
+            delivery_id = self.outbound.enqueue(zap_name, payload, group_key)
+        except QueueClosed:
+            # Queue already shut down (atexit): send now so the event is not lost
+            logger.warning(f"⚠️  Outbound queue closed, sending {zap_name} directly")
+            return self._deliver_batch(zap_name, group_key, [(uuid.uuid4().hex, payload)])
+        return {
+            "success": True,
+            "queued": True,
+            "zap_name": zap_name,
+            "delivery_id": delivery_id,
+            "timestamp": datetime.now().isoformat()
+        }
+
+    def _post_zap(self, zap_name: str, payload: Dict[str, Any],
+                  delivery_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Send one trigger_zap call; delivery ids let Zapier drop redelivered events"""
+        headers = self.headers
+        body = {
+            "method": "trigger_zap",
+            "zap_name": zap_name,
+            "payload": payload
+        }
+        if delivery_ids:
+            headers = {**self.headers, 'Idempotency-Key': batch_key(delivery_ids)}
+            body["delivery_ids"] = delivery_ids
+
         try:
             logger.info(f"Triggering Zap: {zap_name}")
 
             response = requests.post(
                 self.endpoint,
-                headers=self.headers,
-                json={
-                    "method": "trigger_zap",
-                    "zap_name": zap_name,
-                    "payload": payload
-                },
+                headers=headers,
+                json=body,
                 timeout=30
             )
 
@@ -196,7 +248,30 @@ class ZapierMCPConnector:
             "data": data
         }
 
-        return self.trigger_zap("Log to Google Sheets", payload)
+        if self.outbound:
+            # Rows queued for the same sheet go out as one row-append
+            return self._enqueue(SHEETS_ZAP, payload, group_key=sheet_name)
+        return self.trigger_zap(SHEETS_ZAP, payload)
+
+    def log_rows_to_sheets(self, rows: List[Dict[str, Any]], sheet_name: str = "Trade Log",
+                           delivery_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Append several rows to a Google Sheet in one Zapier call
+
+        Args:
+            rows: Row data, in order
+            sheet_name: Name of the Google Sheet
+            delivery_ids: Delivery ids of the rows (set by the outbound queue)
+
+        Returns:
+            Zapier response
+        """
+        payload = {
+            "sheet_name": sheet_name,
+            "timestamp": datetime.now().isoformat(),
+            "rows": rows
+        }
+        return self._post_zap(SHEETS_ZAP, payload, delivery_ids)
 
     def send_email_alert(self, subject: str, body: str, recipients: List[str] = None) -> Dict[str, Any]:
         """
@@ -278,10 +353,17 @@ class ZapierMCPConnector:
             logger.error("ZAPIER_WEBHOOK_URL not configured")
             return {"success": False, "error": "Webhook URL not configured"}
 
+        if self.outbound:
+            return self._enqueue(WEBHOOK_TARGET, data)
+        return self._post_webhook(data)
+
+    def _post_webhook(self, data: Dict[str, Any], delivery_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+        headers = {'Idempotency-Key': batch_key(delivery_ids)} if delivery_ids else None
         try:
             response = requests.post(
                 self.webhook_url,
                 json=data,
+                headers=headers,
                 timeout=10
             )
 
@@ -305,6 +387,30 @@ class ZapierMCPConnector:
                 "error": str(e)
             }
 
+    def _deliver_batch(self, zap_name: str, group_key: str, events: List[tuple]) -> Dict[str, Any]:
+        """Outbound queue sender: one call per batch (several events only for batch_zaps)"""
+        delivery_ids = [delivery_id for delivery_id, _ in events]
+        payloads = [payload for _, payload in events]
+
+        if zap_name == SHEETS_ZAP:
+            rows = [{**payload["data"], "logged_at": payload["timestamp"]} for payload in payloads]
+            return self.log_rows_to_sheets(rows, group_key, delivery_ids)
+        if zap_name == WEBHOOK_TARGET:
+            data = payloads[0] if len(payloads) == 1 else {"events": payloads, "delivery_ids": delivery_ids}
+            return self._post_webhook(data, delivery_ids)
+        if len(payloads) == 1:
+            return self._post_zap(zap_name, payloads[0], delivery_ids)
+        return self._post_zap(zap_name, {"events": payloads, "count": len(payloads)}, delivery_ids)
+
+    def flush(self, timeout: float = 30.0) -> bool:
+        """Wait for queued deliveries (no-op without the outbound queue)"""
+        return self.outbound.flush(timeout) if self.outbound else True
+
+    def close(self):
+        """Persist anything still queued and stop the outbound workers"""
+        if self.outbound:
+            self.outbound.close()
+
     def get_spending_status(self) -> Dict[str, Any]:
         """
         Check Zapier MCP spending status
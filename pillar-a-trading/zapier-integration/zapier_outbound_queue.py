@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Zapier Outbound Queue
+Durable local queue for Zapier deliveries, drained in batches by a worker pool
+
+enqueue() appends to an in-memory buffer and returns a delivery id. It does
+no I/O, so callers return in microseconds. A dispatcher thread does three jobs:
+- it writes the buffer to SQLite (WAL mode) in one transaction per cycle;
+- it claims due events, grouped by (zap_name, group_key);
+- it hands each group to the worker pool as one batch. Only zaps listed in
+  ``batch_zaps`` get batches of up to max_batch events; every other zap is
+  sent one event per call, so its payload shape is unchanged.
+
+Delivery:
+- Each event carries a delivery id that never changes. Retries and batches
+  resend the same ids, so the receiver can drop duplicates (exactly-once
+  on its side).
+- Enqueueing a delivery id that already exists is ignored.
+- Delivered events are deleted.
+- A failed batch is retried with exponential backoff plus jitter. Batch
+  membership is fixed at the first claim (batch_id on the rows), so a retry
+  resends exactly the same events under the same idempotency key.
+- Events of one group are delivered in order: while the oldest event of a
+  group backs off, the group waits with it.
+- After max_attempts, or on a non-retryable 4xx, events are moved to the
+  dead letters.
+- Events that were in flight when the process stopped are sent again on
+  the next start.
+
+Buffered events reach disk within one dispatcher cycle (about ``linger``).
+close() and flush() write out anything still buffered. After close(),
+enqueue() raises QueueClosed rather than accepting an event nobody will send.
+"""
+
+import atexit
+import hashlib
+import itertools
+import json
+import logging
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger('ZapierOutboundQueue')
+
+PENDING = 'pending'
+INFLIGHT = 'inflight'
+DEAD = 'dead'
+
+# 403 is Zapier's spending cap (lifts at 3am); 408/429 are transient
+RETRYABLE_4XX = {403, 408, 409, 425, 429}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    delivery_id TEXT NOT NULL UNIQUE,
+    zap_name TEXT NOT NULL,
+    group_key TEXT NOT NULL DEFAULT '',
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    created_at REAL NOT NULL,
+    last_error TEXT,
+    batch_id TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_group ON outbox (status, zap_name, group_key, seq);
+"""
+
+# Oldest pending event of each group; a group is due when its head is
+HEADS = ("SELECT o.zap_name, o.group_key, o.next_attempt_at, o.batch_id FROM outbox o JOIN "
+         "(SELECT MIN(seq) AS seq FROM outbox WHERE status = 'pending' GROUP BY zap_name, group_key) h "
+         "ON o.seq = h.seq")
+
+# send(zap_name, group_key, [(delivery_id, payload), ...]) -> {"success": bool, "status_code"?, "error"?}
+BatchSender = Callable[[str, str, List[Tuple[str, Dict[str, Any]]]], Dict[str, Any]]
+
+
+def batch_key(delivery_ids: List[str]) -> str:
+    """Stable idempotency key of a batch (same ids -> same key)"""
+    return hashlib.sha256(','.join(delivery_ids).encode()).hexdigest()[:32]
+
+
+class QueueClosed(RuntimeError):
+    """enqueue() after close(): the event would never be delivered"""
+
+
+class ZapierOutboundQueue:
+    """SQLite-backed outbound queue with batching, backoff and dead letters"""
+
+    def __init__(self, send: BatchSender, path: Path, workers: int = 4, max_batch: int = 100,
+                 linger: float = 0.05, max_attempts: int = 8, base_backoff: float = 1.0,
+                 max_backoff: float = 600.0, batch_zaps: Iterable[str] = ()):
+        self.send = send
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.workers = workers
+        self.max_batch = max_batch
+        self.batch_zaps = set(batch_zaps)  # zaps that accept several events per call
+        self.linger = linger
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        self.counts = {'enqueued': 0, 'delivered': 0, 'batches': 0, 'failed_attempts': 0, 'dead': 0}
+
+        # Delivery ids: a random prefix per queue instance plus a counter
+        self._id_prefix = uuid.uuid4().hex[:16]
+        self._ids = itertools.count(1)
+        self._buffer: deque = deque()
+        self._results: deque = deque()
+        self._inflight_groups = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._idle = threading.Event()
+        self._stop = threading.Event()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='ZapierOutbound')
+
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.executescript(SCHEMA)
+        if 'batch_id' not in {row[1] for row in self._db.execute('PRAGMA table_info(outbox)')}:
+            self._db.execute('ALTER TABLE outbox ADD COLUMN batch_id TEXT')  # outbox from an older version
+        self._db.execute('CREATE INDEX IF NOT EXISTS outbox_batch ON outbox (batch_id)')
+        # A crash mid-send leaves rows in flight: resend them under the same ids
+        resumed = self._db.execute('UPDATE outbox SET status = ? WHERE status = ?', (PENDING, INFLIGHT)).rowcount
+        self._db.commit()
+        if resumed:
+            logger.warning(f"⚠️  Resending {resumed} Zapier events that were in flight at shutdown")
+
+        self._dispatcher = threading.Thread(target=self._run, name='ZapierOutbound-dispatch', daemon=True)
+        self._dispatcher.start()
+        atexit.register(self.close)
+        logger.info(f"✅ Zapier outbound queue at {self.path} ({workers} workers, batches of {max_batch})")
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def enqueue(self, zap_name: str, payload: Dict[str, Any], group_key: str = '',
+                delivery_id: Optional[str] = None) -> str:
+        """Queue one event for ``zap_name``; returns its delivery id (no I/O). Raises QueueClosed after close()"""
+        delivery_id = delivery_id or f'{self._id_prefix}-{next(self._ids)}'
+        # Shallow copy now, serialize on the dispatcher
+        with self._lock:
+            if self._stop.is_set():
+                raise QueueClosed(f"Zapier outbound queue at {self.path} is closed")
+            self._buffer.append((delivery_id, zap_name, group_key, dict(payload), time.time()))
+            self._idle.clear()
+        if not self._wake.is_set():
+            self._wake.set()
+        return delivery_id
+
+    def flush(self, timeout: Optional[float] = 30.0) -> bool:
+        """Wait until the queue is empty (everything delivered or dead); False on timeout"""
+        self._wake.set()
+        return self._idle.wait(timeout)
+
+    def close(self, timeout: float = 5.0):
+        """Write buffered events to disk and stop (in-flight batches get ``timeout`` to finish)"""
+        with self._lock:
+            if self._stop.is_set():
+                return
+            self._stop.set()  # under the lock: every accepted event is in the buffer the dispatcher persists
+        self._wake.set()
+        self._dispatcher.join(timeout)
+        self._pool.shutdown(wait=False)
+
+    # ------------------------------------------------------------------
+    # Inspection
+    # ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters since start plus the on-disk backlog by status"""
+        with closing(sqlite3.connect(str(self.path))) as db:
+            backlog = dict(db.execute('SELECT status, COUNT(*) FROM outbox GROUP BY status').fetchall())
+        return {**self.counts, 'buffered': len(self._buffer), 'backlog': backlog}
+
+    def dead_letters(self, limit: int = 100) -> List[Dict[str, Any]]:
+        with closing(sqlite3.connect(str(self.path))) as db:
+            rows = db.execute('SELECT delivery_id, zap_name, group_key, payload, attempts, last_error '
+                              'FROM outbox WHERE status = ? ORDER BY seq LIMIT ?', (DEAD, limit)).fetchall()
+        return [{'delivery_id': row[0], 'zap_name': row[1], 'group_key': row[2], 'payload': json.loads(row[3]),
+                 'attempts': row[4], 'last_error': row[5]} for row in rows]
+
+    def requeue_dead(self) -> int:
+        """Give dead letters a fresh set of attempts (e.g. after the spending cap resets)"""
+        with closing(sqlite3.connect(str(self.path))) as db, db:
+            count = db.execute('UPDATE outbox SET status = ?, attempts = 0, next_attempt_at = ? WHERE status = ?',
+                               (PENDING, time.time(), DEAD)).rowcount
+        self._idle.clear()
+        self._wake.set()
+        return count
+
+    # ------------------------------------------------------------------
+    # Dispatcher (the only thread that moves events through the queue)
+    # ------------------------------------------------------------------
+
+    def _run(self):
+        while True:
+            self._wake.wait(self._next_timeout())
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            if self.linger and self._buffer and not self._results:
+                self._stop.wait(self.linger)  # let a burst coalesce into one batch
+
+            try:
+                self._persist_buffer()
+                self._apply_results()
+                self._claim_batches()
+            except sqlite3.Error as e:
+                logger.error(f"❌ Zapier outbound queue error: {e}")
+                self._stop.wait(1.0)
+            self._update_idle()
+
+        # Shutdown: keep everything buffered and record finished batches
+        try:
+            self._persist_buffer()
+            deadline = time.monotonic() + 5.0
+            while self._inflight_groups and time.monotonic() < deadline:
+                time.sleep(0.01)
+                self._apply_results()
+            self._apply_results()
+        finally:
+            self._db.close()
+
+    def _persist_buffer(self):
+        rows = []
+        while self._buffer:
+            delivery_id, zap_name, group_key, payload, created = self._buffer.popleft()
+            rows.append((delivery_id, zap_name, group_key, json.dumps(payload, default=str), created, created))
+        if rows:
+            with self._db:
+                inserted = self._db.executemany(
+                    'INSERT OR IGNORE INTO outbox (delivery_id, zap_name, group_key, payload, next_attempt_at, created_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?)', rows).rowcount
+            self.counts['enqueued'] += inserted  # a repeated delivery id is not queued twice
+
+    def _claim_batches(self):
+        free = self.workers - len(self._inflight_groups)
+        if free <= 0:
+            return
+        groups = self._db.execute(HEADS + ' WHERE o.next_attempt_at <= ? ORDER BY o.seq', (time.time(),)).fetchall()
+
+        for zap_name, group_key, _, batch_id in groups:
+            if free <= 0:
+                break
+            if (zap_name, group_key) in self._inflight_groups:
+                continue  # one batch per group at a time keeps per-zap order
+            if batch_id is not None:
+                # A retry: exactly the events of the first attempt, so the idempotency key matches
+                rows = self._db.execute(
+                    'SELECT seq, delivery_id, payload, attempts FROM outbox WHERE status = ? AND batch_id = ? '
+                    'ORDER BY seq', (PENDING, batch_id)).fetchall()
+            else:
+                limit = self.max_batch if zap_name in self.batch_zaps else 1
+                rows = self._db.execute(
+                    'SELECT seq, delivery_id, payload, attempts FROM outbox WHERE status = ? AND zap_name = ? '
+                    'AND group_key = ? AND batch_id IS NULL ORDER BY seq LIMIT ?',
+                    (PENDING, zap_name, group_key, limit)).fetchall()
+                batch_id = batch_key([row[1] for row in rows])
+            if not rows:
+                continue
+            with self._db:
+                self._db.executemany('UPDATE outbox SET status = ?, batch_id = ? WHERE seq = ?',
+                                     [(INFLIGHT, batch_id, row[0]) for row in rows])
+            self._inflight_groups.add((zap_name, group_key))
+            free -= 1
+
+            events = [(row[1], json.loads(row[2])) for row in rows]
+            future = self._pool.submit(self._send, zap_name, group_key, events)
+            future.add_done_callback(
+                lambda f, key=(zap_name, group_key), rows=rows: self._finished(key, rows, f.result()))
+
+    def _send(self, zap_name: str, group_key: str, events: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+        try:
+            return self.send(zap_name, group_key, events) or {'success': False, 'error': 'no response'}
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
+
+    def _finished(self, key: Tuple[str, str], rows: List[tuple], result: Dict[str, Any]):
+        self._results.append((key, rows, result))
+        self._wake.set()
+
+    def _apply_results(self):
+        while self._results:
+            key, rows, result = self._results.popleft()
+            self._inflight_groups.discard(key)
+            self.counts['batches'] += 1
+
+            if result.get('success'):
+                with self._db:
+                    self._db.executemany('DELETE FROM outbox WHERE seq = ?', [(row[0],) for row in rows])
+                self.counts['delivered'] += len(rows)
+                continue
+
+            status_code = result.get('status_code')
+            permanent = status_code is not None and 400 <= status_code < 500 and status_code not in RETRYABLE_4XX
+            error = str(result.get('error', status_code))[:500]
+            self.counts['failed_attempts'] += 1
+            updates = []
+            for seq, _, _, attempts in rows:
+                attempts += 1
+                if permanent or attempts >= self.max_attempts:
+                    updates.append((DEAD, attempts, time.time(), error, seq))
+                    self.counts['dead'] += 1
+                else:
+                    updates.append((PENDING, attempts, time.time() + self._backoff(attempts), error, seq))
+            with self._db:
+                self._db.executemany('UPDATE outbox SET status = ?, attempts = ?, next_attempt_at = ?, '
+                                     'last_error = ? WHERE seq = ?', updates)
+            if permanent or any(update[0] == DEAD for update in updates):
+                logger.error(f"❌ Zapier batch for {key[0]} dead-lettered after {rows[0][3] + 1} attempts: {error}")
+            else:
+                logger.warning(f"⚠️  Zapier batch for {key[0]} failed ({error}), retrying with backoff")
+
+    def _backoff(self, attempts: int) -> float:
+        # Exponential, with jitter over the upper half so retries do not align
+        delay = min(self.max_backoff, self.base_backoff * (2 ** (attempts - 1)))
+        return delay * random.uniform(0.5, 1.0)
+
+    def _next_timeout(self) -> float:
+        if self._stop.is_set():
+            return 0
+        row = self._db.execute('SELECT MIN(next_attempt_at) FROM (' + HEADS + ')').fetchone()
+        if row[0] is None:
+            return 60.0
+        wait = row[0] - time.time()
+        if wait <= 0:
+            # Due but blocked on busy workers or its group's batch: a finished batch wakes us
+            return 60.0 if self._inflight_groups else 0.01
+        return min(60.0, wait)
+
+    def _update_idle(self):
+        pending = self._db.execute('SELECT 1 FROM outbox WHERE status = ? LIMIT 1', (PENDING,)).fetchone()
+        with self._lock:
+            if not self._buffer and not self._results and not self._inflight_groups and not pending:
+                self._idle.set()
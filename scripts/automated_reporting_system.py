@@ -2,9 +2,14 @@
 """
 Automated Reporting System
 Sends daily (morning) and weekly performance reports via email
+
+Reports read period rollups (StatsRollupStore) that are updated
+incrementally as stats snapshots land, so a report touches one bucket per
+period shown rather than every stats file in logs/. Period figures cover
+the last completed period (yesterday, last ISO week): reports go out at
+07:00, when the current bucket has barely started.
 """
 
-import json
 import os
 import sys
 import smtplib
@@ -18,6 +23,9 @@ import schedule
 import time
 import logging
 
+sys.path.insert(0, str(Path(__file__).parent))
+from stats_rollup_store import PORTFOLIO, StatsRollupStore, completed_keys, period_metrics, summarize_accounts
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger('ReportingSystem')
 
@@ -31,68 +39,37 @@ class AutomatedReportingSystem:
         self.smtp_server = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
         self.smtp_port = int(os.getenv('SMTP_PORT', '587'))
         self.smtp_password = os.getenv('SMTP_PASSWORD', '')
+        self.rollups = StatsRollupStore(Path('logs'))
 
     def get_latest_stats(self) -> Dict[str, Any]:
-        """Get latest trading statistics"""
+        """Get latest trading statistics (ingesting any new snapshots into the rollups)"""
         try:
-            logs_dir = Path('logs')
-            stats_files = sorted(logs_dir.glob('trading_stats_*.json'), reverse=True)
-
-            if stats_files:
-                with open(stats_files[0], 'r') as f:
-                    return json.load(f)
-            return {'timestamp': datetime.now().isoformat(), 'accounts': {}}
+            self.rollups.load()  # the trading launcher keeps the rollups current
+            self.rollups.sync()
         except Exception as e:
             logger.error(f"Error loading stats: {e}")
-            return {'timestamp': datetime.now().isoformat(), 'accounts': {}}
+        return self.rollups.latest_stats
 
     def calculate_summary_metrics(self, stats: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate summary metrics across all accounts"""
-        accounts = stats.get('accounts', {})
-
-        total_capital = 0
-        total_initial = 0
-        total_trades = 0
-        total_wins = 0
-        total_losses = 0
-        total_profit = 0
-        total_loss = 0
-        active_accounts = 0
-
-        for account in accounts.values():
-            total_capital += account['current_capital']
-            total_initial += account['initial_capital']
-            total_trades += account['total_trades']
-            total_wins += account['winning_trades']
-            total_losses += account['losing_trades']
-            total_profit += account['total_profit']
-            total_loss += account['total_loss']
-            if account['status'] == 'RUNNING':
-                active_accounts += 1
-
-        total_pnl = total_capital - total_initial
-        total_pnl_percent = (total_pnl / total_initial * 100) if total_initial > 0 else 0
-        win_rate = (total_wins / total_trades * 100) if total_trades > 0 else 0
-
-        return {
-            'total_capital': total_capital,
-            'total_initial': total_initial,
-            'total_pnl': total_pnl,
-            'total_pnl_percent': total_pnl_percent,
-            'total_trades': total_trades,
-            'total_wins': total_wins,
-            'total_losses': total_losses,
-            'win_rate': win_rate,
-            'total_profit': total_profit,
-            'total_loss': total_loss,
-            'active_accounts': active_accounts,
-            'total_accounts': len(accounts)
-        }
+        if stats is self.rollups.latest_stats:
+            return dict(self.rollups.latest_summary)  # computed once when the snapshot landed
+        return summarize_accounts(stats.get('accounts', {}))
+
+    def period_summary(self, period: str) -> Dict[str, Any]:
+        """Portfolio activity in the last completed daily/weekly/monthly bucket"""
+        entry = self.rollups.bucket(period, completed_keys(datetime.now())[period]).get(PORTFOLIO)
+        if entry is None:
+            return period_metrics({'open_capital': 0, 'close_capital': 0, 'open_trades': 0, 'close_trades': 0,
+                                   'open_wins': 0, 'close_wins': 0, 'open_losses': 0, 'close_losses': 0,
+                                   'max_drawdown': 0.0, 'high_capital': 0, 'low_capital': 0})
+        return period_metrics(entry)
 
     def generate_daily_report_html(self) -> str:
         """Generate HTML for daily morning report"""
         stats = self.get_latest_stats()
         metrics = self.calculate_summary_metrics(stats)
+        yesterday = self.period_summary('daily')
 
         html = f"""
         <!DOCTYPE html>
@@ -128,10 +105,10 @@ class AutomatedReportingSystem:
                         <div class="metric-value">${metrics['total_capital']:,.2f}</div>
                     </div>
                     <div class="metric">
-                        <div class="metric-label">24h P/L</div>
-                        <div class="metric-value {'positive' if metrics['total_pnl'] >= 0 else 'negative'}">
-                            {'+'if metrics['total_pnl'] >= 0 else ''}{metrics['total_pnl']:,.2f}
-                            ({'+' if metrics['total_pnl_percent'] >= 0 else ''}{metrics['total_pnl_percent']:.2f}%)
+                        <div class="metric-label">Yesterday P/L</div>
+                        <div class="metric-value {'positive' if yesterday['pnl'] >= 0 else 'negative'}">
+                            {'+'if yesterday['pnl'] >= 0 else ''}{yesterday['pnl']:,.2f}
+                            ({'+' if yesterday['pnl_percent'] >= 0 else ''}{yesterday['pnl_percent']:.2f}%)
                         </div>
                     </div>
                     <div class="metric">
@@ -152,6 +129,21 @@ class AutomatedReportingSystem:
                         <div class="metric-label">Wins / Losses</div>
                         <div class="metric-value">{metrics['total_wins']} / {metrics['total_losses']}</div>
                     </div>
+                    <div class="metric">
+                        <div class="metric-label">Total P/L</div>
+                        <div class="metric-value {'positive' if metrics['total_pnl'] >= 0 else 'negative'}">
+                            {'+'if metrics['total_pnl'] >= 0 else ''}{metrics['total_pnl']:,.2f}
+                            ({'+' if metrics['total_pnl_percent'] >= 0 else ''}{metrics['total_pnl_percent']:.2f}%)
+                        </div>
+                    </div>
+                    <div class="metric">
+                        <div class="metric-label">Trades Yesterday</div>
+                        <div class="metric-value">{yesterday['trades']}</div>
+                    </div>
+                    <div class="metric">
+                        <div class="metric-label">Max Drawdown Yesterday</div>
+                        <div class="metric-value">{yesterday['max_drawdown']:.2f}%</div>
+                    </div>
                 </div>
 
                 <h2>Account Performance Details</h2>
@@ -206,22 +198,47 @@ class AutomatedReportingSystem:
 
     def generate_weekly_report_html(self) -> str:
         """Generate HTML for weekly report (more detailed)"""
-        # Weekly report includes trends, charts, and deeper analysis
+        # Weekly report adds last week's rollup and recent trends
         daily_html = self.generate_daily_report_html()
+        week = self.period_summary('weekly')
+        completed = completed_keys(datetime.now())
+        ranked = self.rollups.ranked_accounts('weekly', completed['weekly'])
+
+        def pnl_cell(pnl: float, pnl_percent: float) -> str:
+            sign = '+' if pnl >= 0 else ''
+            return (f'<td class="{"positive" if pnl >= 0 else "negative"}">'
+                    f'{sign}{pnl:,.2f} ({sign}{pnl_percent:.2f}%)</td>')
 
-        # Add weekly-specific sections
-        weekly_additions = """
+        weekly_additions = f"""
         <div style="margin-top: 30px; padding: 20px; background: #f8f9fa; border-radius: 5px;">
             <h2>📈 Weekly Insights</h2>
             <ul>
-                <li><strong>Best Performing Account:</strong> Analysis of top performer</li>
-                <li><strong>Strategy Effectiveness:</strong> Which patterns worked best</li>
-                <li><strong>Risk Analysis:</strong> Drawdowns and risk metrics</li>
-                <li><strong>Recommendations:</strong> Suggested adjustments for next week</li>
+                <li><strong>Last Week P/L:</strong> {'+' if week['pnl'] >= 0 else ''}{week['pnl']:,.2f}
+                    ({'+' if week['pnl_percent'] >= 0 else ''}{week['pnl_percent']:.2f}%)</li>
+                <li><strong>Trades Last Week:</strong> {week['trades']} (win rate {week['win_rate']:.1f}%)</li>
+                <li><strong>Max Drawdown:</strong> {week['max_drawdown']:.2f}%</li>
+                <li><strong>Best Performing Account:</strong>
+                    {f"{ranked[0]['name']} ({ranked[0]['pnl_percent']:+.2f}%)" if ranked else 'n/a'}</li>
+                <li><strong>Worst Performing Account:</strong>
+                    {f"{ranked[-1]['name']} ({ranked[-1]['pnl_percent']:+.2f}%)" if ranked else 'n/a'}</li>
             </ul>
-        </div>
         """
 
+        for title, period, count in (('Last 7 Days', 'daily', 7), ('Last 8 Weeks', 'weekly', 8)):
+            weekly_additions += f"""
+            <h3>{title}</h3>
+            <table class="account-table">
+                <thead><tr><th>Period</th><th>P/L</th><th>Trades</th><th>Win Rate</th><th>Max Drawdown</th></tr></thead>
+                <tbody>
+            """
+            for row in self.rollups.history(period, count, until=completed[period]):
+                weekly_additions += (f"<tr><td>{row['period']}</td>{pnl_cell(row['pnl'], row['pnl_percent'])}"
+                                     f"<td>{row['trades']}</td><td>{row['win_rate']:.1f}%</td>"
+                                     f"<td>{row['max_drawdown']:.2f}%</td></tr>")
+            weekly_additions += "</tbody></table>"
+
+        weekly_additions += "</div>"
+
         # Insert before footer
         return daily_html.replace('<div class="footer">', weekly_additions + '<div class="footer">')
 
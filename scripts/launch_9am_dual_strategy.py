@@ -9,6 +9,7 @@ import os
 import sys
 import time
 import logging
+import numpy as np
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, List
@@ -24,6 +25,7 @@ sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
 from pillar_a_trading.strategies.big_short_strategy import BigShortStrategy
 from pillar_a_trading.strategies.momentum_short_strategy import MomentumShortStrategy
 from pillar_a_trading.strategies.technical_breakdown_short_strategy import TechnicalBreakdownShortStrategy
+from pillar_a_trading.strategies.universe_columns import decode_reason_codes, records_to_universe
 from paper_trade_executor import PaperTradeExecutor
 
 # Logging
@@ -142,17 +144,42 @@ def synth_market_data() -> List[Dict[str, Any]]:
     ]
 
 
+def synth_price_path(price: float, bars: int = 30, volatility: float = 0.01) -> List[Dict[str, Any]]:
+    """Synthetic OHLC random walk from ``price`` used to replay a paper position."""
+    closes = price * np.exp(np.cumsum(np.random.normal(0.0, volatility, bars)))
+    opens = np.concatenate(([price], closes[:-1]))
+    wicks = np.abs(np.random.normal(0.0, volatility / 2, (2, bars)))
+    highs = np.maximum(opens, closes) * (1 + wicks[0])
+    lows = np.minimum(opens, closes) * (1 - wicks[1])
+    return [
+        {"open": o, "high": h, "low": l, "close": c}
+        for o, h, l, c in zip(opens.tolist(), highs.tolist(), lows.tolist(), closes.tolist())
+    ]
+
+
 def collect_signals(strategies, market_data: List[Dict[str, Any]], threshold: float) -> List[Dict[str, Any]]:
     signals: List[Dict[str, Any]] = []
-    for snapshot in market_data:
-        symbol = snapshot.get("symbol", "UNKNOWN")
-        for strat in strategies:
-            sig = strat.analyze_for_short(symbol, snapshot)
-            if sig.get("action") in {"SHORT", "SHORT_SMALL"} and sig.get("confidence", 0) >= threshold:
-                signals.append(sig)
-    # Sort by confidence descending
-    signals.sort(key=lambda s: s.get("confidence", 0), reverse=True)
-    return signals
+    order: List[tuple] = []
+    universe = records_to_universe(market_data)
+    timestamp = datetime.now().isoformat()
+    for position, strat in enumerate(strategies):
+        batch = strat.analyze_for_short_batch(universe)
+        selected = np.isin(batch["action"], ["SHORT", "SHORT_SMALL"]) & (batch["confidence"] >= threshold)
+        for index in np.flatnonzero(selected):
+            order.append((int(index), position))
+            signals.append({
+                "symbol": str(batch["symbol"][index]),
+                "action": str(batch["action"][index]),
+                "confidence": float(batch["confidence"][index]),
+                "strategy": batch["strategy"],
+                "reasons": decode_reason_codes(batch["reason_codes"][index], strat.REASON_CODES),
+                "risk_level": "high_reward" if batch["action"][index] == "SHORT" else "medium",
+                "price": market_data[index].get("price"),
+                "timestamp": timestamp,
+            })
+    # Sort by confidence descending (ties keep snapshot-then-strategy order)
+    ranked = sorted(range(len(signals)), key=lambda k: (-signals[k]["confidence"], order[k]))
+    return [signals[k] for k in ranked]
 
 
 def _get_float_env(
@@ -323,6 +350,8 @@ def main() -> int:
                 if executed >= max_positions:
                     break
                 pos = executor.open_short(sig)
+                if pos.entry_price is not None:
+                    executor.replay(pos.symbol, synth_price_path(pos.entry_price))
                 result = executor.close_position(pos)
                 executed += 1
                 logger.info(
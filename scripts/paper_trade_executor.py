@@ -1,12 +1,20 @@
 #!/usr/bin/env python3
 """
 Paper trading executor used by launch_9am_dual_strategy.
-Simulates fills and P/L with simple probabilistic outcomes.
+Fills orders through the simulated MatchingEngine: a market entry plus a
+stop-loss / take-profit bracket that trades against replayed prices.
+Both bracket legs are off-book triggers (STOP and TAKE_PROFIT), so later
+entries on the same symbol never fill against an earlier position's exits.
+Entries and exits may fill in pieces; each side accumulates a VWAP.
 """
-import random
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Any, List
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "pillar-a-trading" / "bots" / "execution"))
+from matching_engine import BUY, SELL, STOP, TAKE_PROFIT, FILLED, REJECTED, Fill, MatchingEngine, SlippageModel
 
 
 @dataclass
@@ -18,65 +26,189 @@ class PaperPosition:
     opened_at: str
     strategy: str
     reasons: List[str] = field(default_factory=list)
+    position_id: int = 0
+    quantity: float = 0.0
+    filled_quantity: float = 0.0
+    entry_notional: float = 0.0
+    entry_price: Optional[float] = None  # VWAP of the entry fills
+    exit_quantity: float = 0.0
+    exit_notional: float = 0.0
+    opened: bool = False
+    entry_order_id: Optional[int] = None
+    stop_order_id: Optional[int] = None
+    target_order_id: Optional[int] = None
+    result: Optional[Dict[str, Any]] = None
 
 
 class PaperTradeExecutor:
-    """Lightweight paper-trade simulator for short strategies."""
+    """Paper-trade simulator for short strategies backed by the matching engine."""
 
-    def __init__(self, balance: float, risk_per_trade: float = 0.02):
+    def __init__(self, balance: float, risk_per_trade: float = 0.02,
+                 engine: Optional[MatchingEngine] = None,
+                 stop_loss_pct: float = 0.02, take_profit_pct: float = 0.04):
         self.start_balance = balance
         self.balance = balance
         self.risk_per_trade = risk_per_trade
-        self.positions: List[PaperPosition] = []
+        self.stop_loss_pct = stop_loss_pct
+        self.take_profit_pct = take_profit_pct
+        self.engine = engine or MatchingEngine(slippage=SlippageModel(bps=5))
+        self.engine.on_fill(self._on_fill)
+
+        self.positions: Dict[int, PaperPosition] = {}
         self.realized_pnl = 0.0
         self.wins = 0
         self.losses = 0
         self.total_trades = 0
 
+        self._next_id = 1
+
     def _position_size(self) -> float:
         return self.balance * self.risk_per_trade
 
     def open_short(self, signal: Dict[str, Any]) -> PaperPosition:
+        """Sell at market and place a buy-stop / buy-limit bracket once filled."""
         size = self._position_size()
+        symbol = signal.get("symbol", "UNKNOWN")
+        price = signal.get("price")
+        if price:
+            self.engine.on_tick(symbol, float(price))
+        last = self.engine.book(symbol).last_price
+
         pos = PaperPosition(
-            symbol=signal.get("symbol", "UNKNOWN"),
+            symbol=symbol,
             side=signal.get("action", "SHORT"),
             size=size,
             confidence=signal.get("confidence", 0.0),
             opened_at=datetime.now().isoformat(),
             strategy=signal.get("strategy", "unknown"),
             reasons=signal.get("reasons", [])[:5],
+            position_id=self._next_id,
+            quantity=size / last if last else 0.0,
         )
-        self.positions.append(pos)
-        self.total_trades += 1
+        self._next_id += 1
+        self.positions[pos.position_id] = pos
+
+        # A zero-latency entry fills inside submit(), so fills are routed by tag
+        order = self.engine.submit(symbol, SELL, pos.quantity, tag=self._tag(pos, "entry"))
+        pos.entry_order_id = order.order_id
+        if order.status == REJECTED:
+            if pos.filled_quantity > 0:
+                self._open(pos)  # partly filled before the rest was rejected
+            else:
+                self._settle(pos, None)
         return pos
 
+    def mark(self, symbol: str, price: float) -> None:
+        """Feed one price to the engine (may trigger brackets)."""
+        self.engine.on_tick(symbol, price)
+
+    def replay(self, symbol: str, candles: List[Dict[str, Any]], bar_seconds: float = 60.0) -> None:
+        """Replay OHLC candles so open brackets can stop out or take profit."""
+        self.engine.replay_candles(symbol, candles, bar_seconds)
+
     def close_position(self, position: PaperPosition) -> Dict[str, Any]:
-        # Bias wins to the confidence score (clamped between 0 and 98%)
-        win_prob = min(0.98, max(0.0, position.confidence))
-        is_win = random.random() < win_prob
-
-        # Profit/loss magnitudes are modest to reflect short-term trades
-        if is_win:
-            pct = random.uniform(0.015, 0.035)  # 1.5% to 3.5%
-            pnl = position.size * pct
-            self.wins += 1
+        """Buy back at market unless a bracket already closed the position."""
+        if position.result is None:
+            self._cancel_brackets(position)
+            self.engine.cancel(position.entry_order_id)  # no-op once filled
+            if position.filled_quantity <= 0:
+                # Entry never filled (no price yet or still in flight)
+                self._settle(position, None)
+                return position.result
+            if not position.opened:
+                self._open(position, brackets=False)
+
+            remaining = position.filled_quantity - position.exit_quantity
+            order = self.engine.submit(position.symbol, BUY, remaining, tag=self._tag(position, "exit"))
+            if position.result is None:
+                # Exit rejected or delayed by latency: the rest settles at the last price
+                self.engine.cancel(order.order_id)
+                last = self.engine.book(position.symbol).last_price
+                if last is not None:
+                    position.exit_notional += (position.filled_quantity - position.exit_quantity) * last
+                    position.exit_quantity = position.filled_quantity
+                self._settle(position, self._exit_vwap(position) or last)
+        return position.result
+
+    @staticmethod
+    def _tag(pos: PaperPosition, role: str) -> str:
+        return f"{pos.position_id}:{role}"
+
+    @staticmethod
+    def _exit_vwap(pos: PaperPosition) -> Optional[float]:
+        return pos.exit_notional / pos.exit_quantity if pos.exit_quantity else None
+
+    def _open(self, pos: PaperPosition, brackets: bool = True) -> None:
+        """Entry complete: count the trade and bracket the filled quantity (once)"""
+        if pos.opened:
+            return
+        pos.opened = True
+        self.total_trades += 1
+        if brackets:
+            self._place_brackets(pos)
+
+    def _place_brackets(self, pos: PaperPosition) -> None:
+        stop = self.engine.submit(pos.symbol, BUY, pos.filled_quantity, STOP,
+                                  stop_price=pos.entry_price * (1 + self.stop_loss_pct), tag=self._tag(pos, "stop"))
+        pos.stop_order_id = stop.order_id
+        if pos.result is not None or pos.exit_quantity > 0:
+            return
+        target = self.engine.submit(pos.symbol, BUY, pos.filled_quantity, TAKE_PROFIT,
+                                    price=pos.entry_price * (1 - self.take_profit_pct), tag=self._tag(pos, "target"))
+        pos.target_order_id = target.order_id
+
+    def _cancel_brackets(self, pos: PaperPosition) -> None:
+        for order_id in (pos.stop_order_id, pos.target_order_id):
+            if order_id is not None:
+                self.engine.cancel(order_id)
+
+    def _on_fill(self, fill: Fill) -> None:
+        position_id, _, role = (fill.tag or "").partition(":")
+        pos = self.positions.get(int(position_id)) if position_id.isdigit() else None
+        if pos is None:
+            return
+
+        order = self.engine.orders[fill.order_id]
+        if role == "entry":
+            pos.filled_quantity += fill.quantity
+            pos.entry_notional += fill.quantity * fill.price
+            pos.entry_price = pos.entry_notional / pos.filled_quantity
+            if order.status == FILLED:
+                self._open(pos)
         else:
-            pct = random.uniform(0.005, 0.015)  # 0.5% to 1.5%
-            pnl = -position.size * pct
-            self.losses += 1
+            # Stop, target or manual exit: the other bracket leg is cancelled (OCO)
+            for order_id in (pos.stop_order_id, pos.target_order_id):
+                if order_id is not None and order_id != fill.order_id:
+                    self.engine.cancel(order_id)
+            pos.exit_quantity += fill.quantity
+            pos.exit_notional += fill.quantity * fill.price
+            if order.status == FILLED:
+                self._settle(pos, self._exit_vwap(pos))
+
+    def _settle(self, pos: PaperPosition, exit_price: Optional[float]) -> None:
+        # An entry that never filled is not a trade
+        traded = pos.entry_price is not None and exit_price is not None
+        pnl = (pos.entry_price - exit_price) * pos.filled_quantity if traded else 0.0
+        is_win = pnl > 0
+        if traded:
+            if is_win:
+                self.wins += 1
+            else:
+                self.losses += 1
 
         self.balance += pnl
         self.realized_pnl += pnl
-        self.positions.remove(position)
+        self.positions.pop(pos.position_id, None)
 
-        return {
-            "symbol": position.symbol,
-            "strategy": position.strategy,
+        pos.result = {
+            "symbol": pos.symbol,
+            "strategy": pos.strategy,
             "win": is_win,
             "pnl": pnl,
-            "pnl_pct": pnl / max(position.size, 1e-9),
+            "pnl_pct": pnl / max(pos.size, 1e-9),
             "balance": self.balance,
+            "entry_price": pos.entry_price,
+            "exit_price": exit_price,
         }
 
     def stats(self) -> Dict[str, Any]:
@@ -3,20 +3,118 @@
 Real-Time Trading Dashboard
 Web-based dashboard to monitor all 21 trading accounts in real-time
 Access at: http://localhost:8080
+
+The latest stats live in memory (StatsStore). They are refreshed when the
+newest logs/trading_stats_*.json changes on disk (one stat() per poll,
+however many browsers are open) or pushed directly by the trading process
+with POST /api/stats. Browsers receive updates over Server-Sent Events
+from /api/stream; /api/stats still returns the current snapshot.
 """
 
 import json
 import os
+import hmac
+import urllib.request
 from pathlib import Path
 from datetime import datetime
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from typing import Any, Dict, Optional, Tuple, Union
 import threading
 import time
 
+SSE_KEEPALIVE_SECONDS = 15
+MAX_PUSH_BYTES = 16 * 1024 * 1024
+
+
+class StatsStore:
+    """Latest stats payload shared by every client, versioned for streaming"""
+
+    def __init__(self, logs_dir: Path = Path('logs'), poll_interval: float = 0.5):
+        self.logs_dir = Path(logs_dir)
+        self.poll_interval = poll_interval
+        self.version = 0
+        self.payload = json.dumps({'timestamp': datetime.now().isoformat(), 'accounts': {}}).encode()
+        self.source = 'empty'
+
+        self._file_key = None
+        self._condition = threading.Condition()
+        self._stop = threading.Event()
+        self._watcher = None
+
+    def publish(self, stats: Dict[str, Any], source: str = 'push'):
+        """Replace the current stats and wake every waiting stream"""
+        payload = json.dumps(stats, separators=(',', ':'), default=str).encode()
+        with self._condition:
+            self.payload = payload
+            self.source = source
+            self.version += 1
+            self._condition.notify_all()
+
+    def refresh_from_disk(self) -> bool:
+        """Reload the newest stats file if it changed since the last check"""
+        newest = None
+        try:
+            with os.scandir(self.logs_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith('trading_stats_') and entry.name.endswith('.json'):
+                        if newest is None or entry.name > newest.name:
+                            newest = entry
+        except FileNotFoundError:
+            return False
+        if newest is None:
+            return False
+
+        stat = newest.stat()
+        key = (newest.name, stat.st_mtime_ns, stat.st_size)
+        if key == self._file_key:
+            return False
+
+        try:
+            with open(newest.path, 'r') as f:
+                stats = json.load(f)
+        except (OSError, ValueError):
+            return False  # mid-write or unreadable; retry on the next poll
+
+        self._file_key = key
+        self.publish(stats, source=newest.name)
+        return True
+
+    def wait_for_update(self, after_version: int, timeout: float) -> Tuple[int, bytes]:
+        """Block until a version newer than ``after_version`` exists or timeout"""
+        with self._condition:
+            self._condition.wait_for(lambda: self.version > after_version or self._stop.is_set(), timeout)
+            return self.version, self.payload
+
+    def snapshot(self) -> Tuple[int, bytes]:
+        with self._condition:
+            return self.version, self.payload
+
+    def start(self):
+        """Load the current file and start the change watcher"""
+        self.refresh_from_disk()
+        self._watcher = threading.Thread(target=self._watch, name='StatsWatcher', daemon=True)
+        self._watcher.start()
+
+    def _watch(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.refresh_from_disk()
+            except Exception as e:
+                print(f"⚠️  Stats refresh failed: {e}")
+
+    def stop(self):
+        self._stop.set()
+        with self._condition:
+            self._condition.notify_all()
+
 
 class DashboardHandler(SimpleHTTPRequestHandler):
     """Custom HTTP handler for dashboard"""
 
+    @property
+    def store(self) -> StatsStore:
+        return self.server.store
+
     def do_GET(self):
         """Handle GET requests"""
         if self.path == '/' or self.path == '/dashboard':
@@ -29,10 +127,72 @@ class DashboardHandler(SimpleHTTPRequestHandler):
             self.send_header('Content-type', 'application/json')
             self.end_headers()
             self.wfile.write(self.get_latest_stats().encode())
+        elif self.path == '/api/stream':
+            self.stream_stats()
         else:
             self.send_response(404)
             self.end_headers()
 
+    def do_POST(self):
+        """Accept stats pushed by the trading process"""
+        if self.path != '/api/stats':
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        if not self.push_allowed():
+            self.send_response(403)
+            self.end_headers()
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            if length <= 0 or length > MAX_PUSH_BYTES:
+                raise ValueError(f"invalid body length {length}")
+            stats = json.loads(self.rfile.read(length))
+            if not isinstance(stats, dict) or 'accounts' not in stats:
+                raise ValueError("stats must be an object with 'accounts'")
+        except ValueError as e:
+            self.send_response(400)
+            self.send_header('Content-type', 'application/json')
+            self.end_headers()
+            self.wfile.write(json.dumps({'error': str(e)}).encode())
+            return
+
+        self.store.publish(stats, source='push')
+        self.send_response(204)
+        self.end_headers()
+
+    def push_allowed(self) -> bool:
+        """Loopback clients may push; others need DASHBOARD_PUSH_TOKEN"""
+        token = os.getenv('DASHBOARD_PUSH_TOKEN')
+        if token:
+            return hmac.compare_digest(self.headers.get('X-Dashboard-Token', ''), token)
+        return self.client_address[0] in ('127.0.0.1', '::1')
+
+    def stream_stats(self):
+        """Server-Sent Events: the current stats, then every new version"""
+        self.send_response(200)
+        self.send_header('Content-type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'keep-alive')
+        self.end_headers()
+
+        version, payload = self.store.snapshot()
+        try:
+            self.wfile.write(b'id: %d\ndata: %s\n\n' % (version, payload))
+            self.wfile.flush()
+            while not self.server.stopping.is_set():
+                latest, payload = self.store.wait_for_update(version, SSE_KEEPALIVE_SECONDS)
+                if latest > version:
+                    version = latest
+                    self.wfile.write(b'id: %d\ndata: %s\n\n' % (version, payload))
+                else:
+                    self.wfile.write(b': keepalive\n\n')
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # browser closed the stream
+
     def generate_dashboard_html(self) -> str:
         """Generate real-time dashboard HTML"""
         return """
@@ -238,7 +398,7 @@ class DashboardHandler(SimpleHTTPRequestHandler):
     </div>
 
     <div class="refresh-info">
-        ⟳ Dashboard auto-refreshes every 10 seconds
+        ⟳ Dashboard updates live as trades are recorded
     </div>
 
     <script>
@@ -336,37 +496,50 @@ class DashboardHandler(SimpleHTTPRequestHandler):
             });
         }
 
-        // Initial fetch
-        fetchStats();
-
-        // Auto-refresh every 10 seconds
-        setInterval(fetchStats, 10000);
+        // Live updates over Server-Sent Events; poll only if the browser lacks them
+        if (window.EventSource) {
+            const stream = new EventSource('/api/stream');
+            stream.onmessage = event => updateDashboard(JSON.parse(event.data));
+        } else {
+            fetchStats();
+            setInterval(fetchStats, 10000);
+        }
     </script>
 </body>
 </html>
         """
 
     def get_latest_stats(self) -> str:
-        """Get latest trading statistics"""
-        try:
-            # Find most recent stats file
-            logs_dir = Path('logs')
-            stats_files = sorted(logs_dir.glob('trading_stats_*.json'), reverse=True)
-
-            if stats_files:
-                with open(stats_files[0], 'r') as f:
-                    return f.read()
-            else:
-                # Return empty template
-                return json.dumps({
-                    'timestamp': datetime.now().isoformat(),
-                    'accounts': {}
-                })
-        except Exception as e:
-            return json.dumps({'error': str(e)})
+        """Get latest trading statistics (from memory, no disk I/O)"""
+        return self.store.snapshot()[1].decode()
+
+
+class DashboardServer(ThreadingHTTPServer):
+    """One thread per connection; SSE streams hold theirs open"""
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def push_stats(stats: Union[Dict[str, Any], bytes], url: str = 'http://localhost:8080/api/stats',
+               token: Optional[str] = None, timeout: float = 2.0) -> bool:
+    """POST stats (a dict or pre-encoded JSON) to a running dashboard; False if unreachable"""
+    if not isinstance(stats, bytes):
+        stats = json.dumps(stats, separators=(',', ':'), default=str).encode()
+    request = urllib.request.Request(
+        url, data=stats,
+        headers={'Content-Type': 'application/json'}, method='POST'
+    )
+    token = token or os.getenv('DASHBOARD_PUSH_TOKEN')
+    if token:
+        request.add_header('X-Dashboard-Token', token)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.status < 300
+    except OSError:
+        return False
 
 
-def start_dashboard_server(port=8080):
+def start_dashboard_server(port=8080, logs_dir='logs', poll_interval=0.5):
     """Start the dashboard web server"""
     print(f"""
     ╔═══════════════════════════════════════════════════════════════════╗
@@ -374,20 +547,27 @@ def start_dashboard_server(port=8080):
     ╚═══════════════════════════════════════════════════════════════════╝
 
     🌐 Dashboard URL: http://localhost:{port}
-    📊 Real-time updates every 10 seconds
+    📊 Live updates streamed as stats change
     💻 Open in your browser to view live trading data
 
     Press Ctrl+C to stop the server
     ═══════════════════════════════════════════════════════════════════
     """)
 
-    server = HTTPServer(('0.0.0.0', port), DashboardHandler)
+    store = StatsStore(Path(logs_dir), poll_interval)
+    store.start()
+
+    server = DashboardServer(('0.0.0.0', port), DashboardHandler)
+    server.store = store
+    server.stopping = threading.Event()
 
     try:
         server.serve_forever()
     except KeyboardInterrupt:
         print("\n\n🛑 Shutting down dashboard server...")
-        server.shutdown()
+        server.stopping.set()
+        store.stop()
+        server.server_close()
 
 
 if __name__ == "__main__":
@@ -29,11 +29,14 @@ class SandboxTradingMonitor:
         self.profile = profile
         self.config = self.load_config()
         self.trades = []
+        self.risk_engine = None
+        self.risk_account = None
         self.metrics = {
             "start_time": datetime.now().isoformat(),
             "total_trades": 0,
             "wins": 0,
             "losses": 0,
+            "initial_capital": 10000,
             "current_capital": 10000,
             "peak_capital": 10000,
             "drawdown": 0,
@@ -61,8 +64,27 @@ class SandboxTradingMonitor:
             "integration": all_profiles.get('integration_settings', {})
         }
 
+    def attach_risk_engine(self, risk_engine, account_id: str):
+        """Read capital and drawdown live from a RiskEngine account instead of static metrics"""
+        self.risk_engine = risk_engine
+        self.risk_account = account_id
+        self.metrics["initial_capital"] = float(risk_engine.initial_capital[risk_engine.accounts[account_id]])
+
+    def sync_risk_metrics(self):
+        """Refresh capital, peak and drawdown from the attached risk engine"""
+        if self.risk_engine is None:
+            return
+
+        risk = self.risk_engine.account_risk(self.risk_account)
+        self.metrics["current_capital"] = risk["equity"]
+        self.metrics["peak_capital"] = risk["peak_equity"]
+        self.metrics["drawdown"] = risk["max_drawdown"] * 100
+        self.metrics["var_95"] = risk["var_95"]
+
     def check_live_readiness(self) -> Dict[str, Any]:
         """Check if system is ready for live trading"""
+        self.sync_risk_metrics()
+
         logger.info("\n" + "="*70)
         logger.info("LIVE TRADING READINESS CHECK")
         logger.info("="*70 + "\n")
@@ -113,7 +135,8 @@ class SandboxTradingMonitor:
             checks["ready"] = False
 
         # 4. Positive ROI
-        roi = ((self.metrics["current_capital"] - 10000) / 10000 * 100)
+        initial = self.metrics["initial_capital"]
+        roi = ((self.metrics["current_capital"] - initial) / initial * 100)
         roi_ok = roi > 0
         checks["checks"].append({
             "name": "ROI (Profitability)",
@@ -217,6 +240,8 @@ class SandboxTradingMonitor:
 
     def generate_performance_report(self) -> str:
         """Generate performance report"""
+        self.sync_risk_metrics()
+        initial = self.metrics['initial_capital']
         report = f"""
 ╔══════════════════════════════════════════════════════════════╗
 ║           SANDBOX TRADING PERFORMANCE REPORT                 ║
@@ -233,11 +258,11 @@ TRADING ACTIVITY:
   Win Rate: {(self.metrics['wins']/self.metrics['total_trades']*100) if self.metrics['total_trades'] > 0 else 0:.1f}%
 
 FINANCIAL PERFORMANCE:
-  Starting Capital: $10,000.00
+  Starting Capital: ${initial:,.2f}
   Current Capital: ${self.metrics['current_capital']:,.2f}
   Peak Capital: ${self.metrics['peak_capital']:,.2f}
-  Net Profit/Loss: ${self.metrics['current_capital'] - 10000:,.2f}
-  ROI: {((self.metrics['current_capital'] - 10000) / 10000 * 100):.2f}%
+  Net Profit/Loss: ${self.metrics['current_capital'] - initial:,.2f}
+  ROI: {((self.metrics['current_capital'] - initial) / initial * 100):.2f}%
   Max Drawdown: {self.metrics['drawdown']:.2f}%
 
 ALERTS: {len(self.metrics['alerts'])}
@@ -2,18 +2,45 @@
 """
 24/7 Trading System Launcher
 Starts all 21 trading accounts and keeps them running continuously
+
+Each account runs as an asyncio task on one event loop (per-account
+intervals, jittered timers, capped error backoff); pattern analysis runs
+on a bounded worker pool so the account count is not tied to OS threads.
+Market data comes from a shared MarketDataBus: each (pair, timeframe) is
+fetched and analyzed once per interval, however many accounts trade it.
+Account stats are persisted as deltas to a write-ahead log (StateJournal)
+and recovered on restart, so trading resumes where it stopped. With
+monitoring.dashboard_url set, changed stats are pushed to the dashboard.
+Every stats snapshot is folded into the reporting rollups as it is written,
+so period drawdowns see each snapshot, not just the ones a report caught.
+Prometheus metrics are served on monitoring.metrics_port (default 8082).
 """
 
+import asyncio
 import json
 import os
+import random
 import sys
 import time
 import logging
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any
-import threading
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'pillar-a-trading' / 'bots' / 'execution'))
+from risk_engine import RiskEngine
+from state_journal import StateJournal, write_atomic
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'pillar-a-trading' / 'data-feeds'))
+from market_data_bus import MarketDataBus
+
+from realtime_trading_dashboard import push_stats
+from stats_rollup_store import StatsRollupStore
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'core-systems'))
+from metrics_exporter import counter, gauge, histogram, start_metrics_server
 
 logging.basicConfig(
     level=logging.INFO,
@@ -25,16 +52,57 @@ logging.basicConfig(
 )
 logger = logging.getLogger('24x7Trading')
 
+CANDLES_PROCESSED = counter('trading_candles_processed_total', 'Candles analyzed', ['pair'])
+ANALYSIS_SECONDS = histogram('trading_analysis_duration_seconds', 'Pattern analysis latency per buffer', ['pair'])
+SIGNALS_EMITTED = counter('trading_signals_emitted_total', 'Pattern signals produced', ['pair', 'type'])
+ORDERS_SUBMITTED = counter('trading_orders_submitted_total', 'Orders sent after the risk check', ['pair', 'side'])
+ORDERS_BLOCKED = counter('trading_orders_blocked_total', 'Orders rejected by the risk engine', ['pair'])
+QUEUE_DEPTH = gauge('trading_queue_depth', 'Pending work items', ['queue'])
+ACCOUNTS_ACTIVE = gauge('trading_accounts_active', 'Running account tasks')
+
+
+def account_asset_class(pair: str) -> str:
+    """Asset class of a traded pair (crypto unless both legs are fiat)"""
+    fiat = {'USD', 'EUR', 'GBP', 'JPY', 'CHF', 'CAD', 'AUD', 'NZD'}
+    legs = pair.split('/')
+    return 'forex' if len(legs) == 2 and set(legs) <= fiat else 'crypto'
+
 
 class ContinuousTradingOrchestrator:
     """Manages 24/7 trading across all accounts"""
 
-    def __init__(self):
+    def __init__(self, analysis_workers: int = 4):
         self.config_file = Path(__file__).parent.parent / 'pillar-a-trading' / 'config' / 'multi_account_config.json'
         self.running = True
-        self.account_threads = {}
-        self.account_stats = {}
+        self.account_tasks = {}
         self.load_config()
+        self.risk_profiles = self.load_risk_profiles()
+        self.risk_engine = RiskEngine()
+
+        # Account stats live in the journal; every change is logged as a delta
+        self.journal = StateJournal(Path('logs'), 'trading_state')
+        self.account_stats = self.journal.recover()
+        self.rollups = StatsRollupStore(Path('logs'))
+
+        # Scheduler settings (monitoring section of multi_account_config.json)
+        monitoring = self.config.get('monitoring', {})
+        self.default_interval = monitoring.get('check_interval_seconds', 60)
+        self.timer_jitter = monitoring.get('timer_jitter', 0.1)
+        self.error_backoff_seconds = monitoring.get('error_backoff_seconds', 5)
+        self.max_error_backoff_seconds = monitoring.get('max_error_backoff_seconds', 300)
+        self.dashboard_url = monitoring.get('dashboard_url')
+        self.dashboard_push_interval = monitoring.get('dashboard_push_interval', 1.0)
+        self.dashboard_task = None
+        self.metrics_port = monitoring.get('metrics_port', 8082)
+
+        # Bounded pool for CPU-heavy analysis, shared by every account task
+        self.analysis_workers = analysis_workers
+        self.executor = None
+
+        # One fetch per (pair, timeframe) per interval, fanned out to all accounts
+        self.market_bus = MarketDataBus(self.fetch_pair_data, default_interval=self.default_interval,
+                                        max_error_backoff=self.max_error_backoff_seconds)
+        self.pair_analyzers = {}
 
     def load_config(self):
         """Load multi-account configuration"""
@@ -46,12 +114,19 @@ class ContinuousTradingOrchestrator:
             logger.error(f"❌ Failed to load config: {e}")
             sys.exit(1)
 
-    def start_account_trading(self, account: Dict[str, Any]):
-        """Start trading for a single account (runs in separate thread)"""
-        account_id = account['id']
-        account_name = account['name']
+    def load_risk_profiles(self) -> Dict[str, Any]:
+        """Load risk profiles used for per-account risk limits"""
+        profiles_file = self.config_file.parent / 'trading_risk_profiles.json'
+        try:
+            with open(profiles_file, 'r') as f:
+                return json.load(f)['profiles']
+        except Exception as e:
+            logger.warning(f"⚠️  Risk profiles unavailable, using default limits: {e}")
+            return {}
 
-        logger.info(f"🚀 Starting 24/7 trading for {account_name} (#{account_id})")
+    def init_account(self, account: Dict[str, Any]):
+        """Create an account's trading components and stats"""
+        account_id = account['id']
 
         # Add to sys.path
         sys.path.insert(0, str(Path(__file__).parent.parent / 'pillar-a-trading' / 'agent-3.0'))
@@ -60,13 +135,31 @@ class ContinuousTradingOrchestrator:
         from agent_3_orchestrator import Agent3Orchestrator
         from candlestick_analyzer import CandlestickAnalyzer
 
-        # Initialize trading components
+        # Initialize trading components (pattern analysis is shared per pair)
         agent = Agent3Orchestrator()
-        analyzer = CandlestickAnalyzer(pair=account.get('trading_pair', 'BTC/USD'))
+        pair = account.get('trading_pair', 'BTC/USD')
+        if pair not in self.pair_analyzers:
+            self.pair_analyzers[pair] = CandlestickAnalyzer(pair=pair)
+        analyzer = self.pair_analyzers[pair]
+
+        self.risk_engine.add_account_from_profile(account, self.risk_profiles)
+
+        # Resume a recovered account where it stopped
+        if account_id in self.account_stats:
+            stats = self.account_stats[account_id]
+            risk = stats.get('risk', {})
+            self.risk_engine.restore_account(account_id, stats.get('current_positions', []),
+                                             realized_pnl=risk.get('realized_pnl', 0.0),
+                                             peak_equity=risk.get('peak_equity'),
+                                             max_drawdown=risk.get('max_drawdown', 0.0))
+            self.journal.record(account_id, {'status': 'RUNNING', 'resumed_at': datetime.now().isoformat()})
+            logger.info(f"♻️  Resumed {account['name']}: {stats['total_trades']} trades, "
+                        f"Capital: ${stats['current_capital']:,.2f}")
+            return agent, analyzer
 
         # Initialize account stats
-        self.account_stats[account_id] = {
-            'name': account_name,
+        self.journal.record(account_id, {
+            'name': account['name'],
             'profile': account['profile'],
             'environment': account['environment'],
             'initial_capital': account['initial_capital'],
@@ -80,39 +173,85 @@ class ContinuousTradingOrchestrator:
             'last_trade_time': None,
             'uptime_start': datetime.now().isoformat(),
             'status': 'RUNNING'
-        }
+        })
+
+        return agent, analyzer
+
+    def trading_iteration(self, account: Dict[str, Any], analyzer, buffer):
+        """One analyze / execute pass for an account on a shared candle buffer (runs on the analysis pool)"""
+        account_id = account['id']
+
+        # Mark prices and analyze patterns once per published buffer, not per account
+        buffer.derive('risk_tick', lambda b: self.risk_engine.on_tick(b.pair, b.columns['close'][-1]))
+        signal = buffer.derive('candlestick_signal', lambda b: self.analyze_buffer(analyzer, b))
+
+        # Execute trades based on signal
+        if signal.get('type') in ['BUY', 'SELL'] and signal.get('confidence', 0) > 0.70:
+            self.execute_trade(account_id, signal)
+
+    def analyze_buffer(self, analyzer, buffer) -> Dict[str, Any]:
+        """Pattern analysis for one published buffer, recorded in the metrics"""
+        labels = (buffer.pair,)
+        with ANALYSIS_SECONDS.time(labels):
+            signal = analyzer.analyze_pattern(list(buffer.candles))
+        CANDLES_PROCESSED.inc(len(buffer.candles), labels)
+        SIGNALS_EMITTED.inc(1, (buffer.pair, str(signal.get('type', 'NONE'))))
+        return signal
+
+    def next_delay(self, interval: float) -> float:
+        """Interval with +/- timer_jitter so thousands of accounts do not fire in lockstep"""
+        return interval * (1 + random.uniform(-self.timer_jitter, self.timer_jitter))
+
+    async def run_account(self, account: Dict[str, Any]):
+        """Trading loop for a single account (runs as an asyncio task)"""
+        loop = asyncio.get_running_loop()
+        account_id = account['id']
+        account_name = account['name']
+        interval = account.get('check_interval_seconds', self.default_interval)
+
+        logger.info(f"🚀 Starting 24/7 trading for {account_name} (#{account_id})")
+
+        # Random phase within one interval instead of a fixed stagger
+        await asyncio.sleep(random.uniform(0, interval))
+
+        agent, analyzer = await loop.run_in_executor(self.executor, self.init_account, account)
+        topic = self.market_bus.subscribe(account_id, analyzer.pair, account.get('timeframe', 'H1'), interval)
 
         iteration = 0
+        failures = 0
+        version = 0
         while self.running:
             try:
                 iteration += 1
-
-                # Simulate market data fetch (in production, connect to real API)
-                candles = self.fetch_market_data(account)
-
-                # Analyze patterns
-                signal = analyzer.analyze_pattern(candles)
-
-                # Execute trades based on signal
-                if signal.get('type') in ['BUY', 'SELL'] and signal.get('confidence', 0) > 0.70:
-                    self.execute_trade(account_id, signal)
+                buffer = await self.market_bus.next(topic, version)
+                version = buffer.version
+                await loop.run_in_executor(self.executor, self.trading_iteration, account, analyzer, buffer)
+                failures = 0
 
                 # Update stats every 100 iterations
                 if iteration % 100 == 0:
-                    self.save_account_stats()
                     logger.info(f"📊 {account_name}: {self.account_stats[account_id]['total_trades']} trades, "
                               f"Capital: ${self.account_stats[account_id]['current_capital']:,.2f}")
 
-                # Sleep for configured interval (default: 60 seconds)
-                time.sleep(account.get('check_interval_seconds', 60))
+                # Sleep for the account's interval (default: monitoring.check_interval_seconds)
+                await asyncio.sleep(self.next_delay(interval))
 
+            except asyncio.CancelledError:
+                break
             except Exception as e:
-                logger.error(f"❌ Error in {account_name}: {e}")
-                self.account_stats[account_id]['status'] = f'ERROR: {str(e)[:100]}'
-                time.sleep(300)  # Wait 5 minutes before retry on error
+                failures += 1
+                backoff = min(self.error_backoff_seconds * 2 ** (failures - 1), self.max_error_backoff_seconds)
+                logger.error(f"❌ Error in {account_name}: {e} (retry in {backoff:.0f}s)")
+                self.journal.record(account_id, {'status': f'ERROR: {str(e)[:100]}'})
+                await asyncio.sleep(self.next_delay(backoff))
 
+        self.market_bus.unsubscribe(account_id, topic)
         logger.info(f"🛑 Stopped trading for {account_name}")
 
+    def fetch_pair_data(self, pair: str, timeframe: str) -> List[Dict]:
+        """Market data fetcher for the shared bus (one call per pair per interval)"""
+        return self.fetch_market_data({'trading_pair': pair, 'timeframe': timeframe})
+
     def fetch_market_data(self, account: Dict[str, Any]) -> List[Dict]:
         """Fetch market data (placeholder - connect to real API in production)"""
         # This is a placeholder - in production, connect to Alpaca, Interactive Brokers, etc.
@@ -147,6 +286,19 @@ class ContinuousTradingOrchestrator:
 
         # Calculate position size based on risk parameters
         position_size = stats['current_capital'] * 0.02  # 2% of capital
+        price = signal.get('price', 0)
+        if not price:
+            logger.warning(f"⚠️  {stats['name']}: signal has no price, skipping")
+            return
+
+        # Pre-trade risk check against the account's live exposure
+        quantity = position_size / price * (1 if signal['type'] == 'BUY' else -1)
+        allowed, reason = self.risk_engine.check_order(account_id, signal['pair'], quantity, price)
+        if not allowed:
+            ORDERS_BLOCKED.inc(1, (signal['pair'],))
+            logger.info(f"🛡️  {stats['name']} {signal['type']} blocked by risk engine: {reason}")
+            return
+        ORDERS_SUBMITTED.inc(1, (signal['pair'], signal['type']))
 
         # Simulate trade execution
         trade = {
@@ -160,28 +312,53 @@ class ContinuousTradingOrchestrator:
             'profit_loss': 0  # Will be calculated on close
         }
 
-        # Update stats
-        stats['total_trades'] += 1
-        stats['last_trade_time'] = trade['timestamp']
-        stats['current_positions'].append(trade)
+        # Net the fill into the account's positions
+        risk = self.risk_engine.on_fill(account_id, signal['pair'], quantity, price,
+                                        asset_class=account_asset_class(signal['pair']))
+
+        # Update stats (one WAL record with just the changed fields)
+        self.journal.record(account_id, {
+            'last_trade_time': trade['timestamp'],
+            'last_trade': trade,
+            'current_positions': self.risk_engine.positions(account_id),
+            'current_capital': risk['equity'],
+            'risk': risk
+        }, incr={'total_trades': 1})
 
         logger.info(f"💰 {stats['name']} executed {signal['type']} - {signal['pattern']} "
                    f"@ ${signal.get('price', 0):,.2f} (Confidence: {signal['confidence']:.2%})")
 
     def save_account_stats(self):
-        """Save all account statistics"""
+        """Compact the stats journal and atomically refresh the daily stats file"""
         try:
+            self.journal.compact()
             stats_file = Path('logs') / f'trading_stats_{datetime.now().strftime("%Y%m%d")}.json'
-            with open(stats_file, 'w') as f:
-                json.dump({
-                    'timestamp': datetime.now().isoformat(),
-                    'accounts': self.account_stats
-                }, f, indent=2)
+            # Copy taken under the journal lock; analysis threads record concurrently
+            accounts = json.loads(self.journal.dumps())
+            write_atomic(stats_file, {
+                'timestamp': datetime.now().isoformat(),
+                'accounts': accounts
+            }, indent=2)
+            self.rollups.sync()
         except Exception as e:
             logger.error(f"Failed to save stats: {e}")
 
-    def start_all_accounts(self):
-        """Start trading on all accounts in separate threads"""
+    async def push_dashboard_forever(self):
+        """Push stats to the dashboard whenever the journal has new records"""
+        loop = asyncio.get_running_loop()
+        pushed_seq = -1
+        while self.running:
+            if self.journal.seq != pushed_seq:
+                pushed_seq = self.journal.seq
+                # Encoded under the journal lock; analysis threads record concurrently
+                payload = ('{"timestamp":"%s","accounts":%s}'
+                           % (datetime.now().isoformat(), self.journal.dumps())).encode()
+                if not await loop.run_in_executor(None, push_stats, payload, self.dashboard_url):
+                    pushed_seq = -1  # dashboard down; retry on the next tick
+            await asyncio.sleep(self.dashboard_push_interval)
+
+    async def start_all_accounts(self):
+        """Start trading on all accounts as tasks on the event loop"""
         logger.info("=" * 70)
         logger.info("🚀 STARTING 24/7 TRADING SYSTEM")
         logger.info("=" * 70)
@@ -189,41 +366,72 @@ class ContinuousTradingOrchestrator:
         logger.info(f"Run 24/7: {self.config.get('monitoring', {}).get('run_24_7', True)}")
         logger.info("=" * 70)
 
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.analysis_workers, thread_name_prefix='Analysis')
+
         for account in self.config['accounts']:
             if account.get('run_24_7', True):
-                thread = threading.Thread(
-                    target=self.start_account_trading,
-                    args=(account,),
-                    daemon=True,
-                    name=f"Trading-{account['id']}"
+                self.account_tasks[account['id']] = asyncio.create_task(
+                    self.run_account(account), name=f"Trading-{account['id']}"
                 )
-                thread.start()
-                self.account_threads[account['id']] = thread
-                time.sleep(1)  # Stagger starts
 
-        logger.info(f"✅ Started {len(self.account_threads)} trading threads")
+        if self.dashboard_url:
+            self.dashboard_task = asyncio.create_task(self.push_dashboard_forever(), name='DashboardPush')
+
+        logger.info(f"✅ Started {len(self.account_tasks)} trading tasks "
+                    f"({self.analysis_workers} analysis workers)")
         logger.info("=" * 70)
-        logger.info("📊 Press Ctrl+C to view status (system will continue running)")
+        logger.info("📊 Press Ctrl+C to view status")
         logger.info("=" * 70)
 
-    def monitor_forever(self):
+    async def monitor_forever(self):
         """Monitor all accounts and keep system running"""
+        while self.running:
+            await asyncio.sleep(300)  # Check every 5 minutes
+
+            # Check task health
+            active_tasks = sum(1 for t in self.account_tasks.values() if not t.done())
+            logger.info(f"💓 Heartbeat: {active_tasks}/{len(self.account_tasks)} accounts active")
+
+            # Save stats
+            self.save_account_stats()
+            risk = self.risk_engine.global_risk()
+            logger.info(f"🛡️  Portfolio risk: equity ${risk['equity']:,.2f}, "
+                      f"gross ${risk['gross_exposure']:,.2f}, VaR95 ${risk['var_95']:,.2f}")
+
+    async def stop(self):
+        """Cancel all account tasks and release the analysis pool"""
+        self.running = False
+        for task in self.account_tasks.values():
+            task.cancel()
+        await asyncio.gather(*self.account_tasks.values(), return_exceptions=True)
+        if self.dashboard_task is not None:
+            self.dashboard_task.cancel()
+            await asyncio.gather(self.dashboard_task, return_exceptions=True)
+        await self.market_bus.close()
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+        self.save_account_stats()
+        self.journal.close()
+
+    def register_metrics(self):
+        """Expose scheduler gauges and start the /metrics endpoint"""
+        QUEUE_DEPTH.set_function(lambda: self.executor._work_queue.qsize() if self.executor else 0,
+                                 ('analysis_pool',))
+        QUEUE_DEPTH.set_function(lambda: self.journal.records_since_snapshot, ('journal_uncompacted',))
+        ACCOUNTS_ACTIVE.set_function(lambda: sum(1 for t in self.account_tasks.values() if not t.done()))
+        if self.metrics_port:
+            start_metrics_server(self.metrics_port)
+
+    async def run(self):
+        """Start every account and monitor until cancelled"""
+        self.register_metrics()
+        await self.start_all_accounts()
         try:
-            while self.running:
-                time.sleep(300)  # Check every 5 minutes
-
-                # Check thread health
-                active_threads = sum(1 for t in self.account_threads.values() if t.is_alive())
-                logger.info(f"💓 Heartbeat: {active_threads}/{len(self.account_threads)} accounts active")
-
-                # Save stats
-                self.save_account_stats()
-
-        except KeyboardInterrupt:
-            logger.info("\n📊 CURRENT STATUS - System continues running in background")
-            self.print_status()
-            logger.info("\n💡 System is still running 24/7 in background")
-            logger.info("   To stop: kill this process or restart server")
+            await self.monitor_forever()
+        finally:
+            await self.stop()
 
     def print_status(self):
         """Print current status of all accounts"""
@@ -260,8 +468,11 @@ def main():
     """)
 
     orchestrator = ContinuousTradingOrchestrator()
-    orchestrator.start_all_accounts()
-    orchestrator.monitor_forever()
+    try:
+        asyncio.run(orchestrator.run())
+    except KeyboardInterrupt:
+        logger.info("\n📊 FINAL STATUS")
+        orchestrator.print_status()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Stats Rollup Store
+Daily, weekly and monthly per-account aggregates of trading stats snapshots
+
+Each trading_stats_*.json snapshot holds cumulative per-account counters.
+ingest() folds a snapshot into the three buckets it falls in (one update
+per account per period), so a report over N periods reads N buckets
+instead of rescanning the logs. Rollups are persisted with the
+size/mtime of every ingested file; sync() only reads files that changed.
+The trading launcher syncs after every snapshot it writes, so each one is
+sampled; reports reload the persisted rollups and sync whatever is left.
+
+Bucket entry (per account, plus '__portfolio__' for the summed totals):
+    open_* / close_*   counters at the start and end of the period
+    high/low/peak      capital extremes, max_drawdown within the period
+"""
+
+import json
+import logging
+import os
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'pillar-a-trading' / 'bots' / 'execution'))
+from state_journal import write_atomic
+
+logger = logging.getLogger('StatsRollupStore')
+
+PERIODS = ('daily', 'weekly', 'monthly')
+PORTFOLIO = '__portfolio__'
+COUNTERS = {
+    'capital': 'current_capital',
+    'trades': 'total_trades',
+    'wins': 'winning_trades',
+    'losses': 'losing_trades',
+    'profit': 'total_profit',
+    'loss': 'total_loss',
+}
+
+
+def summarize_accounts(accounts: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Summary metrics across all accounts of one snapshot"""
+    total_capital = 0
+    total_initial = 0
+    total_trades = 0
+    total_wins = 0
+    total_losses = 0
+    total_profit = 0
+    total_loss = 0
+    active_accounts = 0
+
+    for account in accounts.values():
+        total_capital += account.get('current_capital', 0)
+        total_initial += account.get('initial_capital', 0)
+        total_trades += account.get('total_trades', 0)
+        total_wins += account.get('winning_trades', 0)
+        total_losses += account.get('losing_trades', 0)
+        total_profit += account.get('total_profit', 0)
+        total_loss += account.get('total_loss', 0)
+        if account.get('status') == 'RUNNING':
+            active_accounts += 1
+
+    total_pnl = total_capital - total_initial
+    total_pnl_percent = (total_pnl / total_initial * 100) if total_initial > 0 else 0
+    win_rate = (total_wins / total_trades * 100) if total_trades > 0 else 0
+
+    return {
+        'total_capital': total_capital,
+        'total_initial': total_initial,
+        'total_pnl': total_pnl,
+        'total_pnl_percent': total_pnl_percent,
+        'total_trades': total_trades,
+        'total_wins': total_wins,
+        'total_losses': total_losses,
+        'win_rate': win_rate,
+        'total_profit': total_profit,
+        'total_loss': total_loss,
+        'active_accounts': active_accounts,
+        'total_accounts': len(accounts)
+    }
+
+
+def bucket_keys(timestamp: datetime) -> Dict[str, str]:
+    """Bucket key of a timestamp for each period (ISO week for weekly)"""
+    year, week, _ = timestamp.isocalendar()
+    return {
+        'daily': timestamp.strftime('%Y-%m-%d'),
+        'weekly': f'{year}-W{week:02d}',
+        'monthly': timestamp.strftime('%Y-%m'),
+    }
+
+
+def completed_keys(now: datetime) -> Dict[str, str]:
+    """Bucket keys of the last completed period: yesterday, last ISO week, last month"""
+    return {
+        'daily': bucket_keys(now - timedelta(days=1))['daily'],
+        'weekly': bucket_keys(now - timedelta(days=7))['weekly'],
+        'monthly': bucket_keys(now.replace(day=1) - timedelta(days=1))['monthly'],
+    }
+
+
+def period_metrics(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Activity within one bucket entry (deltas between its open and close)"""
+    trades = entry['close_trades'] - entry['open_trades']
+    wins = entry['close_wins'] - entry['open_wins']
+    pnl = entry['close_capital'] - entry['open_capital']
+    return {
+        'pnl': pnl,
+        'pnl_percent': (pnl / entry['open_capital'] * 100) if entry['open_capital'] else 0,
+        'trades': trades,
+        'wins': wins,
+        'losses': entry['close_losses'] - entry['open_losses'],
+        'win_rate': (wins / trades * 100) if trades > 0 else 0,
+        'max_drawdown': entry['max_drawdown'] * 100,
+        'high_capital': entry['high_capital'],
+        'low_capital': entry['low_capital'],
+    }
+
+
+class StatsRollupStore:
+    """Incrementally maintained period rollups of trading stats snapshots"""
+
+    def __init__(self, logs_dir: Path = Path('logs'), path: Optional[Path] = None):
+        self.logs_dir = Path(logs_dir)
+        self.path = Path(path) if path else self.logs_dir / 'reporting_rollups.json'
+
+        self.rollups: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = {period: {} for period in PERIODS}
+        self.last_values: Dict[str, Dict[str, float]] = {}
+        self.files: Dict[str, List[int]] = {}
+        self.last_timestamp: Optional[str] = None
+        self.latest_stats: Dict[str, Any] = {'timestamp': datetime.now().isoformat(), 'accounts': {}}
+        self.latest_summary: Dict[str, Any] = summarize_accounts({})
+
+        self.load()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def load(self):
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️  Rollups unreadable, rebuilding from logs: {e}")
+            return
+        self.rollups = {period: data.get('rollups', {}).get(period, {}) for period in PERIODS}
+        self.last_values = data.get('last_values', {})
+        self.files = data.get('files', {})
+        self.last_timestamp = data.get('last_timestamp')
+        self.latest_stats = data.get('latest_stats', self.latest_stats)
+        self.latest_summary = summarize_accounts(self.latest_stats.get('accounts', {}))
+
+    def save(self):
+        write_atomic(self.path, {
+            'rollups': self.rollups,
+            'last_values': self.last_values,
+            'files': self.files,
+            'last_timestamp': self.last_timestamp,
+            'latest_stats': self.latest_stats,
+        })
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+
+    def sync(self) -> int:
+        """Ingest new or rewritten stats files in date order; returns how many were read"""
+        changed: List[Tuple[str, str, List[int]]] = []
+        try:
+            with os.scandir(self.logs_dir) as entries:
+                for entry in entries:
+                    if not (entry.name.startswith('trading_stats_') and entry.name.endswith('.json')):
+                        continue
+                    stat = entry.stat()
+                    key = [stat.st_mtime_ns, stat.st_size]
+                    if self.files.get(entry.name) != key:
+                        changed.append((entry.name, entry.path, key))
+        except FileNotFoundError:
+            return 0
+
+        ingested = 0
+        for name, path, key in sorted(changed):
+            try:
+                with open(path, 'r') as f:
+                    stats = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠️  Skipping unreadable stats file {name}: {e}")
+                continue
+            self.ingest(stats)
+            self.files[name] = key
+            ingested += 1
+
+        if ingested:
+            self.save()
+        return ingested
+
+    def ingest(self, stats: Dict[str, Any]) -> bool:
+        """Fold one snapshot into its daily, weekly and monthly buckets"""
+        timestamp = stats.get('timestamp') or datetime.now().isoformat()
+        if self.last_timestamp is not None and timestamp <= self.last_timestamp:
+            return False  # already seen (or older than what is rolled up)
+
+        accounts = stats.get('accounts', {})
+        summary = summarize_accounts(accounts)
+        keys = bucket_keys(datetime.fromisoformat(timestamp))
+
+        for account_id, account in accounts.items():
+            values = {field: account.get(source, 0) or 0 for field, source in COUNTERS.items()}
+            meta = {'name': account.get('name', account_id), 'profile': account.get('profile', ''),
+                    'status': account.get('status', ''), 'initial_capital': account.get('initial_capital', 0)}
+            self._update(account_id, keys, values, meta)
+
+        portfolio = {'capital': summary['total_capital'], 'trades': summary['total_trades'],
+                     'wins': summary['total_wins'], 'losses': summary['total_losses'],
+                     'profit': summary['total_profit'], 'loss': summary['total_loss']}
+        self._update(PORTFOLIO, keys, portfolio, {
+            'name': 'Portfolio', 'initial_capital': summary['total_initial'],
+            'active_accounts': summary['active_accounts'], 'total_accounts': summary['total_accounts']
+        })
+
+        self.last_timestamp = timestamp
+        self.latest_stats = stats
+        self.latest_summary = summary
+        return True
+
+    def _update(self, account_id: str, keys: Dict[str, str], values: Dict[str, float], meta: Dict[str, Any]):
+        # A new bucket opens at the last values seen before it (or at this snapshot)
+        opening = self.last_values.get(account_id, values)
+        capital = values['capital']
+
+        for period, key in keys.items():
+            bucket = self.rollups[period].setdefault(key, {})
+            entry = bucket.get(account_id)
+            if entry is None:
+                entry = bucket[account_id] = {f'open_{field}': opening[field] for field in COUNTERS}
+                entry.update(high_capital=max(capital, opening['capital']),
+                             low_capital=min(capital, opening['capital']),
+                             peak_capital=opening['capital'], max_drawdown=0.0, snapshots=0)
+
+            entry.update({f'close_{field}': value for field, value in values.items()})
+            entry.update(meta)
+            entry['high_capital'] = max(entry['high_capital'], capital)
+            entry['low_capital'] = min(entry['low_capital'], capital)
+            entry['peak_capital'] = max(entry['peak_capital'], capital)
+            if entry['peak_capital'] > 0:
+                entry['max_drawdown'] = max(entry['max_drawdown'],
+                                            (entry['peak_capital'] - capital) / entry['peak_capital'])
+            entry['snapshots'] += 1
+
+        self.last_values[account_id] = values
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def bucket(self, period: str, key: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """All entries of one bucket (default: the current one for ``period``)"""
+        key = key or bucket_keys(datetime.now())[period]
+        return self.rollups[period].get(key, {})
+
+    def history(self, period: str, count: int, account_id: str = PORTFOLIO,
+                until: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Period metrics for the last ``count`` buckets, oldest first (reads only those buckets)
+
+        ``until`` (e.g. ``completed_keys(now)[period]``) skips newer buckets;
+        keys of one period sort chronologically as strings.
+        """
+        rows = []
+        for key, bucket in reversed(self.rollups[period].items()):
+            if len(rows) >= count:
+                break
+            if until is not None and key > until:
+                continue
+            if account_id in bucket:
+                rows.append({'period': key, **period_metrics(bucket[account_id])})
+        rows.reverse()
+        return rows
+
+    def ranked_accounts(self, period: str, key: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Accounts in a bucket with their period metrics, best P/L % first"""
+        rows = [{'account_id': account_id, 'name': entry.get('name', account_id), **period_metrics(entry)}
+                for account_id, entry in self.bucket(period, key).items() if account_id != PORTFOLIO]
+        return sorted(rows, key=lambda row: row['pnl_percent'], reverse=True)
@@ -0,0 +1,64 @@
+"""
+Paper trade executor tests
+Bracket exits stay off the book; entries fill at their VWAP
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'pillar-a-trading' / 'bots' / 'execution'))
+
+from matching_engine import BUY, LIMIT, MatchingEngine, SlippageModel
+from paper_trade_executor import PaperTradeExecutor
+
+
+def _executor(**kwargs) -> PaperTradeExecutor:
+    return PaperTradeExecutor(balance=10000.0, engine=MatchingEngine(slippage=SlippageModel(bps=0)), **kwargs)
+
+
+def test_two_shorts_on_one_symbol_do_not_self_match():
+    executor = _executor()
+    first = executor.open_short({'symbol': 'SPY', 'price': 100.0, 'strategy': 'a'})
+    second = executor.open_short({'symbol': 'SPY', 'price': 100.0, 'strategy': 'b'})
+
+    # The first position's take-profit must not be liquidity for the second entry
+    assert second.entry_price == 100.0
+    assert first.result is None and second.result is None
+    assert executor.total_trades == 2
+    assert len(executor.engine.book('SPY').bids) == 0
+
+    # Both targets trigger off the tape
+    executor.mark('SPY', 95.0)
+    assert first.result['win'] and second.result['win']
+    assert first.result['exit_price'] == 96.0
+    assert executor.stats()['open_positions'] == 0
+
+
+def test_partial_entry_fills_bracket_once_at_vwap():
+    executor = _executor()
+    engine = executor.engine
+    engine.on_tick('QQQ', 100.0)
+    quantity = executor._position_size() / 100.0
+    engine.submit('QQQ', BUY, quantity / 2, LIMIT, price=99.5)
+    engine.submit('QQQ', BUY, quantity, LIMIT, price=98.5)
+
+    pos = executor.open_short({'symbol': 'QQQ', 'strategy': 'vwap'})
+
+    assert pos.filled_quantity == quantity
+    assert abs(pos.entry_price - 99.0) < 1e-9
+    assert executor.total_trades == 1
+    brackets = [order for order in engine.orders.values() if (order.tag or '').startswith(f'{pos.position_id}:')
+                and order.side == BUY]
+    assert len(brackets) == 2
+    assert all(order.quantity == quantity for order in brackets)
+
+    executor.mark('QQQ', 101.0)  # stop at 99 * 1.02, the bid left at 98.5 is untouched
+    assert pos.result is not None and not pos.result['win']
+    assert abs(pos.result['exit_price'] - 101.0) < 1e-9
+
+
+if __name__ == '__main__':
+    test_two_shorts_on_one_symbol_do_not_self_match()
+    test_partial_entry_fills_bracket_once_at_vwap()
+    print('✅ paper trade executor tests passed')